@@ -0,0 +1,6 @@
+"""
+crawl_core
+────────────────────────────────────────────────────────────
+ILBE / DC / FM Korea 크롤러가 함께 쓰는 공용 모듈 모음.
+각 크롤러 스크립트는 저장소 루트를 sys.path 에 넣고 여기서 import 한다.
+"""
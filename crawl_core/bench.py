@@ -0,0 +1,580 @@
+"""
+bench.py
+────────────────────────────────────────────────────────────
+네트워크 없이 도는 파싱/페이지 넘김 벤치마크 (세 사이트 공통).
+engine / 어댑터 / snapshot 을 고칠 때마다 실제 사이트를 긁어 보는 대신, 저장해 둔 목록 / 글 / 여러 장짜리 댓글 페이지를
+로컬 HTTP 서버(별도 프로세스, 사이트마다 포트 하나)로 내보내고 진짜 engine.Engine + sites/ 어댑터로 크롤한다.
+어댑터의 base 만 서버 주소로 바꿔 끼우므로 요청 순서 / 댓글 API 폼 / 페이지 상한은 크롤러 코드 그대로.
+• 픽스처: 기본은 저장소에 커밋된 bench/fixtures/<site>/ (list_*.html, post*.html, comments_<n>.html / .json)
+  → 커밋이 달라도 같은 입력, 결과 줄의 fixture 해시로 확인. 실제 사이트에서 저장한 페이지로 바꿔 끼워도 되고
+  (파일 이름만 맞추면 됨), --fixtures DIR 로 다른 묶음을, --synthetic 으로 crawling/dc_comments.json 의 댓글로 만드는
+  고정 시드 합성 페이지를 쓴다. 지금 커밋된 묶음은 합성 페이지를 --dump 로 내려 둔 것
+• 서버가 흉내 내는 것: ILBE 목록·글 + 사이트 함수 loadComment(n) (글 페이지에 끼워 넣는 대체 스크립트가
+  <글 URL>/comments?page=n 을 받아 댓글 영역을 바꿈), FM 목록·글 + 댓글 페이지 링크(?cpage=n),
+  DC 글(board/view/) + 댓글 AJAX(POST board/comment/, comment_page)
+• ILBE / FM 은 크롤러처럼 글을 Chrome 으로 열어 댓글 페이지를 넘긴다 → chromedriver(PATH 또는 CRAWL_CHROMEDRIVER)가 있어야 돌고, 없으면 그 사이트만
+  실패로 표시. DC 는 HTTP 경로라 브라우저 없이 돈다 — Chrome 이 없는 곳에서는 `python -m crawl_core.bench dc`
+• 사이트 간격(waits.MIN_INTERVAL)과 호스트 속도 제한은 기본으로 끈다 (PACED=True 면 실제 값 그대로 → 크롤 시간 예측용)
+• 결과: 글/초, 서버가 받은 요청 수 / 보낸 바이트, 단계별 p50(metrics), 최대 메모리(파이썬 프로세스, Chrome 제외).
+  사이트마다 새 프로세스에서 REPEAT 번 → 중앙값
+• bench_output.txt 에 커밋 번호와 함께 덧붙이고, --save / --compare 로 이전 결과와 비교
+python -m crawl_core.bench [ilbe dc fmkorea] [--pages N] [--repeat N] [--no-tag] [--save a.json] [--compare a.json]
+                          [--fixtures DIR | --synthetic] [--dump DIR]
+"""
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from . import metrics, pool, ratelimit, snapshot, spam
+
+try:
+    import resource          # 유닉스만. 없으면 tracemalloc 으로 최대 메모리
+except ImportError:
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_DIR = ROOT / "bench" / "fixtures"
+COMMENT_SAMPLE = ROOT / "crawling" / "dc_comments.json"
+OUTPUT = ROOT / "bench_output.txt"
+
+SITES = ("ilbe", "dc", "fmkorea")
+PAGES = 2            # 사이트별 목록 페이지 수 (DC 는 목록 대신 글 PAGES × DC_POSTS_PER_PAGE 개)
+REPEAT = 3
+SEED = 20240601
+
+# 합성 페이지 크기 (실제 페이지와 비슷한 규모)
+LIST_ROWS = {"ilbe": 50, "fmkorea": 20}
+COMMENT_PAGES = {"ilbe": 3, "fmkorea": 3, "dc": 4}
+COMMENTS_PER_PAGE = {"ilbe": 50, "fmkorea": 50, "dc": 100}
+DC_POSTS_PER_PAGE = 10
+DC_FIRST_NO = 400000
+POST_VARIANTS = 8    # 합성 글 본문 종류 (글 번호 % POST_VARIANTS)
+CHROME_LINKS = 400   # 메뉴/사이드바 링크 수 — 파싱 비용의 대부분은 이런 주변 마크업
+PACED = False        # True 면 사이트 간격 / 호스트 속도 제한을 실제 크롤과 같게
+UNPACED_LIMIT = {"rate": 1e6, "min_rate": 1e6, "max_rate": 1e6, "burst": 1e6, "target": 60.0}
+STATS_PATH = "/_bench/stats"   # 서버가 받은 요청 수 / 보낸 바이트 (읽으면 0 으로)
+
+_FALLBACK_TEXTS = ["ㅋㅋㅋㅋ", ".", "이게 맞냐", "개추", "송파 가라오케 최신 시설 룸 예약 https://example.com/"]
+
+
+# ── 픽스처 ──────────────────────────────────────────────────
+def _esc(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("\n", "<br>")
+
+
+def _chrome(rng: random.Random) -> str:
+    """사이트 공통 머리/사이드바/스크립트 (파서가 읽지 않지만 크기는 실제 페이지처럼)."""
+    links = "".join(f'<li><a href="/board/{rng.randrange(10**6)}" class="nav-link">메뉴 {i}</a></li>'
+                    for i in range(CHROME_LINKS))
+    script = "var cfg=" + json.dumps({f"k{i}": rng.randrange(10**9) for i in range(300)}) + ";"
+    return f'<div id="gnb"><ul class="menu">{links}</ul></div><script>{script}</script>'
+
+
+class Fixtures:
+    """site / 종류 / 번호 → 응답 본문. 저장된 페이지가 있으면 쓰고, 없으면 합성."""
+
+    def __init__(self, root: Optional[Path] = FIXTURE_DIR, seed: int = SEED):
+        """root 가 None 이면 저장 페이지를 보지 않고 전부 합성."""
+        self.root = root
+        self.seed = seed
+        texts = []
+        if COMMENT_SAMPLE.exists():
+            texts = [c.get("text") or "" for c in json.loads(COMMENT_SAMPLE.read_text("utf-8-sig"))]
+        self.texts = [t for t in texts if t.strip()] or _FALLBACK_TEXTS
+        self.cache: Dict[tuple, str] = {}
+
+    def source(self, site: str) -> str:
+        return "recorded" if self.root is not None and (self.root / site).is_dir() else "synthetic"
+
+    def _pick(self, site: str, pattern: str, n: int, key: tuple, make) -> Optional[str]:
+        """
+        저장된 페이지가 있는 사이트면 <root>/<site>/ 에서 pattern 에 맞는 파일 중 n 번째
+        (개수보다 크면 돌아가며, 하나도 없으면 None → 404). 없는 사이트면 make() 로 합성해 캐시.
+        """
+        if self.source(site) == "recorded":
+            files = sorted((self.root / site).glob(pattern))
+            return files[(n - 1) % len(files)].read_text(encoding="utf-8", errors="replace") if files else None
+        if key not in self.cache:
+            self.cache[key] = make()
+        return self.cache[key]
+
+    def _rng(self, *key) -> random.Random:
+        return random.Random(f"{self.seed}/" + "/".join(map(str, key)))
+
+    def _comment(self, rng: random.Random) -> Dict:
+        nick = rng.choice(["ㅇㅇ", "ㅇㅇ", "익명", "고닉", "베충이", "펨붕이"])
+        return {"nick": nick, "ip": f"{rng.randrange(1, 224)}.{rng.randrange(256)}",
+                "date": f"2024.0{rng.randrange(1, 10)}.{rng.randrange(10, 29)} "
+                        f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}",
+                "text": rng.choice(self.texts)}
+
+    # ILBE ──────────────────────────────
+    def ilbe_list(self, page: int) -> str:
+        def make():
+            rng = self._rng("ilbe", "list", page)
+            rows = ['<li class="notice-line"><span class="title"><a class="subject" href="/view/1">공지</a></span></li>']
+            for i in range(LIST_ROWS["ilbe"]):
+                art_id = 11_000_000_000 - page * 1000 - i
+                rows.append(f'<li><span class="title"><a class="subject" href="/view/{art_id}?page={page}&listStyle=list">'
+                            f'글 {art_id}</a></span><span class="comment"><a>{rng.randrange(0, 120)}</a></span>'
+                            f'<span class="global-nick">일게이</span><span class="date">{rng.randrange(24):02d}:00</span></li>')
+            return f'<html><body>{_chrome(rng)}<ul class="board-body">{"".join(rows)}</ul></body></html>'
+        return self._pick("ilbe", "list_*.html", page, ("ilbe", "list", page), make)
+
+    def ilbe_comments(self, variant: int, p: int) -> str:
+        """댓글 영역 (comment-item-box + paginate). 글 페이지와 댓글 페이지가 같이 쓴다."""
+        rng = self._rng("ilbe", "cmt", variant, p)
+        items = "".join(
+            f'<div class="comment-item"><span class="global-nick nick"><a>{c["nick"]}</a></span>'
+            f'<span class="date-line">{c["date"]}</span><span class="cmt">{_esc(c["text"])}</span>'
+            f'<em id="cnt_good_{k}">{rng.randrange(30)}</em><em id="cnt_bad_{k}">{rng.randrange(5)}</em></div>'
+            for k, c in enumerate(self._comment(rng) for _ in range(COMMENTS_PER_PAGE["ilbe"])))
+        pages = "".join(f'<a class="{"page-on" if n == p else ""}" onclick="loadComment({n})">{n}</a>'
+                        for n in range(1, COMMENT_PAGES["ilbe"] + 1))
+        return f'<div class="comment-item-box">{items}</div><div class="paginate">{pages}</div>'
+
+    def ilbe_post(self, art_id: int) -> str:
+        v = art_id % POST_VARIANTS
+
+        def make():
+            rng = self._rng("ilbe", "post", v)
+            body = "".join(f"<p>{_esc(rng.choice(self.texts))}</p>" for _ in range(12))
+            return (f'<html><head><meta property="og:title" content="글 제목 {v}"><title>일베</title></head><body>'
+                    f'{_chrome(rng)}<span class="nick">일게이(1.{v})</span><span class="date">2024-05-0{v + 1} 12:00</span>'
+                    f'<div class="post-content">{body}<img src="https://img.example/{v}.jpg"></div>'
+                    f'<span class="recomm-vote"><em>{rng.randrange(200)}</em></span>'
+                    f'<span class="recomm-vote bad"><em>{rng.randrange(20)}</em></span>'
+                    f'{self.ilbe_comments(v, 1)}</body></html>')
+        return self._pick("ilbe", "post*.html", v + 1, ("ilbe", "post", v), make)
+
+    def ilbe_comment_page(self, art_id: int, p: int) -> str:
+        """loadComment(p) 의 응답 (댓글 영역 조각)."""
+        v = art_id % POST_VARIANTS
+        return self._pick("ilbe", f"comments_{p}.html", 1, ("ilbe", "cmt", v, p),
+                          lambda: self.ilbe_comments(v, p))
+
+    # FM Korea ──────────────────────────
+    def fmkorea_list(self, page: int) -> str:
+        def make():
+            rng = self._rng("fmkorea", "list", page)
+            rows = "".join(
+                f'<li class="li_best2_pop0"><a class="pc_voted_count" href="/best/{7_000_000_000 - page * 100 - i}">'
+                f'<span class="count">{rng.randrange(50, 900)}</span></a><h3 class="title"><a href="/best/'
+                f'{7_000_000_000 - page * 100 - i}">글 <span class="comment_count">[{rng.randrange(5, 400)}]</span></a></h3></li>'
+                for i in range(LIST_ROWS["fmkorea"]))
+            return f'<html><body>{_chrome(rng)}<ul>{rows}</ul></body></html>'
+        return self._pick("fmkorea", "list_*.html", page, ("fmkorea", "list", page), make)
+
+    def _fmkorea_comments(self, v: int, p: int) -> str:
+        rng = self._rng("fmkorea", "cmt", v, p)
+        items = "".join(
+            f'<li class="fdb_itm"><div class="meta"><a class="member_plate">{c["nick"]}</a>'
+            f'<span class="date">{c["date"]}</span></div><div class="comment-content">'
+            f'<div class="xe_content">{_esc(c["text"])}</div></div></li>'
+            for c in (self._comment(rng) for _ in range(COMMENTS_PER_PAGE["fmkorea"])))
+        pages = "".join(f'<strong class="this">{n}</strong>' if n == p else f'<a href="?cpage={n}">{n}</a>'
+                        for n in range(1, COMMENT_PAGES["fmkorea"] + 1))
+        return f'<ul class="fdb_lst_ul">{items}</ul><div class="bd_pg">{pages}</div>'
+
+    def fmkorea_post(self, no: int, p: int = 1) -> str:
+        v = no % POST_VARIANTS
+
+        def make():
+            rng = self._rng("fmkorea", "post", v)
+            body = "<br>".join(_esc(rng.choice(self.texts)) for _ in range(12))
+            return (f'<html><body>{_chrome(rng)}<div class="rd_hd"><h1 class="np_18px"><span>글 제목 {v}</span></h1>'
+                    f'<a class="member_plate">펨붕이</a><span class="date">2024.05.0{v + 1} 12:00</span></div>'
+                    f'<article><div class="xe_content">{body}</div></article>'
+                    f'<span class="btn_img new_voted_count">{rng.randrange(300)}</span><a class="vote3">{rng.randrange(9)}</a>'
+                    f'{self._fmkorea_comments(v, p)}</body></html>')
+        if p == 1:
+            return self._pick("fmkorea", "post*.html", v + 1, ("fmkorea", "post", v, 1), make)
+        return self._pick("fmkorea", f"comments_{p}.html", 1, ("fmkorea", "post", v, p), make)
+
+    # DC ────────────────────────────────
+    def dc_post(self, no: int) -> str:
+        v = no % POST_VARIANTS
+
+        def make():
+            rng = self._rng("dc", "post", v)
+            total = COMMENT_PAGES["dc"] * COMMENTS_PER_PAGE["dc"] - rng.randrange(50)
+            body = "<br>".join(_esc(rng.choice(self.texts)) for _ in range(12))
+            return (f'<html><body>{_chrome(rng)}<input type="hidden" id="gallery_id" value="dcbest">'
+                    f'<input type="hidden" id="e_s_n_o" value="3eabc219ebdd65f5"><div class="gallview_head">'
+                    f'<span class="title_subject">글 제목 {v}</span><span class="nickname">ㅇㅇ(1.{v})</span>'
+                    f'<span class="gall_date">2024.05.0{v + 1} 12:00:00</span>'
+                    f'<span class="gall_comment"><a>댓글 {total}</a></span></div>'
+                    f'<div class="write_div">{body}</div><p id="recommend_point">{rng.randrange(900)}</p>'
+                    f'<p id="non_recommend_point">{rng.randrange(50)}</p></body></html>')
+        return self._pick("dc", "post*.html", v + 1, ("dc", "post", v), make)
+
+    def dc_comments(self, no: int, page: int) -> str:
+        """댓글 AJAX 응답 (JSON). 댓글돌이 / 삭제 / 디시콘만 있는 줄도 섞는다."""
+        v = no % POST_VARIANTS
+
+        def make():
+            total = snapshot.dc_comment_count(self.dc_post(no))
+            start = (page - 1) * COMMENTS_PER_PAGE["dc"]
+            rng = self._rng("dc", "cmt", v, page)
+            rows = []
+            for k in range(start, min(total, start + COMMENTS_PER_PAGE["dc"])):
+                c = self._comment(rng)
+                row = {"no": k + 1, "name": c["nick"], "ip": c["ip"], "reg_date": c["date"],
+                       "memo": _esc(c["text"]), "nicktype": "", "del_yn": "N"}
+                if k % 97 == 0:
+                    row["nicktype"] = "COMMENT_BOY"
+                elif k % 41 == 0:
+                    row["del_yn"] = "Y"
+                elif k % 23 == 0:
+                    row["memo"] = '<img class="written_dccon" src="https://dcimg.example/con.png">'
+                rows.append(row)
+            return json.dumps({"total_cnt": total, "comments": rows}, ensure_ascii=False)
+        return (self._pick("dc", f"comments_{page}.json", 1, ("dc", "cmt", v, page), make)
+                or json.dumps({"total_cnt": 0, "comments": []}))
+
+    def digest(self, site: str, pages: int) -> str:
+        """이번 실행에 쓰는 픽스처 전체의 해시 (앞 12자). 같으면 결과를 비교할 수 있다."""
+        h = hashlib.sha1()
+        for body in _site_bodies(self, site, pages):
+            h.update(body.encode("utf-8"))
+        return h.hexdigest()[:12]
+
+
+def _site_bodies(fx: Fixtures, site: str, pages: int):
+    if site == "dc":
+        for v in range(POST_VARIANTS):
+            yield fx.dc_post(v)
+            for p in range(1, COMMENT_PAGES["dc"] + 1):
+                yield fx.dc_comments(v, p)
+        return
+    for page in range(1, pages + 1):
+        yield getattr(fx, f"{site}_list")(page)
+    for v in range(POST_VARIANTS):
+        yield getattr(fx, f"{site}_post")(v)
+        for p in range(1 if site == "ilbe" else 2, COMMENT_PAGES[site] + 1):
+            yield fx.ilbe_comment_page(v, p) if site == "ilbe" else fx.fmkorea_post(v, p)
+
+
+# ── 로컬 HTTP 서버 (실제 사이트 대신) ───────────────────────────
+# ILBE 의 loadComment(n) 대신: 같은 글의 댓글 조각을 받아 댓글 목록 / 페이지 표시를 갈아 끼움 (저장한 글 페이지에도 덧붙임)
+_ILBE_LOADER = """<script>
+function loadComment(n) {
+  fetch(location.pathname + '/comments?page=' + n).then(function (r) { return r.text(); }).then(function (html) {
+    var box = document.createElement('div');
+    box.innerHTML = html;
+    ['div.comment-item-box', 'div.paginate'].forEach(function (sel) {
+      var old = document.querySelector(sel), neu = box.querySelector(sel);
+      if (old && neu) old.replaceWith(neu);
+    });
+  });
+}
+</script>"""
+
+
+class _Server(ThreadingHTTPServer):
+    """사이트 하나를 맡는 서버. 받은 요청 수 / 보낸 바이트를 센다."""
+    daemon_threads = True
+
+    def __init__(self, site: str, handler):
+        super().__init__(("127.0.0.1", 0), handler)
+        self.site = site
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "bytes": 0}
+
+    def count(self, n_bytes: int) -> None:
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += n_bytes
+
+    def take(self) -> Dict[str, int]:
+        with self.lock:
+            out, self.stats = self.stats, {"requests": 0, "bytes": 0}
+        return out
+
+
+class _Handler(BaseHTTPRequestHandler):
+    fixtures: Fixtures = None
+    latency = 0.0
+    protocol_version = "HTTP/1.1"   # requests / Chrome 이 연결을 재사용하도록
+
+    def _send(self, data: bytes, ctype: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", f"{ctype}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _reply(self, body: Optional[str], ctype: str = "text/html") -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        if body is None:
+            self.server.count(0)
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.server.count(len(data))
+        self._send(data, ctype)
+
+    def do_GET(self):
+        fx, site, url = self.fixtures, self.server.site, urlsplit(self.path)
+        if url.path == STATS_PATH:
+            self._send(json.dumps(self.server.take()).encode("utf-8"), "application/json")
+            return
+        q = {k: v[0] for k, v in parse_qs(url.query).items()}
+        m = re.fullmatch(r"/(view|best)/(\d+)(/comments)?", url.path)
+        body = None
+        if site == "ilbe" and url.path == "/list/ilbe":
+            body = fx.ilbe_list(int(q.get("page", 1)))
+        elif site == "ilbe" and m and m.group(1) == "view":
+            art_id = int(m.group(2))
+            if m.group(3):
+                body = fx.ilbe_comment_page(art_id, int(q.get("page", 1)))
+            else:
+                body = fx.ilbe_post(art_id)
+                body = body and body + _ILBE_LOADER
+        elif site == "fmkorea" and url.path == "/index.php":
+            body = fx.fmkorea_list(int(q.get("page", 1)))
+        elif site == "fmkorea" and m and m.group(1) == "best" and not m.group(3):
+            body = fx.fmkorea_post(int(m.group(2)), int(q.get("cpage", 1)))
+        elif site == "dc" and url.path == "/board/view/":
+            body = fx.dc_post(int(q.get("no", 0)))
+        self._reply(body)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+        if self.server.site != "dc" or urlsplit(self.path).path != "/board/comment/":
+            self._reply(None)
+            return
+        no, page = int(form["no"][0]), int(form["comment_page"][0])
+        self._reply(self.fixtures.dc_comments(no, page), "application/json")
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(ready, root: str, seed: int, latency: float) -> None:
+    """서버 프로세스 본체. 사이트마다 포트 하나 (어댑터 base 가 호스트 루트라야 목록의 /view/…, /best/… 링크가 맞음)."""
+    _Handler.fixtures = Fixtures(Path(root) if root else None, seed)
+    _Handler.latency = latency
+    ports = {}
+    for site in SITES:
+        server = _Server(site, _Handler)
+        threading.Thread(target=server.serve_forever, name=f"bench-{site}", daemon=True).start()
+        ports[site] = server.server_address[1]
+    ready.put(ports)
+    threading.Event().wait()
+
+
+def _served(base: str) -> Dict[str, int]:
+    """서버가 지난번 이후로 받은 요청 수 / 보낸 바이트 (읽으면 0 으로)."""
+    return requests.get(base + STATS_PATH, timeout=10).json()
+
+
+# ── 한 사이트 실행 (진짜 Engine + 어댑터) ─────────────────────────
+def _engine(site: str, base: str, tag: bool):
+    """base 를 가리키는 어댑터로 Engine. selenium 이 필요해서 여기서 import (--dump 는 없어도 돌게)."""
+    from . import engine, waits
+    from .sites.dc import DcAdapter
+    from .sites.fmkorea import FmKoreaAdapter
+    from .sites.ilbe import IlbeAdapter
+
+    ratelimit.use_host(site, urlsplit(base).netloc, None if PACED else UNPACED_LIMIT)
+    if not PACED:
+        waits.MIN_INTERVAL[site] = {kind: 0.0 for kind in waits.MIN_INTERVAL.get(site, {})}
+    engine.TAG_INLINE = tag
+    adapters = {"ilbe": IlbeAdapter, "dc": DcAdapter, "fmkorea": FmKoreaAdapter}
+    return engine.Engine(adapters[site](base=base))
+
+
+def _span(site: str, pages: int):
+    """Engine.crawl(start, end) 인자: 목록 페이지 pages → 1, DC 는 글 번호 PAGES × DC_POSTS_PER_PAGE 개."""
+    if site == "dc":
+        return DC_FIRST_NO, DC_FIRST_NO - pages * DC_POSTS_PER_PAGE + 1
+    return pages, 1
+
+
+def _peak_mb() -> float:
+    if resource is not None:
+        kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return kb / (2**20 if sys.platform == "darwin" else 2**10)   # macOS 는 바이트
+    return tracemalloc.get_traced_memory()[1] / 2**20
+
+
+def run_site(site: str, base: str, pages: int, tag: bool) -> Dict:
+    """
+    한 사이트를 한 번 돌린 결과. run() 이 사이트·반복마다 새 프로세스에서 부른다 (최대 메모리가 섞이지 않게).
+    체크포인트 / 결과 / 이벤트 로그 / metrics 파일은 임시 폴더에 쓰고 버린다. 크롤러 출력은 실패할 때만 보여 준다.
+    """
+    if resource is None:
+        tracemalloc.start()
+    spam.INDEX_PATH = None           # 저장된 색인을 읽거나 쓰지 않음 → 매번 같은 입력
+    log = io.StringIO()
+    with tempfile.TemporaryDirectory(prefix=f"bench-{site}-") as tmp, contextlib.redirect_stdout(log):
+        os.chdir(tmp)
+        try:
+            eng = _engine(site, base, tag)
+            try:
+                if eng.adapter.needs_browser:
+                    eng.sup.driver   # 브라우저는 재기 전에 띄움 (chromedriver 가 없으면 여기서 실패)
+                _served(base)
+                t0 = time.perf_counter()
+                eng.crawl(*_span(site, pages))
+                elapsed = time.perf_counter() - t0
+            finally:
+                eng.sup.quit()
+            served = _served(base)
+            posts = [record for _, record in pool.iter_results(eng.adapter.out_dir)]
+        except BaseException:
+            sys.__stdout__.write(log.getvalue()[-4000:])
+            raise
+        finally:
+            os.chdir(ROOT)
+    n_comments = sum(len(record["post"]["comments"]) for record in posts)
+    stages = metrics.snapshot().get(site, {}).get("stages", {})
+    return {
+        "posts": len(posts),
+        "comments": n_comments,
+        "seconds": round(elapsed, 3),
+        "posts_per_sec": round(len(posts) / elapsed, 2) if elapsed else 0.0,
+        "round_trips": served["requests"],
+        "kbytes": round(served["bytes"] / 1024, 1),
+        "peak_mb": round(_peak_mb(), 1),
+        "p50_ms": {name: round(st["p50_s"] * 1000, 2) for name, st in stages.items()},
+    }
+
+
+def _median_run(runs: List[Dict]) -> Dict:
+    """글/초 중앙값인 실행을 대표로, 최대 메모리는 가장 큰 값."""
+    best = sorted(runs, key=lambda r: r["posts_per_sec"])[len(runs) // 2]
+    return {**best, "peak_mb": max(r["peak_mb"] for r in runs),
+            "posts_per_sec_all": [r["posts_per_sec"] for r in runs]}
+
+
+# ── 실행 / 보고 ──────────────────────────────────────────────
+def _commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return "-"
+
+
+def run(sites=SITES, pages: int = PAGES, repeat: int = REPEAT, tag: bool = True,
+        fixture_dir: Optional[Path] = FIXTURE_DIR, latency: float = 0.0) -> Dict:
+    """fixture_dir 가 None 이면 합성 픽스처."""
+    ctx = get_context("spawn")
+    ready = ctx.Queue()
+    server = ctx.Process(target=_serve, args=(ready, str(fixture_dir or ""), SEED, latency), daemon=True)
+    server.start()
+    ports = ready.get(timeout=30)
+    fx = Fixtures(fixture_dir)
+    report = {"commit": _commit(), "python": sys.version.split()[0], "pages": pages, "repeat": repeat,
+              "tag": tag, "latency": latency, "paced": PACED, "sites": {}}
+    try:
+        for site in sites:
+            base = f"http://127.0.0.1:{ports[site]}"
+            runs = []
+            try:
+                for _ in range(repeat):
+                    with ProcessPoolExecutor(1, mp_context=ctx) as ex:
+                        runs.append(ex.submit(run_site, site, base, pages, tag).result())
+            except Exception as e:   # Chrome 이 없는 환경의 ILBE / FM 등 — 다른 사이트는 계속
+                report["sites"][site] = {"error": f"{type(e).__name__}: {e}"[:300]}
+                continue
+            report["sites"][site] = {**_median_run(runs), "fixtures": fx.source(site),
+                                     "fixture_digest": fx.digest(site, pages)}
+    finally:
+        server.terminate()
+    return report
+
+
+def format_report(report: Dict, baseline: Optional[Dict] = None) -> str:
+    lines = [f"=== bench {time.strftime('%Y-%m-%d %H:%M')} commit {report['commit']} "
+             f"(python {report['python']}, 목록 {report['pages']}장, {report['repeat']}회 중앙값, "
+             f"태깅 {'O' if report['tag'] else 'X'}, 간격 제한 {'O' if report.get('paced') else 'X'}) ==="]
+    for site, r in report["sites"].items():
+        if "error" in r:
+            hint = "  (Chrome 이 없으면 dc 만 지정)" if site != "dc" else ""
+            lines.append(f"[{site}] 실행 실패 — {r['error']}{hint}")
+            continue
+        lines.append(f"[{site}] 글 {r['posts']}개 / 댓글 {r['comments']}개, {r['seconds']:.2f}s → "
+                     f"{r['posts_per_sec']:.2f} 글/초, 요청 {r['round_trips']}회 ({r['kbytes']:.0f}KB), "
+                     f"최대 메모리 {r['peak_mb']:.1f}MB  [{r['fixtures']} {r['fixture_digest']}]")
+        lines.append("    p50 " + ", ".join(f"{k} {v:.1f}ms" for k, v in sorted(r["p50_ms"].items())))
+        old = (baseline or {}).get("sites", {}).get(site)
+        if old and "error" not in old:
+            same = old.get("fixture_digest") == r["fixture_digest"]
+            lines.append(f"    vs {baseline.get('commit', '?')}: 글/초 {_delta(old['posts_per_sec'], r['posts_per_sec'])}, "
+                         f"요청 {r['round_trips'] - old['round_trips']:+d}, "
+                         f"메모리 {_delta(old['peak_mb'], r['peak_mb'])}" + ("" if same else "  (픽스처 다름)"))
+    return "\n".join(lines)
+
+
+def _delta(old: float, new: float) -> str:
+    return f"{(new - old) / old:+.1%}" if old else "n/a"
+
+
+def dump(fixture_dir: Path, pages: int = PAGES) -> None:
+    """
+    합성 픽스처를 bench/fixtures 와 같은 모양으로 파일로 남긴다. 커밋된 bench/fixtures 가 이것 —
+    합성 규칙을 바꿨으면 다시 내려서 커밋 (fixture 해시가 바뀌므로 그 전 결과와는 비교하지 않음).
+    """
+    fx = Fixtures(None)
+    for site in SITES:
+        d = fixture_dir / site
+        d.mkdir(parents=True, exist_ok=True)
+        if site == "dc":
+            (d / "post.html").write_text(fx.dc_post(0), "utf-8")
+            for p in range(1, COMMENT_PAGES["dc"] + 1):
+                (d / f"comments_{p}.json").write_text(fx.dc_comments(0, p), "utf-8")
+            continue
+        for page in range(1, pages + 1):
+            (d / f"list_{page}.html").write_text(getattr(fx, f"{site}_list")(page), "utf-8")
+        (d / "post.html").write_text(getattr(fx, f"{site}_post")(0), "utf-8")
+        for p in range(1 if site == "ilbe" else 2, COMMENT_PAGES[site] + 1):   # ILBE 는 loadComment(1) 도
+            page_html = fx.ilbe_comment_page(0, p) if site == "ilbe" else fx.fmkorea_post(0, p)
+            (d / f"comments_{p}.html").write_text(page_html, "utf-8")
+    print(f"픽스처 → {fixture_dir}")
+
+
+def main(argv: List[str]) -> None:
+    sites = [a for a in argv if a in SITES] or list(SITES)
+
+    def opt(name: str, default=None):
+        return argv[argv.index(name) + 1] if name in argv else default
+
+    if "--dump" in argv:
+        dump(Path(opt("--dump")), int(opt("--pages", PAGES)))
+        return
+    fixture_dir = None if "--synthetic" in argv else Path(opt("--fixtures", FIXTURE_DIR))
+    report = run(sites, pages=int(opt("--pages", PAGES)), repeat=int(opt("--repeat", REPEAT)),
+                 tag="--no-tag" not in argv, fixture_dir=fixture_dir, latency=float(opt("--latency", 0.0)))
+    baseline = json.loads(Path(opt("--compare")).read_text("utf-8")) if opt("--compare") else None
+    text = format_report(report, baseline)
+    print(text)
+    with open(OUTPUT, "a", encoding="utf-8") as f:
+        f.write(text + "\n\n")
+    if opt("--save"):
+        Path(opt("--save")).write_text(json.dumps(report, ensure_ascii=False, indent=2), "utf-8")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
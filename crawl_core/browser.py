@@ -0,0 +1,132 @@
+"""
+browser.py
+────────────────────────────────────────────────────────────
+크롤러 공용 Chrome 프로필. 예전에는 크롤러마다 옵션이 제각각이라 (fm_korea 는 창 최대화 + GPU, ILBE 는 headless 주석 처리)
+글 페이지마다 쓰지도 않는 이미지 / 광고 / 웹폰트를 내려받아 그렸다.
+• PROFILE="fast"(기본): headless, 작은 창, page_load_strategy=eager (DOM 만 준비되면 driver.get 이 돌아옴)
+  + 이미지 / 동영상·오디오 / 웹폰트 / 광고·통계 도메인을 CDP Network.setBlockedURLs 로 차단
+  (<img src> 속성은 DOM 에 그대로 남으므로 content_images 는 영향 없음. 사이트 자체 JS 는 막지 않음 — 댓글 페이지 넘김에 필요)
+• PROFILE="visible": 예전처럼 창을 띄우고 아무것도 막지 않음 (셀렉터 디버깅용). 환경변수 CRAWL_BROWSER 로도 고름
+• start(): driver.get 을 감싸 페이지마다 로드 시간 / 받은 바이트를 metrics 에 기록 (page_load 단계, page_bytes 카운터)
+드라이버는 engine.Engine.new_driver 한 곳에서만 만든다 (chrome_options → start → bulk_dom.instrument).
+"""
+import os
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from selenium import webdriver
+
+from . import metrics
+
+PROFILE = os.environ.get("CRAWL_BROWSER", "fast")
+
+PROFILES: Dict[str, Dict] = {
+    "fast"   : {"headless": True,  "block": True,  "window": "1024,768",  "strategy": "eager"},
+    "visible": {"headless": False, "block": False, "window": "1920,1080", "strategy": "normal"},
+}
+
+# 사이트별로 더 붙는 인자 (ILBE 는 인증서 체인 문제로 예전부터 검사를 끔)
+SITE_ARGS: Dict[str, List[str]] = {
+    "ilbe": ["--ignore-certificate-errors", "--allow-insecure-localhost"],
+}
+
+BLOCKED_TYPES = [
+    # 이미지
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.bmp", "*.svg", "*.ico",
+    # 동영상 / 오디오
+    "*.mp4", "*.webm", "*.m3u8", "*.ts", "*.mp3", "*.ogg",
+    # 웹폰트
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+BLOCKED_DOMAINS = [
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*googletagservices.com*",
+    "*criteo.com*", "*criteo.net*", "*taboola.com*", "*outbrain.com*", "*dable.io*", "*mobon.net*",
+    "*adfit.kakao.com*", "*ad.daum.net*", "*wcs.naver.net*", "*facebook.net*", "*scorecardresearch.com*",
+    "*amazon-adsystem.com*", "*adnxs.com*", "*pubmatic.com*", "*rubiconproject.com*",
+]
+
+_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+}
+
+# 페이지 로드 시간(navigation 항목)과 이번 문서가 받은 바이트(문서 + 리소스 transferSize 합)
+_LOAD_JS = """
+var nav = performance.getEntriesByType('navigation')[0], bytes = 0;
+performance.getEntriesByType('resource').forEach(function (e) { bytes += e.transferSize || 0; });
+return nav ? {ms: nav.domContentLoadedEventEnd - nav.startTime, bytes: bytes + (nav.transferSize || 0)} : null;
+"""
+
+
+def chrome_options(site: str, profile: Optional[str] = None) -> webdriver.ChromeOptions:
+    p = PROFILES[profile or PROFILE]
+    opts = webdriver.ChromeOptions()
+    if p["headless"]:
+        opts.add_argument("--headless=new")
+    opts.add_argument(f"--window-size={p['window']}")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--no-sandbox")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-notifications")
+    opts.add_argument("--mute-audio")
+    if p["block"]:
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_argument("--disable-background-networking")
+        opts.add_experimental_option("prefs", _PREFS)
+    for arg in SITE_ARGS.get(site, []):
+        opts.add_argument(arg)
+    opts.page_load_strategy = p["strategy"]
+    return opts
+
+
+def start(drv, site: str, profile: Optional[str] = None):
+    """새 driver 에 차단 목록을 걸고 driver.get 계측을 붙인다. 같은 driver 에 두 번 걸어도 한 번만."""
+    if getattr(drv, "_browser_site", None) is not None:
+        return drv
+    if PROFILES[profile or PROFILE]["block"]:
+        drv.execute_cdp_cmd("Network.enable", {})
+        drv.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_TYPES + BLOCKED_DOMAINS})
+    drv._browser_site = site
+    orig = drv.get
+
+    def get(url: str):
+        orig(url)
+        _record(drv, site)
+
+    drv.get = get
+    return drv
+
+
+# ── 페이지 로드 기록 ─────────────────────────────────────────
+_lock = threading.Lock()
+_loads: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0])   # site → [페이지 수, 로드 시간 합(초)]
+_bytes: Dict[str, int] = defaultdict(int)
+
+
+def _record(drv, site: str) -> None:
+    try:
+        stat = drv.execute_script(_LOAD_JS)
+    except Exception:
+        return   # 에러 페이지 등 — 로드 자체는 ratelimit.navigate 가 판단
+    if not stat:
+        return
+    secs = max(0.0, stat["ms"]) / 1000
+    metrics.observe(site, "page_load", secs)
+    metrics.count(site, "page_bytes", int(stat["bytes"]))
+    with _lock:
+        _loads[site][0] += 1
+        _loads[site][1] += secs
+        _bytes[site] += int(stat["bytes"])
+
+
+def summary(site: str) -> str:
+    with _lock:
+        (n, secs), total = _loads.get(site, (0, 0.0)), _bytes[site]
+    if not n:
+        return f"[{site}] 브라우저({PROFILE}) 페이지 로드 기록 없음"
+    return (f"[{site}] 브라우저({PROFILE}) 페이지 {n}개, 로드 평균 {secs / n:.2f}s, "
+            f"페이지당 {total / n / 1024:.0f}KB (합계 {total / 2**20:.1f}MB)")
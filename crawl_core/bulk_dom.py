@@ -0,0 +1,69 @@
+"""
+bulk_dom.py
+────────────────────────────────────────────────────────────
+댓글 목록을 execute_script 한 번으로 통째로 읽어오는 도우미 + WebDriver 왕복 계측.
+• extract_rows(): 항목 셀렉터 + 필드별 셀렉터 → [{필드: 텍스트|None}, …]
+• instrument(): driver.execute 를 감싸 명령(=HTTP 왕복) 수를 센다
+• record_page()/summary(): 댓글 페이지당 왕복 수 기록·요약
+"""
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# 필드 값은 innerText 기준 (Selenium 의 WebElement.text 와 같은 "보이는 텍스트")
+_ROWS_JS = """
+var items = document.querySelectorAll(arguments[0]), fields = arguments[1], out = [];
+for (var i = 0; i < items.length; i++) {
+    var row = {};
+    for (var k in fields) {
+        var el = items[i].querySelector(fields[k]);
+        row[k] = el ? (el.innerText || el.textContent || "").trim() : null;
+    }
+    out.push(row);
+}
+return out;
+"""
+
+_lock = threading.Lock()
+_pages: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])   # site → [댓글 페이지 수, 왕복 합, 최대]
+
+
+def extract_rows(drv, item_selector: str, fields: Dict[str, str]) -> List[Dict[str, Optional[str]]]:
+    """item_selector 에 걸리는 모든 요소에서 fields 의 하위 셀렉터 텍스트를 한 번에 읽는다 (왕복 1회)."""
+    return drv.execute_script(_ROWS_JS, item_selector, fields) or []
+
+
+def instrument(drv):
+    """driver.execute 를 감싸 WebDriver 명령 수를 drv._rt_total 에 누적. 같은 driver 에 두 번 걸어도 한 번만."""
+    if getattr(drv, "_rt_total", None) is not None:
+        return drv
+    drv._rt_total = 0
+    orig = drv.execute
+
+    def execute(*args: Any, **kwargs: Any):
+        drv._rt_total += 1
+        return orig(*args, **kwargs)
+
+    drv.execute = execute
+    return drv
+
+
+def mark(drv) -> int:
+    """지금까지의 왕복 수 (instrument 안 된 driver 면 0)."""
+    return getattr(drv, "_rt_total", 0) or 0
+
+
+def record_page(site: str, round_trips: int) -> None:
+    with _lock:
+        p = _pages[site]
+        p[0] += 1
+        p[1] += round_trips
+        p[2] = max(p[2], round_trips)
+
+
+def summary(site: str) -> str:
+    with _lock:
+        n, total, most = _pages.get(site, (0, 0, 0))
+    if not n:
+        return f"[{site}] 댓글 페이지 왕복 기록 없음"
+    return f"[{site}] 댓글 페이지 {n}개, 왕복 평균 {total / n:.1f}회 (최대 {most}회)"
@@ -0,0 +1,158 @@
+"""
+checkpoint.py
+────────────────────────────────────────────────────────────
+크롤링 진행 상황을 SQLite 에 남겨 두고, 다시 실행하면 끊긴 곳부터 이어가는 체크포인트 저장소.
+(dc_archive.txt 에 손으로 적던 "어디까지 했는지" 를 대신함)
+• pages : (site, page) → pending / done / failed   — done 이면 목록을 다시 읽지 않음
+• posts : (site, post_id) → pending / done / skipped / failed + 목록 메타(JSON)
+• 시작할 때 결과 폴더를 한 번만 훑어 이미 저장된 글(<id>.json / 샤드)을 done 으로 등록
+  → 글마다 os.path.exists / os.listdir 를 하지 않음
+
+사용:  python -m crawl_core.checkpoint <site>      # 상태별 개수 출력
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .pool import result_ids
+
+DB_PATH = "crawl_state.sqlite3"
+
+PENDING, DONE, SKIPPED, FAILED = "pending", "done", "skipped", "failed"
+FINISHED = (DONE, SKIPPED)   # 다시 실행할 때 건너뛰는 상태
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    site TEXT NOT NULL, page INTEGER NOT NULL, status TEXT NOT NULL, updated REAL,
+    PRIMARY KEY (site, page)
+);
+CREATE TABLE IF NOT EXISTS posts (
+    site TEXT NOT NULL, post_id TEXT NOT NULL, page INTEGER, status TEXT NOT NULL,
+    note TEXT, meta TEXT, updated REAL,
+    PRIMARY KEY (site, post_id)
+);
+CREATE INDEX IF NOT EXISTS posts_page ON posts (site, page, status);
+"""
+
+
+class Checkpoint:
+    """사이트 하나의 진행 상태. 워커 스레드 여럿이 같이 써도 되게 연결 하나를 잠금으로 공유."""
+
+    def __init__(self, site: str, out_dir: Optional[str] = None, path: str = DB_PATH):
+        self.site = site
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+        # 끝난 글 번호는 메모리에도 들고 있어 글마다 DB 를 조회하지 않는다
+        self.finished_ids = {row[0] for row in self.db.execute(
+            "SELECT post_id FROM posts WHERE site=? AND status IN (?, ?)", (site, *FINISHED))}
+        if out_dir:
+            self.sync_results(out_dir)
+
+    # ── 결과 폴더와 맞추기 ─────────────────────────────
+    def sync_results(self, out_dir: str) -> int:
+        """out_dir 에 이미 있는 글(<id>.json / 샤드 인덱스)을 done 으로 등록 (폴더는 이때 한 번만 읽는다)."""
+        saved = result_ids(out_dir)
+        new = saved - self.finished_ids
+        if new:
+            now = time.time()
+            with self.lock:
+                self.db.execute("BEGIN")
+                self.db.executemany(
+                    "INSERT INTO posts (site, post_id, status, updated) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (site, post_id) DO UPDATE SET status=excluded.status, updated=excluded.updated",
+                    [(self.site, pid, DONE, now) for pid in new])
+                self.db.execute("COMMIT")
+                self.finished_ids |= new
+        return len(new)
+
+    # ── 글 ─────────────────────────────────────────
+    def is_finished(self, post_id: Any) -> bool:
+        return str(post_id) in self.finished_ids
+
+    def mark_post(self, post_id: Any, status: str, note: str = "") -> None:
+        pid = str(post_id)
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO posts (site, post_id, status, note, updated) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (site, post_id) DO UPDATE SET status=excluded.status, "
+                "note=excluded.note, updated=excluded.updated",
+                (self.site, pid, status, note, time.time()))
+            if status in FINISHED:
+                self.finished_ids.add(pid)
+            else:
+                self.finished_ids.discard(pid)
+
+    def add_posts(self, page: int, metas: Iterable[Dict], id_key: str,
+                  status: str = PENDING, note: str = "") -> None:
+        """목록에서 읽은 글을 메타와 함께 등록. 이미 끝난 글의 상태는 건드리지 않는다."""
+        now = time.time()
+        rows = [(self.site, str(m[id_key]), page, status, note,
+                 json.dumps(m, ensure_ascii=False), now) for m in metas]
+        with self.lock:
+            self.db.execute("BEGIN")
+            self.db.executemany(
+                "INSERT INTO posts (site, post_id, page, status, note, meta, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (site, post_id) DO UPDATE SET page=excluded.page, meta=excluded.meta, "
+                "status=CASE WHEN posts.status IN ('done', 'skipped') THEN posts.status ELSE excluded.status END",
+                rows)
+            self.db.execute("COMMIT")
+            if status in FINISHED:
+                self.finished_ids |= {r[1] for r in rows}
+
+    def unfinished_posts(self, page: int) -> List[Dict]:
+        """
+        page 에서 등록됐지만 아직 done/skipped 가 아닌 글의 메타 (목록을 다시 안 읽고 이어가기용).
+        처음 등록된 순서(= 목록 순서)대로 — ORDER BY 가 없으면 (site, page, status) 색인 순서라 상태별로 섞인다.
+        """
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT meta FROM posts WHERE site=? AND page=? AND status NOT IN (?, ?) AND meta IS NOT NULL "
+                "ORDER BY rowid",
+                (self.site, page, *FINISHED)).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    # ── 목록 페이지 ─────────────────────────────────────
+    def page_status(self, page: int) -> Optional[str]:
+        with self.lock:
+            row = self.db.execute("SELECT status FROM pages WHERE site=? AND page=?",
+                                  (self.site, page)).fetchone()
+        return row[0] if row else None
+
+    def mark_page(self, page: int, status: str) -> None:
+        with self.lock:
+            self.db.execute(
+                "INSERT INTO pages (site, page, status, updated) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (site, page) DO UPDATE SET status=excluded.status, updated=excluded.updated",
+                (self.site, page, status, time.time()))
+
+    # ── 요약 ───────────────────────────────────────────
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        with self.lock:
+            posts = dict(self.db.execute(
+                "SELECT status, COUNT(*) FROM posts WHERE site=? GROUP BY status", (self.site,)))
+            pages = dict(self.db.execute(
+                "SELECT status, COUNT(*) FROM pages WHERE site=? GROUP BY status", (self.site,)))
+        return {"posts": posts, "pages": pages}
+
+    def summary(self) -> str:
+        c = self.counts()
+        fmt = lambda d: ", ".join(f"{k} {v}" for k, v in sorted(d.items())) or "없음"
+        return f"[{self.site}] 체크포인트 — 글: {fmt(c['posts'])} / 목록 페이지: {fmt(c['pages'])}"
+
+    def close(self) -> None:
+        with self.lock:
+            self.db.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python -m crawl_core.checkpoint <site> [db 경로]")
+        sys.exit(1)
+    print(Checkpoint(sys.argv[1], path=sys.argv[2] if len(sys.argv) > 2 else DB_PATH).summary())
@@ -0,0 +1,360 @@
+"""
+corpus.py
+────────────────────────────────────────────────────────────
+크롤링한 글/댓글을 정규화된 SQLite 테이블로 담는 저장소 (CRAWL_OUTPUT=sqlite 면 크롤러가 바로 씀).
+• posts    : (site, post_id) → 제목/작성자/IP/날짜/본문/추천/비추천/댓글 수/키워드 + 목록 메타(JSON)
+• comments : (site, post_id, idx) → 작성자/IP/날짜/추천/비추천/키워드 + body_id, comment_id, text_id (dedup.py)
+• bodies   : text_id(원문 그대로의 해시) → 댓글 내용 (글자 하나까지 같은 내용은 사이트/글이 달라도 한 번만 저장,
+  n_refs 는 가리키는 댓글 수). body_id(정규화 해시)는 묶음/중복 통계용으로만 같이 둠 — 읽을 때는 항상 원문 그대로
+• 날짜 문자열은 그대로 두고, 읽을 수 있으면 ts("YYYY-MM-DD HH:MM:SS") 열에도 넣어 기간 조회용 인덱스를 건다
+• 인덱스: site+post_id(기본키), 작성자, 작성자 IP, ts, 댓글 수
+• bodies_fts : 댓글 내용 FTS5(trigram) → keyword_search.py 처럼 파일을 전부 훑지 않고 키워드 조회 (고유 내용만 색인)
+• 글은 BATCH_POSTS 개 / BATCH_SECS 초마다 트랜잭션 하나로 몰아서 넣음 (읽기 전에는 항상 먼저 비움)
+  put(on_commit=…) 의 콜백은 그 글이 든 트랜잭션이 COMMIT 된 뒤에 불림 → 체크포인트는 그때 done
+• 컬럼에 없는 필드(keyword_spans, content_images, llm_* 등)는 extra(JSON) 에 보관 → 원래 dict 로 복원 가능
+
+사용:  python -m crawl_core.corpus import <site> [폴더]      # 기존 결과 폴더를 DB 로
+       python -m crawl_core.corpus search <키워드> [site]    # 댓글 내용 검색
+       python -m crawl_core.corpus stats
+"""
+import atexit
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from . import dedup
+
+CORPUS_DB = os.environ.get("CRAWL_CORPUS_DB", "corpus.sqlite3")
+SCHEMA_VERSION = 2   # 1: bodies 가 body_id(정규화 해시)로 내용을 합쳐 원문 철자가 사라지던 형식
+
+BATCH_POSTS = 50
+BATCH_SECS = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    site TEXT NOT NULL, post_id TEXT NOT NULL,
+    title TEXT, url TEXT, writer TEXT, writer_ip TEXT, date TEXT, ts TEXT,
+    content TEXT, body_key TEXT NOT NULL DEFAULT 'content',
+    likes INTEGER, dislikes INTEGER, n_comments INTEGER,
+    keyword INTEGER, keyword_content TEXT,
+    meta TEXT, extra TEXT, updated REAL,
+    PRIMARY KEY (site, post_id)
+);
+CREATE TABLE IF NOT EXISTS bodies (
+    id INTEGER PRIMARY KEY, text_id TEXT NOT NULL UNIQUE, body_id TEXT NOT NULL,
+    content TEXT, n_refs INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY,
+    site TEXT NOT NULL, post_id TEXT NOT NULL, idx INTEGER NOT NULL,
+    author TEXT, author_ip TEXT, date TEXT, ts TEXT,
+    body_id TEXT NOT NULL, comment_id TEXT, text_id TEXT NOT NULL REFERENCES bodies (text_id),
+    likes INTEGER, dislikes INTEGER,
+    keyword INTEGER, keyword_content TEXT, extra TEXT,
+    UNIQUE (site, post_id, idx)
+);
+CREATE TRIGGER IF NOT EXISTS comments_ref_ai AFTER INSERT ON comments BEGIN
+    UPDATE bodies SET n_refs = n_refs + 1 WHERE text_id = new.text_id;
+END;
+CREATE TRIGGER IF NOT EXISTS comments_ref_ad AFTER DELETE ON comments BEGIN
+    UPDATE bodies SET n_refs = n_refs - 1 WHERE text_id = old.text_id;
+END;
+CREATE INDEX IF NOT EXISTS posts_writer     ON posts (writer);
+CREATE INDEX IF NOT EXISTS posts_writer_ip  ON posts (writer_ip);
+CREATE INDEX IF NOT EXISTS posts_ts         ON posts (site, ts);
+CREATE INDEX IF NOT EXISTS posts_n_comments ON posts (site, n_comments);
+CREATE INDEX IF NOT EXISTS comments_author    ON comments (author);
+CREATE INDEX IF NOT EXISTS comments_author_ip ON comments (author_ip);
+CREATE INDEX IF NOT EXISTS comments_ts        ON comments (site, ts);
+CREATE INDEX IF NOT EXISTS comments_body      ON comments (body_id);
+CREATE INDEX IF NOT EXISTS comments_text      ON comments (text_id);
+CREATE INDEX IF NOT EXISTS bodies_body        ON bodies (body_id);
+CREATE INDEX IF NOT EXISTS comments_cid       ON comments (comment_id);
+"""
+
+# 댓글 내용 전문 검색 (외부 콘텐츠 테이블 + 트리거로 bodies 와 자동 동기화, 내용은 지우지 않으므로 INSERT 만)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS bodies_fts USING fts5(
+    content, content='bodies', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS bodies_ai AFTER INSERT ON bodies BEGIN
+    INSERT INTO bodies_fts (rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+BODY_FIELDS = ("content", "content_text")   # DC/FM Korea / ILBE
+POST_COLUMNS = ("title", "url", "writer", "writer_ip", "date", "likes", "dislikes")
+COMMENT_COLUMNS = ("author", "author_ip", "date", "content", "likes", "dislikes")
+LABEL_FIELDS = ("Keyword", "keyword_content")
+DEDUP_FIELDS = ("body_id", "comment_id")
+
+_DATE_RE = re.compile(r"(\d{4})[./-]\s*(\d{1,2})[./-]\s*(\d{1,2})(?:\D+(\d{1,2}):(\d{2})(?::(\d{2}))?)?")
+
+
+def to_ts(date: Optional[str]) -> Optional[str]:
+    """"2023.05.26 12:34:56" / "2023-05-26 12:34" 등 → "2023-05-26 12:34:56". "3시간 전" 처럼 못 읽으면 None."""
+    m = _DATE_RE.search(date or "")
+    if not m:
+        return None
+    y, mo, d, h, mi, s = (int(g or 0) for g in m.groups())
+    return f"{y:04d}-{mo:02d}-{d:02d} {h:02d}:{mi:02d}:{s:02d}"
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(str(value).replace(",", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _json(value) -> Optional[str]:
+    return json.dumps(value, ensure_ascii=False) if value else None
+
+
+# ── dict ↔ 행 ───────────────────────────────────────────────
+def post_row(site: str, post_id: str, record: Dict) -> Tuple:
+    post = record.get("post") or {}
+    body_key = next((k for k in BODY_FIELDS if k in post), "content")
+    skip = {*POST_COLUMNS, *LABEL_FIELDS, body_key, "comments"}
+    kws = post.get("keyword_content")
+    return (site, post_id,
+            post.get("title"), post.get("url"), post.get("writer"), post.get("writer_ip"),
+            post.get("date"), to_ts(post.get("date")), post.get(body_key), body_key,
+            _int(post.get("likes")), _int(post.get("dislikes")), len(post.get("comments") or []),
+            post.get("Keyword"), json.dumps(kws, ensure_ascii=False) if kws is not None else None,
+            _json({k: v for k, v in record.items() if k != "post"}),
+            _json({k: v for k, v in post.items() if k not in skip}),
+            time.time())
+
+
+def comment_rows(site: str, post_id: str, record: Dict) -> Tuple[List[Tuple], Dict[str, Tuple[str, str]]]:
+    """
+    (comments 행 목록, {text_id: (body_id, 내용)}). 내용은 원문 그대로의 해시(text_id)로 저장해야
+    읽을 때 다른 댓글의 철자가 나오지 않는다. body_id 가 아직 없으면 (dedup 안 거친 dict) 여기서 계산.
+    """
+    skip = {*COMMENT_COLUMNS, *LABEL_FIELDS, *DEDUP_FIELDS}
+    rows, bodies = [], {}
+    for idx, c in enumerate((record.get("post") or {}).get("comments") or [], start=1):
+        bid = c.get("body_id") or dedup.body_id(c.get("content", ""))
+        tid = dedup.text_id(c.get("content"))
+        bodies.setdefault(tid, (bid, c.get("content")))
+        kws = c.get("keyword_content")
+        rows.append((site, post_id, idx,
+                     c.get("author"), c.get("author_ip"), c.get("date"), to_ts(c.get("date")),
+                     bid, c.get("comment_id") or dedup.comment_id(c), tid,
+                     _int(c.get("likes")), _int(c.get("dislikes")),
+                     c.get("Keyword"), json.dumps(kws, ensure_ascii=False) if kws is not None else None,
+                     _json({k: v for k, v in c.items() if k not in skip})))
+    return rows, bodies
+
+
+def _label(value):
+    return None if value is None else bool(value)
+
+
+def to_record(post: Dict, comments: List[Dict]) -> Dict:
+    """posts 행 + comments 행(sqlite3.Row, bodies.content 를 붙여서) → 크롤러가 저장하던 것과 같은 모양의 dict."""
+    data = {k: post[k] for k in POST_COLUMNS}
+    data[post["body_key"]] = post["content"]
+    data.update(json.loads(post["extra"] or "{}"))
+    data["comments"] = []
+    for c in comments:
+        item = {k: c[k] for k in COMMENT_COLUMNS}
+        item.update(json.loads(c["extra"] or "{}"))
+        item.update({k: c[k] for k in DEDUP_FIELDS})
+        item["Keyword"] = _label(c["keyword"])
+        item["keyword_content"] = json.loads(c["keyword_content"]) if c["keyword_content"] else None
+        data["comments"].append(item)
+    data["Keyword"] = _label(post["keyword"])
+    data["keyword_content"] = json.loads(post["keyword_content"]) if post["keyword_content"] else None
+    return {**json.loads(post["meta"] or "{}"), "post": data}
+
+
+class Corpus:
+    """워커 스레드 여럿이 같이 쓰는 연결 하나 (checkpoint.Checkpoint 와 같은 방식). 쓰기는 모아서 한 트랜잭션."""
+
+    def __init__(self, path: str = CORPUS_DB):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self._check_version()
+        self.db.executescript(_SCHEMA)
+        self.db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        try:
+            self.db.executescript(_FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.OperationalError:   # FTS5/trigram 없는 SQLite (3.34 미만) → search() 는 LIKE 로
+            self.fts = False
+        self.pending: Dict[Tuple[str, str], Dict] = {}
+        self.on_commit: List[Callable[[], None]] = []
+        self.last_flush = time.monotonic()
+
+    def _check_version(self) -> None:
+        """예전 형식(bodies 가 body_id 로 합쳐짐)은 원문이 이미 사라져 옮길 수 없으니 다시 만들게 한다."""
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        has_tables = self.db.execute("SELECT 1 FROM sqlite_master WHERE name='bodies'").fetchone()
+        if has_tables and version < SCHEMA_VERSION:
+            raise RuntimeError(f"{self.path}: 예전 형식 corpus DB (v{version}) — 댓글 원문이 합쳐져 있어 옮길 수 없음. "
+                               f"파일을 지우고 python -m crawl_core.corpus import <site> 로 다시 만드세요")
+
+    # ── 쓰기 ───────────────────────────────────────
+    def put(self, site: str, post_id: Any, record: Dict,
+            on_commit: Optional[Callable[[], None]] = None) -> None:
+        """글 하나를 쓰기 대기열에. on_commit 은 이 글이 실제로 COMMIT 된 뒤에 (다음 _flush 에서) 불린다."""
+        with self.lock:
+            self.pending[(site, str(post_id))] = record   # 같은 글을 또 저장하면 마지막 것만
+            if on_commit is not None:
+                self.on_commit.append(on_commit)
+            if len(self.pending) >= BATCH_POSTS or time.monotonic() - self.last_flush >= BATCH_SECS:
+                self._flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        posts, comments, bodies = [], [], {}
+        for (site, pid), record in self.pending.items():
+            posts.append(post_row(site, pid, record))
+            rows, texts = comment_rows(site, pid, record)
+            comments.extend(rows)
+            bodies.update(texts)
+        self.db.execute("BEGIN")
+        try:
+            self.db.executemany("DELETE FROM comments WHERE site=? AND post_id=?", list(self.pending))
+            self.db.executemany(f"INSERT OR REPLACE INTO posts VALUES ({', '.join('?' * 18)})", posts)
+            self.db.executemany("INSERT OR IGNORE INTO bodies (text_id, body_id, content) VALUES (?, ?, ?)",
+                                [(tid, bid, text) for tid, (bid, text) in bodies.items()])
+            self.db.executemany(
+                "INSERT INTO comments (site, post_id, idx, author, author_ip, date, ts, body_id, comment_id, "
+                "text_id, likes, dislikes, keyword, keyword_content, extra) VALUES "
+                f"({', '.join('?' * 15)})", comments)
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        self.pending.clear()
+        done, self.on_commit = self.on_commit, []
+        for fn in done:
+            fn()
+
+    def close(self) -> None:
+        with self.lock:
+            self._flush()
+            self.db.close()
+
+    # ── 읽기 ───────────────────────────────────────
+    def ids(self, site: str) -> Set[str]:
+        with self.lock:
+            self._flush()
+            return {r[0] for r in self.db.execute("SELECT post_id FROM posts WHERE site=?", (site,))}
+
+    def get(self, site: str, post_id: Any) -> Optional[Dict]:
+        with self.lock:
+            self._flush()
+            post = self.db.execute("SELECT * FROM posts WHERE site=? AND post_id=?",
+                                   (site, str(post_id))).fetchone()
+            if post is None:
+                return None
+            comments = self.db.execute(
+                "SELECT c.*, b.content FROM comments c JOIN bodies b USING (text_id) "
+                "WHERE c.site=? AND c.post_id=? ORDER BY c.idx", (site, str(post_id))).fetchall()
+        return to_record(post, comments)
+
+    def items(self, site: str) -> Iterator[Tuple[str, Dict]]:
+        for pid in sorted(self.ids(site), key=lambda x: (len(x), x)):
+            yield pid, self.get(site, pid)
+
+    def search(self, keyword: str, site: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """댓글 내용에 keyword 가 들어간 댓글. trigram 은 3글자 이상만 색인을 쓰므로 짧은 말은 LIKE."""
+        where, args = ("AND c.site=?", [site]) if site else ("", [])
+        with self.lock:
+            self._flush()
+            if self.fts and len(keyword) >= 3:
+                sql = ("SELECT c.*, b.content FROM bodies_fts f JOIN bodies b ON b.id = f.rowid "
+                       f"JOIN comments c ON c.text_id = b.text_id WHERE bodies_fts MATCH ? {where} LIMIT ?")
+                rows = self.db.execute(sql, ['"' + keyword.replace('"', '""') + '"', *args, limit])
+            else:
+                sql = ("SELECT c.*, b.content FROM bodies b JOIN comments c ON c.text_id = b.text_id "
+                       f"WHERE b.content LIKE ? {where} LIMIT ?")
+                rows = self.db.execute(sql, [f"%{keyword}%", *args, limit])
+            return [dict(r) for r in rows]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self.lock:
+            self._flush()
+            posts = dict(self.db.execute("SELECT site, COUNT(*) FROM posts GROUP BY site").fetchall())
+            comments = {r[0]: (r[1], r[2]) for r in self.db.execute(
+                "SELECT site, COUNT(*), COUNT(DISTINCT body_id) FROM comments GROUP BY site")}
+            total, unique = self.db.execute(
+                "SELECT COALESCE(SUM(n_refs), 0), COUNT(DISTINCT body_id) FROM bodies WHERE n_refs > 0").fetchone()
+        out = {}
+        for site, n in posts.items():
+            c, u = comments.get(site, (0, 0))
+            out[site] = {"posts": n, "comments": c, "unique_bodies": u, "dup_ratio": 1 - u / c if c else 0.0}
+        out["*"] = {"posts": sum(posts.values()), "comments": total, "unique_bodies": unique,
+                    "dup_ratio": 1 - unique / total if total else 0.0}   # 사이트를 넘나드는 중복까지
+        return out
+
+
+# ── 프로세스 안에서 DB 하나 ─────────────────────────────────
+_CORPUS: Optional[Corpus] = None
+_LOCK = threading.Lock()
+
+
+def has_corpus(path: str = CORPUS_DB) -> bool:
+    """이미 열었거나 DB 파일이 있으면 참 (CRAWL_OUTPUT=sqlite 가 아니어도 읽기는 함께 함)."""
+    return _CORPUS is not None or os.path.exists(path)
+
+
+def open_corpus(path: str = CORPUS_DB) -> Corpus:
+    global _CORPUS
+    with _LOCK:
+        if _CORPUS is None:
+            _CORPUS = Corpus(path)
+        return _CORPUS
+
+
+@atexit.register
+def close_corpus() -> None:
+    global _CORPUS
+    with _LOCK:
+        if _CORPUS is not None:
+            _CORPUS.close()
+            _CORPUS = None
+
+
+if __name__ == "__main__":
+    cmd = sys.argv[1] if len(sys.argv) > 1 else ""
+    if cmd == "import" and len(sys.argv) > 2:
+        from . import pool
+        site = sys.argv[2]
+        out_dir = sys.argv[3] if len(sys.argv) > 3 else pool.SITE_DIRS.get(site, site)
+        db = open_corpus()
+        n = 0
+        for pid, record in pool.iter_results(out_dir):
+            db.put(site, pid, record)
+            n += 1
+        db.flush()
+        print(f"[corpus] {site} ({out_dir}) → {db.path}: 글 {n}개")
+    elif cmd == "search" and len(sys.argv) > 2:
+        for r in open_corpus().search(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None):
+            print(f"{r['site']}/{r['post_id']} #{r['idx']} {r['author']} ({r['date']}): {r['content']}")
+    elif cmd == "stats":
+        for site, c in open_corpus().stats().items():
+            print(f"[{site}] 글 {c['posts']}개, 댓글 {c['comments']}개, 고유 내용 {c['unique_bodies']}개 "
+                  f"(중복 비율 {c['dup_ratio']:.1%})")
+    else:
+        print("사용법: python -m crawl_core.corpus import <site> [폴더] | search <키워드> [site] | stats")
+        sys.exit(1)
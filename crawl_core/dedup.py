@@ -0,0 +1,89 @@
+"""
+dedup.py
+────────────────────────────────────────────────────────────
+댓글 내용 기준 중복 제거 (pool.save_result 에서 저장하기 직전에 적용).
+dc_comments.json 에 보이듯 "송파 가라오케 …" 광고나 "." 같은 댓글이 여러 글에 수없이 반복된다.
+• body_id    : 정규화한 댓글 내용의 해시 → 같은 내용이면 글/사이트가 달라도 같은 값
+• comment_id : 정규화 내용 + 작성자(닉네임, IP) + 날짜의 해시 → 다시 크롤링해도 같은 댓글이면 같은 값
+• annotate() : 댓글마다 두 값을 채움. 댓글 자체는 빼지 않는다 (같은 초에 같은 글을 여러 번 단 도배도 댓글 수로 의미가 있음)
+• text_id    : 정규화 없이 원문 그대로의 해시 → corpus.py(sqlite)가 bodies 에 내용을 한 번만 저장하는 키
+  (body_id 로 저장하면 대소문자/띄어쓰기만 다른 댓글이 남의 철자로 읽혀 나온다. body_id 는 묶음/통계용)
+  .json / 샤드 저장은 내용을 댓글마다 그대로 둔다
+• 사이트별로 본 댓글 수 / 고유 내용 수 / 중복 비율 / 가장 많이 반복된 내용을 summary() 로
+"""
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Tuple
+
+DIGEST_SIZE = 12          # 바이트 (hex 24자)
+TOP_REPEATED = 5          # summary 에 보여줄 반복 내용 수
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_body(text: str) -> str:
+    """NFKC + 소문자 + 공백 한 칸으로. (키워드 매칭용 normalize.py 와 달리 기호는 남긴다 — "." 도 내용이다)"""
+    return _SPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip().lower()
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def body_id(text: str) -> str:
+    return _digest(normalize_body(text))
+
+
+def text_id(text: str) -> str:
+    return _digest("text", text or "")
+
+
+def comment_id(comment: Dict) -> str:
+    return _digest(normalize_body(comment.get("content", "")), (comment.get("author") or "").strip(),
+                   (comment.get("author_ip") or "").strip(), (comment.get("date") or "").strip())
+
+
+# ── 통계 (사이트별, 프로세스 안에서 누적) ───────────────────────
+_lock = threading.Lock()
+_seen: Dict[str, int] = Counter()              # 저장한 댓글 수
+_bodies: Dict[str, Counter] = defaultdict(Counter)   # body_id → 나온 횟수
+_sample: Dict[str, str] = {}                   # body_id → 내용 일부 (summary 용)
+
+
+def annotate(post: Dict, site: str = "") -> Tuple[int, int]:
+    """
+    post["comments"] 에 body_id / comment_id 를 채운다. 반환: (댓글 수, 이 글 안의 고유 내용 수).
+    이미 comment_id 가 있는 댓글(증분 갱신으로 다시 저장하는 예전 댓글)은 그대로 두고 통계에도 다시 세지 않는다.
+    """
+    comments = post.get("comments") or []
+    fresh = [c for c in comments if not c.get("comment_id")]
+    for c in fresh:
+        c["body_id"] = body_id(c.get("content", ""))
+        c["comment_id"] = comment_id(c)
+    with _lock:
+        _seen[site] += len(fresh)
+        counts = _bodies[site]
+        for c in fresh:
+            counts[c["body_id"]] += 1
+            if counts[c["body_id"]] == 2:   # 반복된 내용만 견본을 남김
+                _sample.setdefault(c["body_id"], (c.get("content") or "")[:30].replace("\n", " "))
+    return len(comments), len({c.get("body_id") or body_id(c.get("content", "")) for c in comments})
+
+
+def stats(site: str) -> Dict:
+    with _lock:
+        seen, unique = _seen[site], len(_bodies[site])
+        top = [(_sample[b], n) for b, n in _bodies[site].most_common(TOP_REPEATED) if n > 1]
+        return {"comments": seen, "unique_bodies": unique,
+                "dup_ratio": 1 - unique / seen if seen else 0.0, "top": top}
+
+
+def summary(site: str) -> str:
+    s = stats(site)
+    lines = [f"[{site}] 댓글 중복 — 댓글 {s['comments']}개, 고유 내용 {s['unique_bodies']}개 "
+             f"(중복 비율 {s['dup_ratio']:.1%})"]
+    lines += [f"  {n}회: {text!r}" for text, n in s["top"]]
+    return "\n".join(lines)
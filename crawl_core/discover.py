@@ -0,0 +1,146 @@
+"""
+discover.py
+────────────────────────────────────────────────────────────
+목록 페이지 / 글 머리를 asyncio 로 여러 개 동시에 받는 HTTP 엔진.
+예전에는 fetch_best_list_requests() / fetch_dcbest_meta() 가 requests 호출을 하나씩 기다렸고,
+ILBE 는 ul.board-body > li 를 읽으려고 브라우저로 목록을 열었다.
+• stream(): key(목록 페이지 번호 / 글 번호)마다 요청 → parse 한 값을 끝나는 순서대로 내보내는 동기 generator
+  → engine.jobs() 가 그대로 pool.run_pool / 감독자에게 넘겨, 페이지 하나가 파싱되는 즉시 글이 스크랩 큐에 들어간다
+• 이벤트 루프는 별도 스레드, parse 는 asyncio.to_thread 로 기본 스레드 풀에서. 결과는 BACKLOG 크기 큐로 넘기므로 스크랩이 밀리면 목록 받기도 멈춘다
+• 속도는 ratelimit 의 사이트 버킷을 그대로 따른다 (request_async) — 동시 요청 수는 CONCURRENCY
+  (환경변수 CRAWL_ASYNC 로 덮어씀) 가 상한
+• 클라이언트: httpx.AsyncClient (h2 가 있으면 HTTP/2 한 연결로 다중화), httpx 가 없으면
+  requests 세션(커넥션 풀 CONCURRENCY)을 스레드에서
+"""
+import asyncio
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics, ratelimit
+
+try:
+    import httpx
+except ImportError:   # 없으면 requests 세션을 스레드에서
+    httpx = None
+try:
+    import h2   # httpx 의 HTTP/2 지원
+    HTTP2 = httpx is not None
+except ImportError:
+    HTTP2 = False
+
+# 사이트별 동시 요청 상한 (실제 속도는 ratelimit.HOST_LIMITS 가 정함)
+CONCURRENCY: Dict[str, int] = {
+    "ilbe"   : 8,
+    "dc"     : 16,
+    "fmkorea": 4,
+}
+TIMEOUT = 10.0
+BACKLOG = 64     # 아직 스크랩 쪽이 가져가지 않은 결과 상한 (목록 페이지 / DC 글 작업 수)
+
+_DONE = object()
+
+
+class Client:
+    """요청 1건 = await get(url, params). 응답은 status_code / text / url 을 가진다 (httpx / requests 공통)."""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, verify: Any = True, size: int = 8):
+        if httpx is not None:
+            self._http = httpx.AsyncClient(
+                http2=HTTP2, headers=headers, verify=verify, timeout=TIMEOUT, follow_redirects=True,
+                limits=httpx.Limits(max_connections=size, max_keepalive_connections=size))
+            self._sess = None
+        else:
+            self._http = None
+            self._sess = requests.Session()
+            self._sess.headers.update(headers or {})
+            self._sess.verify = verify
+            pooled = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+            self._sess.mount("https://", pooled)
+            self._sess.mount("http://", pooled)
+
+    async def get(self, url: str, params: Optional[Dict] = None):
+        if self._http is not None:
+            return await self._http.get(url, params=params)
+        return await asyncio.to_thread(self._sess.get, url, params=params, timeout=TIMEOUT)
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+        else:
+            self._sess.close()
+
+
+class StatusError(Exception):
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+
+
+async def _run(site: str, keys: Iterable[Any], request: Callable[[Any], Tuple[str, Dict]],
+               parse: Callable[[Any, str, str], Any], client: Client, size: int, stage: str,
+               emit: Callable[[Tuple[Any, Any]], None], stop: threading.Event) -> None:
+    it = iter(keys)   # 코루틴들이 한 iterator 를 나눠 가짐 (한 스레드라 잠금 불필요)
+
+    async def worker():
+        for key in it:
+            if stop.is_set():
+                return
+            try:
+                url, params = request(key)
+                res = await ratelimit.request_async(lambda: client.get(url, params), url, stage=stage)
+                if res.status_code >= 400:
+                    raise StatusError(res.status_code, str(res.url))
+                with metrics.stage(site, "extract"):   # 파싱은 스레드에서 — 루프는 다른 응답을 계속 받음
+                    value = await asyncio.to_thread(parse, key, res.text, str(res.url))
+            except Exception as e:
+                value = e
+            await asyncio.to_thread(emit, (key, value))
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(size)))
+    finally:
+        await client.aclose()
+
+
+def stream(site: str, keys: Iterable[Any], request: Callable[[Any], Tuple[str, Dict]],
+           parse: Callable[[Any, str, str], Any], headers: Optional[Dict[str, str]] = None,
+           verify: Any = True, stage: str = "list", concurrency: Optional[int] = None) -> Iterator[Tuple[Any, Any]]:
+    """
+    keys 마다 request(key) → (url, params) 를 비동기로 받아 parse(key, 본문, 최종 URL) 한 값을
+    끝나는 순서대로 (key, 값) 으로 내보낸다. 실패한 key 는 (key, 예외) — 호출한 쪽이 예전 경로로 다시 받으면 된다.
+    generator 를 중간에 닫으면 남은 요청은 보내지 않는다.
+    """
+    size = concurrency or int(os.environ.get("CRAWL_ASYNC", "0")) or CONCURRENCY.get(site, 4)
+    out: "queue.Queue[Any]" = queue.Queue(maxsize=BACKLOG)
+    stop = threading.Event()
+
+    def emit(item) -> None:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def loop() -> None:
+        try:
+            asyncio.run(_run(site, keys, request, parse, Client(headers, verify, size), size, stage, emit, stop))
+        finally:
+            emit(_DONE)
+
+    threading.Thread(target=loop, name=f"{site}-discover", daemon=True).start()
+    print(f"[{site}] 비동기 {stage} 받기: 동시 {size}개, "
+          f"{'httpx HTTP/2' if HTTP2 else 'httpx' if httpx is not None else 'requests 스레드'}")
+    try:
+        while True:
+            item = out.get()
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
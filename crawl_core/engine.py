@@ -0,0 +1,519 @@
+"""
+engine.py
+────────────────────────────────────────────────────────────
+세 사이트 크롤러가 함께 쓰는 파이프라인. 예전에는 스크립트 7개가 드라이버 준비 / cnt() / extract() / 댓글 페이지 넘김 /
+JSON 저장을 제각각 들고 있어서, 한 곳을 빠르게 고쳐도 나머지 복사본은 그대로였다.
+• SiteAdapter: 사이트마다 다른 것만 — 목록 파서(list_posts), 글 파서(post_ready / parse_post / read_post_fields),
+  댓글 페이저(comment_pages), 댓글 한 줄(comment_item / comment_fields / comment_row), 증분 갱신(newest_comment_pages)
+• Engine: 나머지 전부 — 브라우저 감독자 / 워커 풀 / 체크포인트 / 평균 댓글수 필터 / pace / ratelimit 단계 /
+  추출 방식(EXTRACT_MODE) / 키워드 태깅 / pool.save_result / 끝날 때 요약
+• ASYNC_DISCOVER: 목록 페이지(DC 는 글 머리)를 discover.stream 으로 동시에 받아 파싱되는 대로 작업으로 넘김.
+  HTTP 로 못 읽은 페이지/글만 예전 경로(브라우저 목록 / 글 처리 때 다시 받기)로
+• main(): 스크립트 공통 명령행 — `<시작> [끝] [워커 수]`, `--refresh [글 번호 …]`, 인자가 없으면 input()
+사이트 어댑터는 crawl_core/sites/ 에 있고, 크롤러 스크립트는 어댑터를 골라 main() 만 부른다.
+"""
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from . import (browser, bulk_dom, checkpoint, dedup, discover, events, incremental, keywords, metrics, pool,
+               ratelimit, snapshot, spam, supervisor, waits)
+
+# 본문/댓글 추출 방식: "snapshot"(page_source 를 브라우저 밖에서 파싱) / "bulk"(execute_script 1회) / "each"(요소별)
+EXTRACT_MODE = "snapshot"
+SNAPSHOT_WORKERS = 0   # 1 이상이면 스냅샷 파싱을 별도 프로세스 풀에서
+TAG_INLINE = True      # 저장 전에 Keyword/keyword_content 채우기 (keyword_search.py 재작성 단계 생략)
+ASYNC_DISCOVER = True  # 목록 / 글 머리를 asyncio 로 동시에 (어댑터에 list_request / head_request 가 있을 때)
+# chromedriver 경로. 비워 두면 Selenium 이 PATH / Selenium Manager 로 찾는다 (크롤러 스크립트, bench 공통)
+CHROMEDRIVER = os.environ.get("CRAWL_CHROMEDRIVER", "")
+
+# 댓글 페이저가 "다음 페이지 없음"으로 보고 멈추는 예외 (다음 링크가 없음 / 페이지 표시가 안 바뀜).
+# 그 밖의 예외 — 특히 브라우저가 죽은 경우 — 는 글 처리까지 올려 보내 잘린 댓글로 저장되지 않게 한다
+PAGE_END = (NoSuchElementException, TimeoutException)
+
+
+def page_end(e: BaseException) -> bool:
+    return isinstance(e, PAGE_END) and not supervisor.is_driver_error(e)
+
+
+# 빈 라벨 필드 (snapshot 파서와 같은 정의 하나 — 어댑터는 여기서 import)
+LABELS = snapshot.LABELS
+labels = snapshot.labels
+
+
+class Skip(Exception):
+    """이 글은 저장하지 않고 넘김 (삭제됨 / 댓글 수 미달 등). status 로 체크포인트에 남김."""
+
+    def __init__(self, note: str, status: str = checkpoint.SKIPPED):
+        super().__init__(note)
+        self.note, self.status = note, status
+
+
+# ── 사이트 어댑터 ─────────────────────────────────────────────
+class SiteAdapter:
+    """
+    사이트별로 다른 부분. 클래스 속성은 기본값이고, 생성자 인자로 옛 스크립트의 차이(결과 폴더 등)를 맞춘다.
+    """
+    site = ""                    # metrics / ratelimit / waits / events 에서 쓰는 이름
+    base = ""                    # 사이트 주소 (목록/글/댓글 API URL 의 앞부분. bench 는 로컬 픽스처 서버로 바꿔 끼움)
+    out_dir = ""                 # 결과 폴더 (pool.save_result)
+    meta_key = "meta"            # 저장 레코드에서 목록 메타가 들어가는 키
+    id_key = "id"                # 목록 메타의 글 번호 키
+    count_key = "comments"       # 목록 메타의 댓글 수 키 (평균 필터)
+    id_type = str                # --refresh 인자 / 저장된 id → 작업 id
+    wait_timeout = 10
+    headers: Dict[str, str] = {}
+    verify: Any = True           # requests 인증서 검사 (ILBE 는 certifi 묶음)
+
+    has_list = True              # False 면 목록 없이 글 번호 범위를 그대로 돈다 (DC)
+    needs_browser = True         # False 면 글 처리에 브라우저를 안 띄우고 필요할 때만 빌린다
+    can_refresh = False
+    refresh_browser = True       # 증분 갱신에 브라우저가 필요한지
+
+    start_prompt = "시작 페이지≫ "
+    end_prompt: Optional[str] = None   # 있으면 끝 번호도 input() 으로 묻는다
+
+    # 글 페이지
+    post_ready = ""              # 글이 그려졌다고 볼 셀렉터
+    parse_post = None            # snapshot 파서 (html, url) → 본문 필드
+    parse_comments = None        # snapshot 파서 html → 댓글 목록
+
+    # 댓글 한 페이지
+    comments_ready = ""          # 추출 전에 기다릴 셀렉터
+    comment_item = ""            # 댓글 한 줄 (bulk/each 추출, 페이지 교체 감지)
+    comment_fields: Dict[str, str] = {}
+
+    def __init__(self, out_dir: Optional[str] = None, base: Optional[str] = None):
+        if out_dir:
+            self.out_dir = out_dir
+        if base:
+            self.base = base.rstrip("/")
+
+    def post_id(self, job: Any) -> Any:
+        return job[self.id_key] if isinstance(job, dict) else job
+
+    def list_posts(self, eng: "Engine", page: int) -> List[Dict]:
+        """목록 page 의 글 메타 [{id_key, count_key, url}, …]. 실패는 예외로."""
+        raise NotImplementedError
+
+    def list_request(self, page: int) -> Optional[Tuple[str, Dict]]:
+        """목록 page 를 HTTP 로 받을 (url, params). None 이면 비동기 목록 없음."""
+        return None
+
+    def parse_list(self, page: int, html: str, url: str) -> List[Dict]:
+        """list_request 응답 → list_posts 와 같은 글 메타."""
+        raise NotImplementedError
+
+    def head_request(self, no: int) -> Optional[Tuple[str, Dict]]:
+        """목록이 없는 사이트: 글 no 를 미리 받아 거를 (url, params). None 이면 비동기 머리 받기 없음."""
+        return None
+
+    def parse_head(self, no: int, html: str, url: str) -> Any:
+        """head_request 응답 → 작업 (저장하지 않을 글이면 Skip)."""
+        raise NotImplementedError
+
+    def fetch(self, eng: "Engine", job: Any, drv=None, wt=None) -> Tuple[Dict, Dict]:
+        """작업 1개 → (목록 메타, 글). 저장하지 않을 글이면 Skip."""
+        return job, eng.scrape_post(job["url"], drv, wt)
+
+    def read_post_fields(self, drv, url: str) -> Dict:
+        """snapshot 이 아닌 추출 방식에서 WebElement 로 본문 필드를 읽는다."""
+        raise NotImplementedError
+
+    def comment_row(self, row: Dict[str, Optional[str]]) -> Optional[Dict]:
+        """comment_fields 로 읽은 한 줄 → 댓글 dict (필수 필드가 없으면 None)."""
+        raise NotImplementedError
+
+    def comment_pages(self, eng: "Engine", drv, wt, html: Optional[str]) -> Iterator[Future]:
+        """
+        댓글 페이저: 글이 열린 상태에서 페이지를 넘기며 eng.extract() 의 Future 를 하나씩 내보낸다.
+        html 은 글 페이지 스냅샷 (snapshot 모드가 아니면 None).
+        """
+        yield eng.extract(drv, wt)
+
+    def newest_comment_pages(self, eng: "Engine", post_id: Any, record: Dict,
+                             drv=None, wt=None) -> Iterator[List[Dict]]:
+        """증분 갱신용: 마지막(최신) 댓글 페이지부터 페이지별 댓글 목록."""
+        raise NotImplementedError
+
+    def save_note(self, post_id: Any, meta: Dict) -> str:
+        """저장 줄 끝에 붙일 말."""
+        return f", 목록 {meta[self.count_key]}개" if self.count_key in meta else ""
+
+    def report(self) -> None:
+        """실행이 끝났을 때 사이트만의 요약."""
+
+
+# ── 엔진 ─────────────────────────────────────────────────────
+class Engine:
+    def __init__(self, adapter: SiteAdapter, chromedriver: Optional[str] = None):
+        self.adapter = adapter
+        self.site = adapter.site
+        events.setup(self.site)   # → <site>_events.jsonl
+        chromedriver = chromedriver or CHROMEDRIVER
+        self.service = Service(chromedriver) if chromedriver else Service()
+        self.parser = snapshot.SnapshotParser(SNAPSHOT_WORKERS)
+        # 처음 쓸 때 브라우저를 띄우고 주기적으로 교체 (HTTP 경로만 타면 Chrome 을 아예 안 띄움)
+        self.sup = supervisor.DriverSupervisor(self.new_driver, self.site, wait_timeout=adapter.wait_timeout)
+        self.sess = requests.Session()
+        self.sess.headers.update(adapter.headers)
+        self.sess.verify = adapter.verify
+        self.state: Optional[checkpoint.Checkpoint] = None
+        self._borrow_lock = threading.Lock()   # 브라우저 없는 워커가 self.sup 의 driver 를 빌릴 때
+
+    def new_driver(self) -> webdriver.Chrome:
+        # headless + 이미지/폰트/광고 차단, eager 로드 (CRAWL_BROWSER=visible 이면 창 띄움)
+        drv = webdriver.Chrome(service=self.service, options=browser.chrome_options(self.site))
+        return bulk_dom.instrument(browser.start(drv, self.site))
+
+    def borrow(self, fn, drv=None, wt=None):
+        """fn(drv, wt). drv 가 없으면 (HTTP 워커) 전역 감독자의 driver 를 잠금으로 빌린다."""
+        if drv is not None:
+            return fn(drv, wt)
+        with self._borrow_lock:
+            try:
+                return fn(self.sup.driver, self.sup.wait)
+            except Exception as e:
+                if supervisor.is_driver_error(e):
+                    self.sup.recycle("lost")
+                raise
+
+    # ── 가져오기 ────────────────────────────────────────────
+    def get(self, url: str, stage: str = "fetch", **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", 10)
+        return ratelimit.get(self.sess, url, stage=stage, **kwargs)
+
+    def open_list(self, url: str, ready_css: str) -> str:
+        """
+        목록 페이지를 브라우저로 열고 page_source. 고정 sleep 대신 글 목록이 그려질 때까지만 대기.
+        producer 스레드에서 불리므로 브라우저 없는 워커와 같은 잠금(borrow)으로 self.sup 의 driver 를 쓴다.
+        """
+        waits.pace(self.site, "list")
+
+        def load(drv, wt) -> str:
+            ratelimit.navigate(drv, url, stage="list")
+            waits.until(self.site, "list", drv,
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ready_css)),
+                        timeout=self.adapter.wait_timeout, required=False)   # 타임아웃이면 있는 그대로 파싱
+            self.sup.tick()   # 목록 페이지도 브라우저 교체 주기에 포함
+            return drv.page_source
+        return self.borrow(load)
+
+    def open_post(self, url: str, drv=None, wt=None):
+        drv, wt = drv or self.sup.driver, wt or self.sup.wait
+        ratelimit.navigate(drv, url, stage="post")
+        wt.until(EC.presence_of_element_located((By.CSS_SELECTOR, self.adapter.post_ready)))
+        return drv, wt
+
+    def turn_page(self, drv, marker_css: str, label: str, script: str, *args,
+                  timeout: float = 10, required: bool = True) -> None:
+        """
+        댓글 페이지 넘김 1회: 간격 유지 → script 실행 (loadComment(n) / 링크 클릭)
+        → 이전 댓글 DOM 이 교체되고 marker_css 의 현재 페이지 표시가 label 이 될 때까지 대기.
+        대기가 타임아웃이면 (마지막 페이지 등) 호스트 속도 조절에는 넣지 않는다 — 서버가 느린 게 아니므로.
+        """
+        waits.pace(self.site, "comment_page")
+        old = waits.first(drv, self.adapter.comment_item)
+        with ratelimit.track(ratelimit.for_site(self.site), stage="comment_page") as req:
+            drv.execute_script(script, *args)
+            if waits.until(self.site, "comment_page", drv, waits.comments_swapped(old, marker_css, label),
+                           timeout=timeout, required=False) is None:
+                req.discard()
+                if required:
+                    raise TimeoutException(f"댓글 페이지 {label} 로 바뀌지 않음")
+
+    # ── 추출 ──────────────────────────────────────────────
+    def extract(self, drv, wt) -> Future:
+        """지금 보이는 댓글 페이지 → 댓글 목록 Future (snapshot 이면 파싱이 다음 페이지 넘김과 겹쳐 진행)."""
+        a = self.adapter
+        rt0 = bulk_dom.mark(drv)
+        wt.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, a.comments_ready)))
+        with metrics.stage(self.site, "extract"):
+            if EXTRACT_MODE == "snapshot":
+                out = self.parser.submit(a.parse_comments, drv.page_source)
+            else:
+                if EXTRACT_MODE == "bulk":
+                    rows = bulk_dom.extract_rows(drv, a.comment_item, a.comment_fields)
+                else:
+                    rows = self._rows_each(drv)
+                out = snapshot.done([c for c in map(a.comment_row, rows) if c])
+        bulk_dom.record_page(self.site, bulk_dom.mark(drv) - rt0)
+        return out
+
+    def _rows_each(self, drv) -> List[Dict[str, Optional[str]]]:
+        """bulk_dom.extract_rows 와 같은 모양을 WebElement 조회로 (요소마다 왕복)."""
+        rows = []
+        for item in drv.find_elements(By.CSS_SELECTOR, self.adapter.comment_item):
+            try:
+                row = {}
+                for name, sel in self.adapter.comment_fields.items():
+                    els = item.find_elements(By.CSS_SELECTOR, sel)
+                    row[name] = els[0].text.strip() if els else None
+                rows.append(row)
+            except Exception:
+                continue
+        return rows
+
+    def finish_post(self, fields: Dict, comments: List[Dict]) -> Dict:
+        post = {**fields, "comments": comments, **labels()}
+        if TAG_INLINE:
+            with metrics.stage(self.site, "tag"):
+                keywords.tag_post(post)
+        return post
+
+    def scrape_post(self, url: str, drv=None, wt=None) -> Dict:
+        """글을 열어 본문 + 댓글 전체 (페이지 넘김은 어댑터의 comment_pages)."""
+        a = self.adapter
+        drv, wt = self.open_post(url, drv, wt)
+        if EXTRACT_MODE == "snapshot":
+            html = drv.page_source
+            fields = self.parser.submit(a.parse_post, html, url)
+        else:
+            html = None
+            fields = snapshot.done(a.read_post_fields(drv, url))
+        pages = list(a.comment_pages(self, drv, wt, html))
+        return self.finish_post(fields.result(), [c for fut in pages for c in fut.result()])
+
+    # ── 작업 목록 ───────────────────────────────────────────
+    def open_state(self) -> checkpoint.Checkpoint:
+        """처음 한 번만 체크포인트를 열고 결과 폴더에 이미 있는 글을 done 으로 맞춘다 (폴더는 여기서 한 번만 읽음)."""
+        if self.state is None:
+            out_dir = self.adapter.out_dir
+            Path(out_dir).mkdir(exist_ok=True)
+            self.state = checkpoint.Checkpoint(pool.site_of(out_dir), out_dir=out_dir)
+            print(self.state.summary())
+        return self.state
+
+    def mark(self, post_id: Any, status: str, note: str = "") -> None:
+        if self.state is not None:
+            self.state.mark_post(post_id, status, note)
+
+    def page_posts(self, page: int, posts: Optional[List[Dict]] = None) -> Iterator[Dict]:
+        """
+        목록 page 에서 댓글 수가 평균 이상인 글 메타. 목록을 이미 다 읽은 페이지는 체크포인트에서 남은 글만.
+        posts 가 있으면 (비동기로 이미 받은 목록) 다시 받지 않는다.
+        """
+        a, state = self.adapter, self.state
+        if state is not None and state.page_status(page) == checkpoint.DONE:
+            left = state.unfinished_posts(page)
+            if left:
+                print(f"\n📄 목록 페이지 {page}: 체크포인트에서 남은 글 {len(left)}개")
+            yield from left
+            return
+
+        print(f"\n📄 목록 페이지 {page} 크롤링…")
+        try:
+            if posts is None:
+                posts = a.list_posts(self, page)
+        except Exception as e:
+            logging.error(f"[{self.site}] 목록 페이지 {page} 로드 실패: {e}", extra=events.ctx(stage="list"))
+            if supervisor.is_driver_error(e):
+                self.sup.recycle("lost")
+            posts = []
+        if not posts:
+            print("  └─ 글 없음/요청 실패")
+            if state is not None:
+                state.mark_page(page, checkpoint.FAILED)
+            return
+
+        avg = sum(p[a.count_key] for p in posts) / len(posts)
+        picked = [p for p in posts if p[a.count_key] >= avg]
+        print(f"  · 평균 댓글수 {avg:.2f}, 평균 이상 글 {len(picked)} / {len(posts)}")
+        if state is not None:
+            state.add_posts(page, [p for p in posts if p[a.count_key] < avg], a.id_key,
+                            checkpoint.SKIPPED, "평균 미만")
+            state.add_posts(page, picked, a.id_key)
+            state.mark_page(page, checkpoint.DONE)
+            picked = [p for p in picked if not state.is_finished(p[a.id_key])]
+        yield from picked
+
+    def jobs(self, start: int, end: int = 1) -> Iterator[Any]:
+        """start → end 로 내려가며 처리할 작업. 목록이 있으면 글 메타, 없으면 (체크포인트상 안 끝난) 글 번호."""
+        a = self.adapter
+        if a.has_list:
+            if ASYNC_DISCOVER and a.list_request(start) is not None:
+                yield from self._async_pages(range(start, end - 1, -1))
+                return
+            for page in range(start, end - 1, -1):
+                yield from self.page_posts(page)
+        else:
+            todo = (no for no in range(start, end - 1, -1)
+                    if self.state is None or not self.state.is_finished(no))
+            if ASYNC_DISCOVER and a.head_request(start) is not None:
+                yield from self._async_heads(todo)
+                return
+            yield from todo
+
+    def _async_pages(self, pages: Iterable[int]) -> Iterator[Dict]:
+        """체크포인트에 남은 글을 먼저 내보내고, 나머지 목록 페이지는 동시에 받아 끝나는 순서대로 거른다."""
+        a, todo = self.adapter, []
+        for page in pages:
+            if self.state is not None and self.state.page_status(page) == checkpoint.DONE:
+                yield from self.page_posts(page)
+            else:
+                todo.append(page)
+        for page, posts in discover.stream(self.site, todo, a.list_request, a.parse_list,
+                                           a.headers, a.verify, stage="list"):
+            if isinstance(posts, Exception) or not posts:
+                # HTTP 로 못 읽은 페이지 (차단 / JS 렌더링 등) → 예전 경로(list_posts)로 다시
+                if isinstance(posts, Exception):
+                    logging.warning(f"[{self.site}] 목록 페이지 {page} 비동기 실패 → 다시 시도: {posts}",
+                                    extra=events.ctx(stage="list"))
+                posts = None
+            yield from self.page_posts(page, posts)
+
+    def _async_heads(self, nos: Iterable[int]) -> Iterator[Any]:
+        """글 머리를 동시에 받아 parse_head 로 거른다. 못 받은 글은 번호 그대로 넘겨 글 처리 때 다시 받는다."""
+        a = self.adapter
+        for no, job in discover.stream(self.site, nos, a.head_request, a.parse_head,
+                                       a.headers, a.verify, stage="post"):
+            if isinstance(job, Skip):
+                print(f"  [{no}] {job.note} → 건너뜀")
+                self.mark(no, job.status, job.note)
+            elif isinstance(job, Exception):
+                yield no
+            else:
+                yield job
+
+    # ── 글 1개 처리 ─────────────────────────────────────────
+    def process(self, job: Any, drv=None, wt=None) -> None:
+        """작업 1개 → 어댑터 fetch → 결과 폴더 저장 → 체크포인트. 출력은 워커끼리 섞이지 않게 한 줄로."""
+        a = self.adapter
+        pid = a.post_id(job)
+        waits.pace(self.site, "post")   # 예전 글당 sleep(1) → 남은 간격만 쉬기
+        try:
+            meta, post = a.fetch(self, job, drv, wt)
+            n_com = len(post["comments"])
+            if n_com == 0:
+                logging.warning(f"[{pid}] 댓글 0개 (URL: {post.get('url')})", extra=events.ctx(pid, "comments"))
+            # done 은 저장 위치에 실제로 내려간 뒤에 (corpus 배치 COMMIT / 샤드 fsync)
+            pool.save_result(a.out_dir, pid, {a.meta_key: meta, "post": post},
+                             on_saved=lambda: self.mark(pid, checkpoint.DONE))
+            print(f"  [{pid}] 저장 ✓ (댓글 {n_com}개{a.save_note(pid, meta)})")
+        except Skip as s:
+            print(f"  [{pid}] {s.note} → 건너뜀")
+            self.mark(pid, s.status, s.note)
+        except Exception as e:
+            if supervisor.is_driver_error(e):
+                raise   # 브라우저 문제 → 감독자 / 워커가 새 브라우저로 이 글을 다시 처리
+            logging.exception(f"[{pid}] 크롤링 실패", extra=events.ctx(pid, "scrape"))
+            print(f"  [{pid}] ERROR:", e)
+            self.mark(pid, checkpoint.FAILED, str(e)[:200])
+
+    def crawl(self, start: int, end: int = 1) -> None:
+        self.open_state()
+        metrics.start(self.site)   # → <site>_metrics.json (CRAWL_METRICS_PORT 면 /metrics 도)
+        try:
+            for job in self.jobs(start, end):
+                self.sup.run(self.process, job, browser=self.adapter.needs_browser)
+        finally:
+            pool.flush_outputs(self.adapter.out_dir)   # 배치에 남은 글 → 체크포인트 done
+            self.parser.shutdown()   # SNAPSHOT_WORKERS 프로세스 풀 (다음 crawl 에서 다시 띄움)
+        self.report()
+
+    def crawl_parallel(self, start: int, end: int = 1, workers: Optional[int] = None) -> None:
+        """작업을 공유 큐에 넣고 워커 N개가 나눠서 처리 (목록은 전역 감독자의 driver, 상한: pool.SITE_CONCURRENCY)."""
+        self.open_state()
+        metrics.start(self.site)
+        make = self.new_driver if self.adapter.needs_browser else None
+        try:
+            pool.run_pool(self.site, self.jobs(start, end), self.process, make,
+                          workers=workers, wait_timeout=self.adapter.wait_timeout)
+        finally:
+            pool.flush_outputs(self.adapter.out_dir)
+            self.parser.shutdown()
+        self.report()
+
+    def report(self) -> None:
+        site = self.site
+        if self.state is not None:
+            print(self.state.summary())
+        print(self.sup.summary())
+        self.adapter.report()
+        print(bulk_dom.summary(site))
+        print(waits.summary(site))
+        print(ratelimit.summary(site))
+        print(dedup.summary(site))
+        print(spam.summary())
+        print(events.summary())
+        metrics.stop(site)
+        print(metrics.summary(site))
+        print(browser.summary(site))
+        ratelimit.write_stats()
+
+    # ── 저장된 글에 새 댓글만 덧붙이기 ────────────────────────
+    def refresh_post(self, post_id: Any, drv=None, wt=None) -> None:
+        a = self.adapter
+        try:
+            res = incremental.refresh(a.out_dir, post_id,
+                                      lambda record: a.newest_comment_pages(self, post_id, record, drv, wt),
+                                      on_new=keywords.tag_comment if TAG_INLINE else None)
+            if res is None:
+                print(f"  [{post_id}] 저장된 파일 없음 → 건너뜀")
+                return
+            n_new, n_pages = res
+            print(f"  [{post_id}] 새 댓글 {n_new}개 (댓글 페이지 {n_pages}장 확인)")
+        except Exception as e:
+            if supervisor.is_driver_error(e):
+                raise
+            logging.exception(f"[{post_id}] 증분 갱신 실패", extra=events.ctx(post_id, "refresh"))
+            print(f"  [{post_id}] ERROR:", e)
+
+    def refresh(self, ids: Optional[List[str]] = None, workers: Optional[int] = None) -> None:
+        """ids 가 없으면 결과 폴더의 모든 글을 갱신."""
+        a = self.adapter
+        if not a.can_refresh:
+            print(f"[{self.site}] 증분 갱신을 지원하지 않는 사이트")
+            return
+        ids = [a.id_type(i) for i in (ids or incremental.saved_ids(a.out_dir))]
+        if a.refresh_browser and pool.resolve_workers(self.site, workers) <= 1:
+            for post_id in ids:
+                self.sup.run(self.refresh_post, post_id)
+        else:
+            make = self.new_driver if a.refresh_browser else None
+            pool.run_pool(self.site, ids, self.refresh_post, make,
+                          workers=workers, wait_timeout=a.wait_timeout)
+        print(ratelimit.summary(self.site))
+        print(dedup.summary(self.site))
+        print(spam.summary())
+        print(events.summary())
+
+
+# ── 명령행 ───────────────────────────────────────────────────
+def main(adapter: SiteAdapter, chromedriver: Optional[str] = None, argv: Optional[List[str]] = None) -> None:
+    """
+    python <크롤러>.py <시작> [끝=1] [워커 수]   → 시작 → 끝 으로 내려가며 (목록 페이지 또는 글 번호)
+    python <크롤러>.py --refresh [글 번호 …]     → 저장된 글에 새 댓글만 추가
+    워커 수가 없으면 CRAWL_WORKERS 환경변수 (pool.resolve_workers).
+    chromedriver 를 주지 않으면 CHROMEDRIVER (환경변수 CRAWL_CHROMEDRIVER).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    eng = Engine(adapter, chromedriver)
+    try:
+        if argv[:1] == ["--refresh"]:
+            eng.refresh(argv[1:])
+            return
+        if argv:
+            start = int(argv[0])
+            end = int(argv[1]) if len(argv) >= 2 else 1
+        else:
+            start = int(input(adapter.start_prompt).strip())
+            end = int(input(adapter.end_prompt).strip()) if adapter.end_prompt else 1
+        workers = pool.resolve_workers(adapter.site, int(argv[2]) if len(argv) >= 3 else None)
+        if workers > 1:
+            eng.crawl_parallel(start, end, workers)
+        else:
+            eng.crawl(start, end)
+    finally:
+        eng.sup.quit()
@@ -0,0 +1,159 @@
+"""
+events.py
+────────────────────────────────────────────────────────────
+크롤러 로그를 사건(event) 하나당 JSON 한 줄로 남기는 logging 핸들러.
+(예전 crawl_errors.log 는 3MB 대부분이 fm_korea 의 같은 ValueError 스택이 글마다 반복된 것)
+• 필드: ts, level, site, post_id, stage, msg, error(예외 클래스), error_msg, fingerprint
+• fingerprint = 예외 클래스 + 스택의 (파일, 함수) 목록 (예외가 없으면 숫자를 지운 메시지) → 같은 원인이면 같은 값
+• 같은 fingerprint 는 처음 한 번만 traceback 전체를 쓰고, 그 뒤로는 세기만 하다가
+  REPEAT_EVERY 번 / REPEAT_SECS 초마다 {"event": "repeat", count, post_ids(최근 몇 개)} 한 줄로 요약
+• RotatingFileHandler 라 MAX_BYTES 를 넘으면 BACKUPS 개까지 돌려 씀 → 오래 돌려도 디스크 사용량 일정
+기존 logging.exception(...) 호출은 그대로 두고 extra=events.ctx(post_id, stage) 만 붙이면 된다.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import traceback
+from collections import deque
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, Optional
+
+MAX_BYTES = 10 * 2**20
+BACKUPS = 5
+REPEAT_EVERY = 500        # 이만큼 반복되면 요약 한 줄
+REPEAT_SECS = 300.0       # 또는 마지막 요약 뒤로 이만큼 지났으면
+SAMPLE_IDS = 10           # 요약에 남길 최근 post_id 수
+
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def ctx(post_id: Any = None, stage: str = "", site: Optional[str] = None) -> Dict[str, Any]:
+    """logging 호출의 extra=. post_id 에 목록 메타 dict 를 넘기면 id / no 를 꺼내 쓴다."""
+    if isinstance(post_id, dict):
+        post_id = post_id.get("id", post_id.get("no"))
+    extra = {"post_id": post_id, "stage": stage}
+    if site:
+        extra["site"] = site
+    return extra
+
+
+def fingerprint(record: logging.LogRecord) -> str:
+    """예외가 있으면 (레벨, stage, 예외 클래스, 스택의 파일:함수), 없으면 (레벨, stage, 숫자를 지운 메시지)."""
+    parts = [record.levelname, getattr(record, "stage", "")]
+    if record.exc_info and record.exc_info[0]:
+        exc_type, _, tb = record.exc_info
+        parts.append(exc_type.__name__)
+        parts += [f"{os.path.basename(f.filename)}:{f.name}" for f in traceback.extract_tb(tb)]
+    else:
+        parts.append(_DIGITS_RE.sub("#", record.getMessage()))
+    return hashlib.sha1("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()[:12]
+
+
+class EventHandler(RotatingFileHandler):
+    def __init__(self, site: str, path: str, max_bytes: int = MAX_BYTES, backups: int = BACKUPS):
+        super().__init__(path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+        self.site = site
+        self.setFormatter(logging.Formatter("%(event_line)s"))
+        self.state_lock = threading.Lock()
+        self.seen: Dict[str, Dict[str, Any]] = {}   # fingerprint → {total, pending, last, ids, msg, ev}
+
+    # ── 사건 → JSON ─────────────────────────────────
+    def event(self, record: logging.LogRecord, fp: str, full: bool) -> Dict[str, Any]:
+        ev = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)),
+            "level": record.levelname,
+            "site": getattr(record, "site", None) or self.site,
+            "post_id": getattr(record, "post_id", None),
+            "stage": getattr(record, "stage", "") or record.funcName,
+            "msg": record.getMessage(),
+            "fingerprint": fp,
+        }
+        if record.exc_info and record.exc_info[0]:
+            ev["error"] = record.exc_info[0].__name__
+            ev["error_msg"] = str(record.exc_info[1])[:300]
+            if full:
+                ev["traceback"] = "".join(traceback.format_exception(*record.exc_info))
+        return ev
+
+    def _write(self, ev: Dict[str, Any]) -> None:
+        line = json.dumps(ev, ensure_ascii=False, default=str)
+        super().emit(logging.makeLogRecord({"event_line": line, "msg": line}))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            fp = fingerprint(record)
+            now = time.monotonic()
+            with self.state_lock:
+                st = self.seen.get(fp)
+                if st is None:
+                    self.seen[fp] = {"total": 1, "pending": 0, "last": now, "msg": record.getMessage(),
+                                     "ids": deque(maxlen=SAMPLE_IDS), "ev": None}
+                    first = True
+                else:
+                    first = False
+                    st["total"] += 1
+                    st["pending"] += 1
+                    st["ids"].append(getattr(record, "post_id", None))
+                    st["ev"] = self.event(record, fp, full=False)
+                    due = st["pending"] >= REPEAT_EVERY or now - st["last"] >= REPEAT_SECS
+            if first:
+                self._write(self.event(record, fp, full=True))
+            elif due:
+                self.flush_repeats(fp)
+        except Exception:
+            self.handleError(record)
+
+    def flush_repeats(self, only: Optional[str] = None) -> None:
+        """세어 두기만 한 반복을 요약 줄로 내보낸다 (only 가 없으면 전부)."""
+        out = []
+        with self.state_lock:
+            for fp, st in self.seen.items():
+                if (only and fp != only) or not st["pending"]:
+                    continue
+                out.append({**st["ev"], "event": "repeat", "count": st["pending"], "total": st["total"],
+                            "post_ids": [i for i in st["ids"] if i is not None]})
+                st["pending"] = 0
+                st["last"] = time.monotonic()
+                st["ids"].clear()
+        for ev in out:
+            self._write(ev)
+
+    def close(self) -> None:
+        self.flush_repeats()
+        super().close()
+
+    def counts(self) -> Dict[str, int]:
+        with self.state_lock:
+            return {fp: st["total"] for fp, st in self.seen.items()}
+
+
+_HANDLER: Optional[EventHandler] = None
+
+
+def setup(site: str, path: Optional[str] = None, level: int = logging.INFO) -> EventHandler:
+    """루트 로거에 EventHandler 를 단다 (logging.basicConfig 대신). 기본 파일: <site>_events.jsonl"""
+    global _HANDLER
+    root = logging.getLogger()
+    if _HANDLER is not None:
+        root.removeHandler(_HANDLER)
+        _HANDLER.close()
+    _HANDLER = EventHandler(site, path or f"{site}_events.jsonl")
+    root.addHandler(_HANDLER)
+    root.setLevel(level)
+    return _HANDLER
+
+
+def summary(top: int = 5) -> str:
+    """이번 실행에서 가장 많이 난 사건 (fingerprint 별 횟수)."""
+    if _HANDLER is None:
+        return "[events] 기록 없음"
+    _HANDLER.flush_repeats()
+    counts = sorted(_HANDLER.counts().items(), key=lambda kv: -kv[1])
+    with _HANDLER.state_lock:
+        lines = [f"  {n}회 {fp}: {_HANDLER.seen[fp]['msg'][:60]}" for fp, n in counts[:top]]
+    return f"[events] 사건 {sum(n for _, n in counts)}건 / 종류 {len(counts)}개 ({_HANDLER.baseFilename})\n" + \
+        ("\n".join(lines) if lines else "  없음")
@@ -0,0 +1,226 @@
+"""
+export.py
+────────────────────────────────────────────────────────────
+글마다 저장된 <out_dir>/<id>.json (또는 shards.py 샤드) 을 사이트별로 나눈 Parquet 두 테이블로 모으는 압축/내보내기 단계.
+• posts    : 글 1개 = 1행 (site, post_id 로 식별, 본문 필드 이름은 content 로 통일)
+• comments : 댓글 1개 = 1행 (site, post_id, idx — idx 는 저장된 순서, 1부터)
+• <dest>/<table>/site=<site>/part-0.parquet  (hive 파티션 → pyarrow.dataset / pandas / duckdb 에서 바로 읽힘)
+• 작성자/IP/날짜 같이 값이 반복되는 문자열은 사전(dictionary) 인코딩, 파일은 zstd 압축
+• BATCH_ROWS 행씩 나눠 쓰므로 글이 수십만 개여도 메모리는 한 배치만큼만 씀
+pyarrow 가 필요하다 (없으면 export() 에서 안내 후 중단, 크롤러는 영향 없음).
+    python -m crawl_core.export [dest=corpus] [site=폴더 ...]
+"""
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from . import pool
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:   # 내보내기를 쓸 때만 필요
+    pa = pq = None
+
+# 저장 파일마다 목록 메타 키 이름이 다르다
+META_KEYS = ("dcbest_meta", "ilbe_meta", "meta")
+
+BATCH_ROWS = 50_000
+COMPRESSION = "zstd"
+
+# 사전 인코딩할 열 (값 종류가 행 수보다 훨씬 적은 것들)
+DICT_COLUMNS = {
+    "posts"   : ["writer", "writer_ip", "date"],
+    "comments": ["author", "author_ip", "date"],
+}
+
+
+def _schemas() -> Dict[str, "pa.Schema"]:
+    text, dict_text = pa.string(), pa.dictionary(pa.int32(), pa.string())
+    labels = [
+        ("Keyword", pa.bool_()),
+        ("keyword_content", pa.list_(dict_text)),
+        ("llm_hate_speech", pa.string()),
+        ("llm_misogyny", pa.string()),
+    ]
+    return {
+        "posts": pa.schema([
+            ("post_id", text),
+            ("title", text),
+            ("url", text),
+            ("writer", dict_text),
+            ("writer_ip", dict_text),
+            ("date", dict_text),
+            ("content", text),
+            ("likes", pa.int32()),
+            ("dislikes", pa.int32()),
+            ("n_comments", pa.int32()),
+            *labels,
+            ("meta", text),          # 목록 메타 (사이트마다 모양이 달라 JSON 문자열)
+        ]),
+        "comments": pa.schema([
+            ("post_id", text),
+            ("idx", pa.int32()),
+            ("author", dict_text),
+            ("author_ip", dict_text),
+            ("date", dict_text),
+            ("content", text),
+            ("likes", pa.int32()),
+            ("dislikes", pa.int32()),
+            *labels,
+        ]),
+    }
+
+
+# ── JSON → 행 ───────────────────────────────────────────────
+def _int(value) -> Optional[int]:
+    try:
+        return int(str(value).replace(",", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _label(value) -> Optional[str]:
+    """llm_* 라벨은 아직 None 이거나 문자열/숫자/dict 가 섞여 있어 문자열로 맞춘다."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _labels(item: Dict) -> Dict:
+    kws = item.get("keyword_content")
+    return {
+        "Keyword": item.get("Keyword"),
+        "keyword_content": list(kws) if isinstance(kws, list) else None,
+        "llm_hate_speech": _label(item.get("llm_hate_speech")),
+        "llm_misogyny": _label(item.get("llm_misogyny")),
+    }
+
+
+def flatten(post_id: str, record: Dict) -> Tuple[Dict, List[Dict]]:
+    """저장 파일 하나 → (posts 행, comments 행 목록)."""
+    post = record.get("post") or {}
+    comments = post.get("comments") or []
+    meta = next((record[k] for k in META_KEYS if k in record), None)
+    row = {
+        "post_id": post_id,
+        "title": post.get("title"),
+        "url": post.get("url"),
+        "writer": post.get("writer"),
+        "writer_ip": post.get("writer_ip"),
+        "date": post.get("date"),
+        "content": post.get("content", post.get("content_text")),
+        "likes": _int(post.get("likes")),
+        "dislikes": _int(post.get("dislikes")),
+        "n_comments": len(comments),
+        **_labels(post),
+        "meta": json.dumps(meta, ensure_ascii=False) if meta is not None else None,
+    }
+    rows = [{
+        "post_id": post_id,
+        "idx": idx,
+        "author": c.get("author"),
+        "author_ip": c.get("author_ip"),
+        "date": c.get("date"),
+        "content": c.get("content"),
+        "likes": _int(c.get("likes")),
+        "dislikes": _int(c.get("dislikes")),
+        **_labels(c),
+    } for idx, c in enumerate(comments, start=1)]
+    return row, rows
+
+
+def iter_records(out_dir: str) -> Iterator[Tuple[str, Dict]]:
+    """(글 번호, 저장된 dict). <id>.json 이든 샤드든 pool.iter_results 가 읽는다."""
+    return pool.iter_results(out_dir)
+
+
+# ── 쓰기 ───────────────────────────────────────────────────
+class _PartWriter:
+    """테이블 하나(한 사이트)의 part 파일. 행을 모았다가 BATCH_ROWS 마다 row group 으로 내보낸다."""
+
+    def __init__(self, path: Path, schema: "pa.Schema", dict_columns: List[str]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.tmp = path.with_suffix(".parquet.tmp")
+        self.schema = schema
+        self.rows: List[Dict] = []
+        self.count = 0
+        self.writer = pq.ParquetWriter(str(self.tmp), schema, compression=COMPRESSION,
+                                       use_dictionary=dict_columns)
+
+    def add(self, rows: List[Dict]) -> None:
+        self.rows.extend(rows)
+        if len(self.rows) >= BATCH_ROWS:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.rows:
+            self.writer.write_table(pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.count += len(self.rows)
+            self.rows = []
+
+    def close(self, ok: bool = True) -> None:
+        if ok:
+            self.flush()
+        self.writer.close()
+        if ok:
+            os.replace(self.tmp, self.path)   # 다 쓴 뒤에만 기존 파일과 교체
+        else:
+            self.tmp.unlink(missing_ok=True)  # 중간에 실패하면 기존 파일은 그대로 둔다
+
+
+def export_site(site: str, out_dir: str, dest: str = "corpus") -> Dict[str, int]:
+    """한 사이트 폴더를 <dest>/posts/site=<site>/, <dest>/comments/site=<site>/ 로 내보낸다."""
+    schemas = _schemas()
+    parts = {
+        table: _PartWriter(Path(dest) / table / f"site={site}" / "part-0.parquet",
+                           schemas[table], DICT_COLUMNS[table])
+        for table in ("posts", "comments")
+    }
+    ok = False
+    try:
+        for post_id, record in iter_records(out_dir):
+            row, rows = flatten(post_id, record)
+            parts["posts"].add([row])
+            parts["comments"].add(rows)
+        ok = True
+    finally:
+        for part in parts.values():
+            part.close(ok)
+    return {table: part.count for table, part in parts.items()}
+
+
+def export(dest: str = "corpus", sites: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, int]]:
+    """sites = {사이트: 결과 폴더} (기본 pool.SITE_DIRS 중 폴더가 있는 것). 반환: {사이트: {posts: 행 수, comments: 행 수}}"""
+    if pa is None:
+        raise RuntimeError("pyarrow 가 필요합니다: pip install pyarrow")
+    sites = sites or {s: d for s, d in pool.SITE_DIRS.items() if os.path.isdir(d)}
+    counts: Dict[str, Dict[str, int]] = {}
+    for site, out_dir in sites.items():
+        t0 = time.monotonic()
+        counts[site] = export_site(site, out_dir, dest)
+        print(f"[export] {site} ({out_dir}) → {dest}: 글 {counts[site]['posts']}개, "
+              f"댓글 {counts[site]['comments']}개 ({time.monotonic() - t0:.1f}초)")
+    return counts
+
+
+def dataset(dest: str = "corpus", table: str = "posts"):
+    """내보낸 테이블을 pyarrow.dataset 으로 연다 (site 열은 폴더 이름에서 채워짐)."""
+    import pyarrow.dataset as ds
+    return ds.dataset(str(Path(dest) / table), format="parquet", partitioning="hive")
+
+
+if __name__ == "__main__":
+    # python -m crawl_core.export [dest=corpus] [site=폴더 ...]   예) python -m crawl_core.export corpus dc=result
+    args = sys.argv[1:]
+    dest = args[0] if args and "=" not in args[0] else "corpus"
+    picked = dict(a.split("=", 1) for a in args if "=" in a)
+    try:
+        export(dest, picked or None)
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
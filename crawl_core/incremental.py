@@ -0,0 +1,64 @@
+"""
+incremental.py
+────────────────────────────────────────────────────────────
+이미 저장한 글(<out_dir>/<id>.json)에 새로 달린 댓글만 덧붙이는 증분 갱신.
+• 저장 방식(<id>.json / 샤드)은 pool.load_result / save_result 가 알아서
+• 저장된 댓글은 (author, date, content) 로 식별 (댓글 고유번호를 저장하지 않으므로)
+• 사이트별 fetch_pages 는 "최신 페이지 → 오래된 페이지" 순으로 댓글 페이지를 하나씩 내놓는 generator
+  (각 페이지 안은 저장 순서와 같은 오래된 → 최신 순)
+• 아는 댓글이 섞인 페이지를 만나면 거기서 멈춤 → 비용이 전체 댓글 수가 아니라 새 댓글 수에 비례
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from . import pool
+
+Key = Tuple[str, str, str]
+
+
+def comment_key(c: Dict) -> Key:
+    return ((c.get("author") or "").strip(), (c.get("date") or "").strip(), (c.get("content") or "").strip())
+
+
+def load_record(out_dir: str, post_id: Any) -> Optional[Dict]:
+    return pool.load_result(out_dir, post_id)
+
+
+def saved_ids(out_dir: str) -> List[str]:
+    """결과 폴더의 글 번호 전체 (최신 글부터 갱신하도록 큰 번호 순)."""
+    return sorted(pool.result_ids(out_dir), key=lambda x: (len(x), x), reverse=True)
+
+
+def collect_new(pages: Iterable[List[Dict]], known: Set[Key]) -> Tuple[List[Dict], int]:
+    """
+    최신 페이지부터 읽으며 known 에 없는 댓글을 모은다. 아는 댓글이 하나라도 있는 페이지에서 멈춘다.
+    반환: (새 댓글 — 오래된 → 최신 순, 읽은 페이지 수)
+    """
+    fresh_pages: List[List[Dict]] = []
+    for page in pages:
+        fresh = [c for c in page if comment_key(c) not in known]
+        fresh_pages.append(fresh)
+        if len(fresh) < len(page):
+            break
+    return [c for page in reversed(fresh_pages) for c in page], len(fresh_pages)
+
+
+def refresh(out_dir: str, post_id: Any,
+            fetch_pages: Callable[[Dict], Iterable[List[Dict]]],
+            on_new: Optional[Callable[[Dict], Any]] = None) -> Optional[Tuple[int, int]]:
+    """
+    저장된 글을 읽어 fetch_pages(record) 로 새 댓글만 받아 post.comments 뒤에 붙이고 다시 저장.
+    on_new 가 있으면 붙이기 전에 새 댓글마다 호출 (예: keywords.tag_comment).
+    저장된 파일이 없으면 None, 있으면 (새 댓글 수, 읽은 댓글 페이지 수).
+    """
+    record = load_record(out_dir, post_id)
+    if record is None:
+        return None
+    comments = record["post"].setdefault("comments", [])
+    new, n_pages = collect_new(fetch_pages(record), {comment_key(c) for c in comments})
+    if new:
+        if on_new is not None:
+            for c in new:
+                on_new(c)
+        comments.extend(new)
+        pool.save_result(out_dir, post_id, record)
+    return len(new), n_pages
@@ -0,0 +1,75 @@
+"""
+keywords.py
+────────────────────────────────────────────────────────────
+혐오 표현 키워드 목록과 태깅. keyword_search.py(저장된 파일 다시 태깅)와
+크롤러의 scrape_post()(저장하기 전에 바로 태깅)가 같은 목록/매처를 쓴다.
+• SPAM_FILTER=True 면 댓글마다 spam.mark() 로 spam / spam_cluster 도 남김 (광고 도배 판정 — 키워드 라벨은 그대로)
+• NORMALIZE=True 면 normalize.py 규칙(띄어쓰기/기호/반복/낱자모)으로 정규화한 뒤 비교 (짧은 키워드는 낱말 경계 확인)
+• tag(): 본문/댓글 dict 하나에 Keyword / keyword_content / keyword_spans 채우기
+• tag_comment() / tag_post(): 댓글 하나 / 글 본문 + 댓글 전부
+"""
+import hashlib
+from typing import Dict, List, Tuple
+
+from . import normalize, spam
+from .matcher import KeywordMatcher
+from .normalize import NormalizedMatcher
+
+# 키워드 리스트 (총 32개)
+KEYWORDS: List[str] = [
+    "bitch", "갈보", "계집신조", "김치녀", "남미새", "노괴", "된장녀",
+    "맘충", "보력지원", "보룡인", "보르노", "보르시", "보슬아치", "보전깨",
+    "상폐녀", "스탑러커", "아이 낳는 기계", "암퇘지", "양공주", "여왕벌",
+    "여자와 북어는 삼일에 한 번씩 패야 맛이 좋아진다", "옐로우 캡", "오또케",
+    "일베녀", "주식 갤러리", "캐런", "피싸개", "피타보라스의 정리",
+    "한녀", "혜지", "화냥년", "흉자"
+]
+
+# True 면 띄어쓰기/기호/반복/낱자모로 돌려 쓴 표현까지 (normalize.py), False 면 원문 그대로 부분 문자열만
+NORMALIZE = True
+
+# True 면 댓글마다 도배 광고 여부(spam.py 근사 중복 군집 + 광고 신호)를 spam 필드로 같이 기록
+SPAM_FILTER = True
+
+# 키워드 전체를 한 번에 찾는 Aho–Corasick 오토마톤 (import 할 때 한 번만 생성)
+MATCHER = NormalizedMatcher(KEYWORDS) if NORMALIZE else KeywordMatcher(KEYWORDS)
+
+# 키워드 목록 + 매칭 방식 지문. 바뀌면 keyword_search 가 캐시를 버리고 전부 다시 태깅
+SIGNATURE = hashlib.sha1(("\n".join(KEYWORDS) + f"\nnormalize={NORMALIZE}:{normalize.RULES}\nspam={SPAM_FILTER}:{spam.RULES}")
+                        .encode("utf-8")).hexdigest()[:12]
+
+# 글 본문 필드 이름 (DC/FM Korea 는 content, ILBE 는 content_text)
+BODY_FIELDS = ("content", "content_text")
+
+
+def tag(item: Dict, text: str) -> List[str]:
+    found, spans = MATCHER.find(text or "")
+    item["Keyword"] = bool(found)
+    item["keyword_content"] = found
+    item["keyword_spans"] = spans
+    return found
+
+
+def tag_comment(comment: Dict, mark_spam: bool = True) -> List[str]:
+    """키워드 태깅 + (SPAM_FILTER 면) 스팸 판정. 스팸이어도 키워드 라벨은 그대로 — spam 필드로 구분."""
+    found = tag(comment, comment.get("content", ""))
+    if SPAM_FILTER and mark_spam:
+        spam.mark(comment)
+    return found
+
+
+def tag_post(post: Dict, mark_spam: bool = True) -> List[Tuple[int, List[str]]]:
+    """
+    본문과 댓글을 태깅. 키워드가 나온 곳만 [(0=본문 / n=댓글 번호, 찾은 키워드)] 로 돌려준다.
+    mark_spam=False 면 스팸 판정은 호출한 쪽이 따로 (keyword_search 는 메인 프로세스에서 한 번에).
+    """
+    body = next((post[k] for k in BODY_FIELDS if k in post), "")
+    hits = []
+    found = tag(post, body)
+    if found:
+        hits.append((0, found))
+    for idx, comment in enumerate(post.get("comments", []), start=1):
+        found = tag_comment(comment, mark_spam)
+        if found:
+            hits.append((idx, found))
+    return hits
@@ -0,0 +1,70 @@
+"""
+matcher.py
+────────────────────────────────────────────────────────────
+키워드 여러 개를 텍스트 한 번 훑기로 모두 찾는 Aho–Corasick 매처.
+• 시작할 때 한 번 만들어 두고(KeywordMatcher(KEYWORDS)) 본문/댓글마다 find() 호출
+• 결과: 찾은 키워드(원래 목록 순서, 중복 없음) + 각 위치 (start, end)
+• 키워드 수가 수백 개로 늘어도 텍스트당 비용은 글자 수에 비례
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Tuple
+
+Span = Tuple[int, int, int]   # (시작, 끝, 키워드 번호)
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = [k for k in dict.fromkeys(keywords) if k]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]   # 상태에서 끝나는 키워드 번호들 (fail 경로 포함)
+        for idx, kw in enumerate(self.keywords):
+            self._add(kw, idx)
+        self._link()
+
+    def _add(self, kw: str, idx: int) -> None:
+        state = 0
+        for ch in kw:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(idx)
+
+    def _link(self) -> None:
+        q = deque(self._goto[0].values())
+        while q:
+            state = q.popleft()
+            for ch, nxt in self._goto[state].items():
+                q.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                cand = self._goto[f].get(ch, 0)
+                self._fail[nxt] = cand if cand != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def spans(self, text: str) -> List[Span]:
+        """text 안의 모든 키워드 위치 (겹치는 것 포함, 끝 위치 순)."""
+        goto, fail, out, kws = self._goto, self._fail, self._out, self.keywords
+        found: List[Span] = []
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for idx in out[state]:
+                found.append((i + 1 - len(kws[idx]), i + 1, idx))
+        return found
+
+    def find(self, text: str) -> Tuple[List[str], List[Dict]]:
+        """(찾은 키워드 — 원래 목록 순서·중복 없음, 위치 목록 [{"keyword", "start", "end"}])."""
+        if not text:
+            return [], []
+        hits = self.spans(text)
+        kws = [self.keywords[i] for i in sorted({idx for _, _, idx in hits})]
+        return kws, [{"keyword": self.keywords[idx], "start": s, "end": e} for s, e, idx in hits]
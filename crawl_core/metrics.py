@@ -0,0 +1,181 @@
+"""
+metrics.py
+────────────────────────────────────────────────────────────
+크롤러 공용 단계별 시간 측정 + 처리량. "저장 ✓" 출력만으로는 어디서 시간이 드는지 알 수 없어서.
+• 단계(stage): list(목록) / post(글 로드) / comment_page(댓글 페이지 1장) / extract(파싱·추출)
+               / tag(키워드) / serialize / write / sleep(간격 유지) — 이름은 자유, 처음 쓰면 생김
+• 단계마다 횟수, 합계, 최근 RESERVOIR 개 표본의 p50 / p95
+• 카운터: posts, comments (pool.save_result 가 셈) → posts/min, comments/sec
+• start(site): SUMMARY_EVERY 초마다 <site>_metrics.json 갱신,
+  CRAWL_METRICS_PORT 가 있으면 http://127.0.0.1:<port>/metrics 로 Prometheus 텍스트 형식도 제공
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, Optional, Tuple
+
+RESERVOIR = 2048
+SUMMARY_EVERY = 30.0
+
+_lock = threading.Lock()
+_samples: Dict[Tuple[str, str], Deque[float]] = defaultdict(lambda: deque(maxlen=RESERVOIR))
+_count: Counter = Counter()
+_total: Dict[Tuple[str, str], float] = defaultdict(float)
+_items: Counter = Counter()          # (site, kind) → 개수
+_started: Dict[str, float] = {}      # site → 처음 기록한 시각
+
+
+def _touch(site: str) -> None:
+    _started.setdefault(site, time.monotonic())
+
+
+def observe(site: str, stage: str, seconds: float) -> None:
+    key = (site, stage)
+    with _lock:
+        _touch(site)
+        _samples[key].append(seconds)
+        _count[key] += 1
+        _total[key] += seconds
+
+
+@contextmanager
+def stage(site: str, name: str):
+    """with 블록 시간을 (site, name) 단계로 기록. 예외가 나도 기록한다."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(site, name, time.perf_counter() - t0)
+
+
+def count(site: str, kind: str, n: int = 1) -> None:
+    with _lock:
+        _touch(site)
+        _items[(site, kind)] += n
+
+
+def _quantile(sorted_vals, q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+
+def snapshot() -> Dict[str, Dict]:
+    """{site: {uptime_s, posts_per_min, comments_per_sec, counters, stages: {이름: count/total_s/avg_s/p50_s/p95_s}}}"""
+    now = time.monotonic()
+    out: Dict[str, Dict] = {}
+    with _lock:
+        for site, t0 in _started.items():
+            up = max(now - t0, 1e-9)
+            out[site] = {
+                "uptime_s": round(up, 1),
+                "posts_per_min": round(_items[(site, "posts")] / up * 60, 2),
+                "comments_per_sec": round(_items[(site, "comments")] / up, 2),
+                "counters": {k: n for (s, k), n in _items.items() if s == site},
+                "stages": {},
+            }
+        for (site, name), vals in _samples.items():
+            vals = sorted(vals)
+            n = _count[(site, name)]
+            out[site]["stages"][name] = {
+                "count": n,
+                "total_s": round(_total[(site, name)], 3),
+                "avg_s": round(_total[(site, name)] / n, 4) if n else 0.0,
+                "p50_s": round(_quantile(vals, 0.5), 4),
+                "p95_s": round(_quantile(vals, 0.95), 4),
+            }
+    return out
+
+
+def prometheus() -> str:
+    """Prometheus 텍스트 노출 형식."""
+    lines = [
+        "# TYPE crawl_stage_seconds summary",
+        "# TYPE crawl_items_total counter",
+    ]
+    for site, s in snapshot().items():
+        for name, st in s["stages"].items():
+            labels = f'site="{site}",stage="{name}"'
+            lines.append(f'crawl_stage_seconds{{{labels},quantile="0.5"}} {st["p50_s"]}')
+            lines.append(f'crawl_stage_seconds{{{labels},quantile="0.95"}} {st["p95_s"]}')
+            lines.append(f"crawl_stage_seconds_sum{{{labels}}} {st['total_s']}")
+            lines.append(f"crawl_stage_seconds_count{{{labels}}} {st['count']}")
+        for kind, n in s["counters"].items():
+            lines.append(f'crawl_items_total{{site="{site}",kind="{kind}"}} {n}')
+        lines.append(f'crawl_posts_per_minute{{site="{site}"}} {s["posts_per_min"]}')
+        lines.append(f'crawl_comments_per_second{{site="{site}"}} {s["comments_per_sec"]}')
+    return "\n".join(lines) + "\n"
+
+
+def write(path: str) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+# ── 노출 (요약 파일 / HTTP) ──────────────────────────────────
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):   # 요청마다 stderr 에 찍지 않음
+        pass
+
+
+_running: Dict[str, threading.Event] = {}
+
+
+def serve(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    print(f"[metrics] http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+
+def start(site: str, path: Optional[str] = None) -> None:
+    """요약 파일을 주기적으로 쓰는 스레드 (+ CRAWL_METRICS_PORT 면 HTTP). 같은 site 로 두 번 불러도 한 번만."""
+    if site in _running:
+        return
+    stop = _running[site] = threading.Event()
+    path = path or f"{site}_metrics.json"
+
+    def loop():
+        while not stop.wait(SUMMARY_EVERY):
+            write(path)
+
+    threading.Thread(target=loop, name=f"{site}-metrics", daemon=True).start()
+    port = os.environ.get("CRAWL_METRICS_PORT")
+    if port and len(_running) == 1:
+        serve(int(port))
+
+
+def stop(site: str, path: Optional[str] = None) -> None:
+    """주기 스레드를 멈추고 마지막 값을 한 번 더 쓴다."""
+    ev = _running.pop(site, None)
+    if ev is not None:
+        ev.set()
+    write(path or f"{site}_metrics.json")
+
+
+def summary(site: str) -> str:
+    s = snapshot().get(site)
+    if not s:
+        return f"[{site}] 단계별 시간 — 기록 없음"
+    lines = [f"[{site}] 단계별 시간 — 글 {s['posts_per_min']}/분, 댓글 {s['comments_per_sec']}/초"]
+    for name, st in sorted(s["stages"].items(), key=lambda kv: -kv[1]["total_s"]):
+        lines.append(f"  {name}: {st['count']}회 합계 {st['total_s']:.1f}s "
+                     f"p50 {st['p50_s']:.3f}s p95 {st['p95_s']:.3f}s")
+    return "\n".join(lines)
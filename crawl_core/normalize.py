@@ -0,0 +1,171 @@
+"""
+normalize.py
+────────────────────────────────────────────────────────────
+띄어쓰기/기호/반복/자모 분리로 돌려 쓴 표현도 키워드에 걸리게 하는 한국어 정규화 + 매처.
+텍스트마다 한 번만 훑어서 정규화하고, 정규화된 글자마다 원문 위치를 같이 기록한다.
+• NFKC (전각 → 반각 등) + 소문자
+• 공백·문장부호·기호 제거          "한 녀", "한.녀", "한*녀"   → "한녀"
+• 같은 글자 연속은 한 글자로        "한녀녀녀", "bitchhh"      → "한녀", "bitch"
+• 낱자모 조합 (호환/조합형 자모)    "ㅎㅏㄴㄴㅕ", "하ㄴ녀"     → "한녀"
+키워드도 같은 규칙으로 정규화해 두고(NormalizedMatcher) Aho–Corasick 한 번으로 찾는다.
+공백을 지우면 낱말 경계를 넘어 걸리므로 ("한 녀석이" → 한녀, "갈 보러" → 갈보, "노괴물" → 노괴),
+SHORT 음절 이하의 한글 키워드는 원문에서 앞뒤 경계를 확인한다:
+앞에 같은 낱말의 음절이 붙어 있으면 버리고, 뒤에는 조사/접미사(SUFFIXES)만 허용 ("한녀들", "한 녀가" 는 통과).
+"""
+import unicodedata
+from typing import Dict, Iterable, List, Tuple
+
+from .matcher import KeywordMatcher
+
+# ── 한글 자모 표 ───────────────────────────────────────────
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"   # 0 = 받침 없음
+_CHO_I = {c: i for i, c in enumerate(_CHO)}
+_JUNG_I = {c: i for i, c in enumerate(_JUNG)}
+_JONG_I = {c: i for i, c in enumerate(_JONG) if i}
+_SYL_BASE, _SYL_LAST = 0xAC00, 0xD7A3
+
+# 조합형(첫가끝) 자모 → 호환 자모
+_CONJOINING: Dict[str, str] = {}
+_CONJOINING.update({chr(0x1100 + i): c for i, c in enumerate(_CHO)})
+_CONJOINING.update({chr(0x1161 + i): c for i, c in enumerate(_JUNG)})
+_CONJOINING.update({chr(0x11A8 + i): c for i, c in enumerate(_JONG[1:])})
+
+_DROP = ("P", "S", "Z", "C")   # 문장부호 / 기호 / 공백 / 제어문자
+
+SHORT = 3   # 이 음절 수 이하의 한글 키워드는 앞뒤 낱말 경계를 본다
+RULES = 2   # 매칭 규칙 판 — 바꾸면 keywords.SIGNATURE 가 달라져 keyword_search 가 전부 다시 태깅
+
+# 짧은 키워드 바로 뒤에 붙어도 되는 말 (앞에 "들" 이 하나 더 붙는 것도 허용: "한녀들이")
+SUFFIXES = frozenset({
+    "", "이", "가", "은", "는", "을", "를", "의", "에", "에게", "한테", "께", "도", "만", "랑", "이랑",
+    "과", "와", "로", "으로", "아", "야", "이야", "이다", "다", "이냐", "냐", "이라", "라", "임", "이네", "네",
+    "같은", "처럼", "들", "년", "년들", "새끼", "짓", "충",
+})
+
+
+def _clean(text: str) -> Tuple[List[str], List[int]]:
+    """NFKC·소문자·자모 통일·기호 제거. (글자 목록, 각 글자의 원문 위치). 반복 축약은 자모 조합 뒤에."""
+    chars: List[str] = []
+    pos: List[int] = []
+    for i, raw in enumerate(text):
+        for ch in unicodedata.normalize("NFKC", raw).lower():
+            ch = _CONJOINING.get(ch, ch)
+            if unicodedata.category(ch)[0] in _DROP:
+                continue
+            chars.append(ch)
+            pos.append(i)
+    return chars, pos
+
+
+def _syllable(cho: int, jung: int, jong: int = 0) -> str:
+    return chr(_SYL_BASE + (cho * 21 + jung) * 28 + jong)
+
+
+def _opens_syllable(ch: str, nxt: str) -> bool:
+    """ch 가 완성 음절이거나, ch+nxt 가 초성+중성으로 음절을 이루면 참."""
+    return bool(ch) and (_SYL_BASE <= ord(ch) <= _SYL_LAST or (ch in _CHO_I and nxt in _JUNG_I))
+
+
+def normalize(text: str) -> Tuple[str, List[int], List[int]]:
+    """
+    정규화된 문자열과, 그 글자마다 원문의 (시작 위치, 끝 위치) 목록.
+    원문 text[starts[i]:ends[i]] 가 정규화 결과의 i 번째 글자에 해당한다.
+    """
+    chars, pos = _clean(text)
+    out: List[str] = []
+    starts: List[int] = []
+    ends: List[int] = []
+    n, i = len(chars), 0
+
+    def emit(ch: str, first: int, last: int) -> None:
+        # 반복 축약: 자모를 조합한 뒤에 비교해야 "ㄴㄴ" 같은 받침+초성이 안 뭉개진다
+        if out and out[-1] == ch:
+            ends[-1] = pos[last] + 1
+            return
+        out.append(ch)
+        starts.append(pos[first])
+        ends.append(pos[last] + 1)
+
+    while i < n:
+        ch = chars[i]
+        nxt = chars[i + 1] if i + 1 < n else ""
+        after = chars[i + 2] if i + 2 < n else ""
+        # 초성 + 중성 (+ 다음 글자가 모음도 아니고 같은 자음 반복(ㅋㅋ)도 아니면 종성)
+        if ch in _CHO_I and nxt in _JUNG_I:
+            fourth = chars[i + 3] if i + 3 < n else ""
+            if after in _JONG_I and fourth not in _JUNG_I and fourth != after:
+                emit(_syllable(_CHO_I[ch], _JUNG_I[nxt], _JONG_I[after]), i, i + 2)
+                i += 3
+            else:
+                emit(_syllable(_CHO_I[ch], _JUNG_I[nxt]), i, i + 1)
+                i += 2
+            continue
+        # 받침 없는 음절 + 낱자음 + 다음 음절 ("하ㄴ녀") → 받침으로. "녀ㅋㅋ" 처럼 뒤에 음절이 없으면 그대로
+        if (ch in _JONG_I and out and _opens_syllable(nxt, after)
+                and _SYL_BASE <= ord(out[-1]) <= _SYL_LAST and (ord(out[-1]) - _SYL_BASE) % 28 == 0):
+            out[-1] = chr(ord(out[-1]) + _JONG_I[ch])
+            ends[-1] = pos[i] + 1
+            i += 1
+            continue
+        emit(ch, i, i)
+        i += 1
+    return "".join(out), starts, ends
+
+
+def normalize_text(text: str) -> str:
+    return normalize(text)[0]
+
+
+def _is_syllable(ch: str) -> bool:
+    return _SYL_BASE <= ord(ch) <= _SYL_LAST
+
+
+def _syllable_run(text: str, i: int, step: int) -> str:
+    """text[i] 부터 step(±1) 방향으로 이어지는 한글 음절들 (공백/기호/낱자모/숫자에서 끊김)."""
+    run: List[str] = []
+    while 0 <= i < len(text) and _is_syllable(text[i]):
+        run.append(text[i])
+        i += step
+    return "".join(run if step > 0 else reversed(run))
+
+
+def bounded(text: str, start: int, end: int) -> bool:
+    """원문 text[start:end] 가 낱말 하나로 서 있는지: 앞에 음절이 안 붙고, 뒤에는 SUFFIXES 만."""
+    if _syllable_run(text, start - 1, -1):
+        return False
+    rest = _syllable_run(text, end, 1)
+    return rest in SUFFIXES or (rest[:1] == "들" and rest[1:] in SUFFIXES)
+
+
+class NormalizedMatcher:
+    """KeywordMatcher 와 같은 find() 인터페이스. 키워드/텍스트 모두 normalize() 를 거쳐 비교하고 위치는 원문 기준."""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = [k for k in dict.fromkeys(keywords) if k]
+        self._order = {k: i for i, k in enumerate(self.keywords)}
+        groups: Dict[str, List[str]] = {}
+        for kw in self.keywords:
+            norm = normalize_text(kw)
+            if norm:
+                groups.setdefault(norm, []).append(kw)
+        self._groups = groups
+        self._matcher = KeywordMatcher(groups)
+        # 경계를 확인할 (정규화된) 키워드 번호
+        self._short = {i for i, norm in enumerate(self._matcher.keywords)
+                       if len(norm) <= SHORT and all(map(_is_syllable, norm))}
+
+    def find(self, text: str) -> Tuple[List[str], List[Dict]]:
+        if not text:
+            return [], []
+        norm, starts, ends = normalize(text)
+        hit_kws = set()
+        spans: List[Dict] = []
+        for s, e, idx in self._matcher.spans(norm):
+            if idx in self._short and not bounded(text, starts[s], ends[e - 1]):
+                continue
+            for kw in self._groups[self._matcher.keywords[idx]]:
+                hit_kws.add(kw)
+                spans.append({"keyword": kw, "start": starts[s], "end": ends[e - 1]})
+        return sorted(hit_kws, key=self._order.__getitem__), spans
@@ -0,0 +1,270 @@
+"""
+pool.py
+────────────────────────────────────────────────────────────
+여러 개의 WebDriver 로 게시글을 병렬 크롤링하는 워커 풀.
+• 워커마다 자기 driver + WebDriverWait 를 따로 가짐 (supervisor.DriverSupervisor 가 교체/멈춤 감시)
+• 공유 큐에서 글 번호(또는 메타 dict)를 꺼내 처리
+• 사이트별 동시 실행 상한(SITE_CONCURRENCY) 적용
+• 결과는 기존과 같은 <out_dir>/<id>.json 으로 저장 (CRAWL_OUTPUT 으로 샤드 / SQLite 선택, 쉼표로 여러 개)
+"""
+import json
+import os
+import queue
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from . import corpus, dedup, events, metrics, shards
+from .supervisor import DriverSupervisor
+
+# ── 사이트별 동시 실행 상한 (차단 방지용) ──────────────────────
+SITE_CONCURRENCY: Dict[str, int] = {
+    "ilbe"   : 4,
+    "dc"     : 4,
+    "fmkorea": 2,
+}
+
+# ── 결과 저장 방식 ─────────────────────────────────────────
+# "json"      : 글마다 <out_dir>/<id>.json (기존 방식)
+# "jsonl"     : <out_dir>/part-NNNNN.jsonl 샤드에 한 줄씩 추가 + shards.idx
+# "jsonl.zst" : 위와 같고 레코드마다 zstd 압축 (zstandard 필요)
+# "sqlite"    : corpus.py 의 posts / comments 테이블 (CRAWL_CORPUS_DB, 기본 corpus.sqlite3)
+# 쉼표로 묶으면 모두에 저장 (예: "json,sqlite")
+OUTPUT = os.environ.get("CRAWL_OUTPUT", "json")
+
+# 저장 직전에 댓글마다 body_id / comment_id 를 채우고 중복 통계를 낸다 (dedup.py)
+DEDUP = True
+
+# 사이트별 결과 폴더 (SQLite 에서는 폴더 대신 site 열로 구분)
+SITE_DIRS: Dict[str, str] = {
+    "dc"     : "result",
+    "ilbe"   : "ilbe_result",
+    "fmkorea": "fm_korea_result",
+}
+
+# 워커 1개당 큐에 미리 쌓아 둘 작업 수. 큐가 차면 producer 가 멈추고, jobs generator(discover.stream)도 더 받지 않는다
+QUEUE_PER_WORKER = 2
+
+_STOP = object()
+
+
+def resolve_workers(site: str, requested: Optional[int] = None) -> int:
+    """요청 값 → 환경변수 CRAWL_WORKERS → 1 순으로 정하고 사이트 상한/코어 수로 자른다."""
+    n = requested or int(os.environ.get("CRAWL_WORKERS", "1"))
+    cap = min(SITE_CONCURRENCY.get(site, 1), os.cpu_count() or 1)
+    return max(1, min(n, cap))
+
+
+def site_of(out_dir: str) -> str:
+    """결과 폴더 → 사이트 이름 (SITE_DIRS 에 없으면 폴더 이름 그대로)."""
+    name = os.path.basename(os.path.normpath(out_dir))
+    return next((site for site, d in SITE_DIRS.items() if d == name), name)
+
+
+def _outputs():
+    return [o.strip() for o in OUTPUT.split(",") if o.strip()]
+
+
+def _after_all(n: int, fn: Optional[Callable[[], None]], label: str) -> Optional[Callable[[], None]]:
+    """n 번 불려야 fn 을 한 번 부르는 콜백 (저장 위치가 여러 개면 모두 디스크에 내려간 뒤에)."""
+    if fn is None:
+        return None
+    left = [n]
+    lock = threading.Lock()
+
+    def done() -> None:
+        with lock:
+            left[0] -= 1
+            if left[0]:
+                return
+        try:
+            fn()
+        except Exception:
+            logging.exception(f"[{label}] 저장 완료 처리 실패", extra=events.ctx(stage="write"))
+    return done
+
+
+def save_result(out_dir: str, post_id: Any, record: Dict,
+                on_saved: Optional[Callable[[], None]] = None) -> Path:
+    """
+    <out_dir>/<post_id>.json 저장. 여러 워커가 동시에 써도 반쯤 쓰인 파일이 남지 않게 임시파일 후 교체.
+    OUTPUT 이 jsonl 계열이면 샤드에 한 줄 추가, sqlite 면 corpus DB 에 넣는다. 첫 번째 저장 위치를 돌려준다.
+    DEDUP 이면 그 전에 dedup.annotate 로 댓글 내용 해시를 채운다.
+    on_saved 는 모든 저장 위치에 실제로 내려간 뒤에 불린다 — 샤드는 fsync, corpus 는 COMMIT 때까지 늦어질 수 있으므로
+    체크포인트 done 은 여기서 (그 전에 꺼지면 다음 실행에서 다시 받는다). 남은 것은 flush_outputs() 로.
+    직렬화 / 쓰기 시간은 metrics 의 serialize / write 단계로, 글·댓글 수는 posts / comments 카운터로.
+    """
+    site = site_of(out_dir)
+    post = record.get("post")
+    if DEDUP and isinstance(post, dict):
+        dedup.annotate(post, site)
+    kinds = _outputs()
+    done = _after_all(len(kinds), on_saved, f"{site}/{post_id}")
+    saved = []
+    for kind in kinds:
+        if kind == "sqlite":
+            with metrics.stage(site, "write"):
+                corpus.open_corpus().put(site, post_id, record, on_commit=done)
+            saved.append(Path(corpus.CORPUS_DB))
+        elif kind.startswith("jsonl"):
+            with metrics.stage(site, "write"):
+                store = shards.open_store(out_dir, compress=kind.endswith(".zst"))
+                saved.append(store.put(post_id, record, on_sync=done))
+        else:
+            path = Path(out_dir) / f"{post_id}.json"
+            tmp = path.with_suffix(f".json.{threading.get_ident()}.tmp")
+            with metrics.stage(site, "serialize"):
+                text = json.dumps(record, ensure_ascii=False, indent=2)
+            with metrics.stage(site, "write"):
+                tmp.write_text(text, "utf-8-sig")
+                os.replace(tmp, path)
+            saved.append(path)
+            if done is not None:
+                done()
+    metrics.count(site, "posts")
+    if isinstance(post, dict):
+        metrics.count(site, "comments", len(post.get("comments") or []))
+    return saved[0]
+
+
+def flush_outputs(out_dir: str) -> None:
+    """몰아서 쓰는 저장 위치(corpus 배치 / 샤드 fsync)를 지금 내려서 남은 on_saved 콜백까지 부른다."""
+    for kind in _outputs():
+        if kind == "sqlite" and corpus.has_corpus():
+            corpus.open_corpus().flush()
+        elif kind.startswith("jsonl") and shards.has_shards(out_dir):
+            shards.open_store(out_dir).sync()
+
+
+def result_ids(out_dir: str) -> Set[str]:
+    """저장된 글 번호 전체 (<id>.json 파일 + 샤드 인덱스 + corpus DB). 폴더는 한 번만 훑는다."""
+    ids: Set[str] = set()
+    if os.path.isdir(out_dir):
+        ids = {e.name[:-5] for e in os.scandir(out_dir) if e.is_file() and e.name.endswith(".json")}
+        if shards.has_shards(out_dir):
+            ids |= shards.open_store(out_dir).ids()
+    if corpus.has_corpus():
+        ids |= corpus.open_corpus().ids(site_of(out_dir))
+    return ids
+
+
+def _load_json(out_dir: str, post_id: Any) -> Optional[Dict]:
+    path = Path(out_dir) / f"{post_id}.json"
+    if not path.exists():
+        return None
+    with open(path, encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def _sources(out_dir: str):
+    """저장 위치별 읽기 함수. 지금 OUTPUT 의 첫 저장 위치를 맨 앞에 (가장 최근에 쓴 곳)."""
+    found = {"json": lambda pid: _load_json(out_dir, pid)}
+    if shards.has_shards(out_dir):
+        found["jsonl"] = shards.open_store(out_dir).get
+    if corpus.has_corpus():
+        db, site = corpus.open_corpus(), site_of(out_dir)
+        found["sqlite"] = lambda pid: db.get(site, pid)
+    first = _outputs()[0].split(".")[0] if _outputs() else "json"
+    return sorted(found.items(), key=lambda kv: kv[0] != first)
+
+
+def load_result(out_dir: str, post_id: Any) -> Optional[Dict]:
+    """저장된 글 하나. 지금 OUTPUT 의 저장 위치부터 (<id>.json / 샤드 / corpus DB) 찾고, 없으면 None."""
+    for _, load in _sources(out_dir):
+        record = load(post_id)
+        if record is not None:
+            return record
+    return None
+
+
+def iter_results(out_dir: str) -> Iterator[Tuple[str, Dict]]:
+    """(글 번호, 저장된 dict) 전부. 여러 곳에 있는 글은 load_result 와 같은 우선순위로 한 번만, 깨진 .json 은 건너뜀."""
+    seen: Set[str] = set()
+    for kind, _ in _sources(out_dir):
+        if kind == "sqlite":
+            items = corpus.open_corpus().items(site_of(out_dir))
+        elif kind == "jsonl":
+            items = shards.open_store(out_dir).items()
+        else:
+            items = _iter_json(out_dir)
+        for pid, record in items:
+            if pid not in seen:
+                seen.add(pid)
+                yield pid, record
+
+
+def _iter_json(out_dir: str) -> Iterator[Tuple[str, Dict]]:
+    if not os.path.isdir(out_dir):
+        return
+    names = sorted((e.name for e in os.scandir(out_dir) if e.is_file() and e.name.endswith(".json")),
+                   key=lambda n: (len(n), n))
+    for name in names:
+        try:
+            with open(os.path.join(out_dir, name), encoding="utf-8-sig") as f:
+                yield name[:-5], json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[{out_dir}] 건너뜀 {name}: {e}")
+
+
+def run_pool(site: str,
+             jobs: Iterable[Any],
+             handle: Callable[[Any, Any, Any], None],
+             make_driver: Optional[Callable[[], Any]],
+             workers: Optional[int] = None,
+             wait_timeout: int = 10) -> Dict[str, int]:
+    """
+    jobs 를 큐에 넣고 workers 개의 WebDriver 로 handle(job, driver, wait) 를 실행한다.
+    jobs 는 generator 여도 되며(목록 페이지를 읽는 대로 흘려보내기), 별도 스레드에서 큐로 옮겨진다.
+    큐는 workers × QUEUE_PER_WORKER 개까지만 — 워커가 밀리면 producer 가 put 에서 기다린다.
+    make_driver 가 None 이면 브라우저 없이 handle(job, None, None) 으로 호출한다 (HTTP 전용 경로).
+    브라우저가 죽거나 멈춰서 실패한 작업은 그 워커가 새 브라우저로 다시 처리한다 (DriverSupervisor.run).
+    반환값: {"done": 성공 건수, "failed": 예외 건수, "workers": 실제 워커 수}
+    """
+    n = resolve_workers(site, workers)
+    q: "queue.Queue[Any]" = queue.Queue(maxsize=n * QUEUE_PER_WORKER)
+    stats = {"done": 0, "failed": 0, "workers": n}
+    lock = threading.Lock()
+
+    def producer():
+        try:
+            for job in jobs:
+                q.put(job)
+        finally:
+            for _ in range(n):
+                q.put(_STOP)
+
+    def worker(idx: int):
+        # 브라우저는 첫 작업에서 띄움 (make_driver 가 None 이면 끝까지 안 띄움)
+        sup = DriverSupervisor(make_driver, f"{site}/worker{idx}", wait_timeout) if make_driver else None
+        try:
+            while True:
+                job = q.get()
+                if job is _STOP:
+                    break
+                try:
+                    if sup:
+                        ok = sup.run(handle, job)
+                    else:
+                        handle(job, None, None)
+                        ok = True
+                    with lock:
+                        stats["done" if ok else "failed"] += 1
+                except Exception:
+                    logging.exception(f"[{site}/worker{idx}] {job} 처리 실패", extra=events.ctx(job, "worker", site))
+                    with lock:
+                        stats["failed"] += 1
+        finally:
+            if sup:
+                sup.quit()
+
+    threads = [threading.Thread(target=producer, name=f"{site}-producer", daemon=True)]
+    threads += [threading.Thread(target=worker, args=(i,), name=f"{site}-worker{i}", daemon=True)
+                for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f"[{site}] 워커 {n}개 완료: 성공 {stats['done']} / 실패 {stats['failed']}")
+    return stats
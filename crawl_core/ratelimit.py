@@ -0,0 +1,288 @@
+"""
+ratelimit.py
+────────────────────────────────────────────────────────────
+모든 크롤러의 요청(requests / driver.get / 댓글 페이지 전환)이 거쳐 가는 호스트별 속도 제한기.
+• 호스트마다 토큰 버킷 하나 (워커가 여러 개여도 같은 버킷을 공유)
+• AIMD: 응답이 빠르면 조금씩 속도↑, 타임아웃/에러 페이지면 절반으로↓
+  (브라우저 페이지는 문서의 HTTP 상태로 판정. DOM 조건 대기 타임아웃은 서버 탓이 아니므로 반영 안 함 — discard())
+• 카운터는 stats() / write_stats() 로 내보냄
+• 요청마다 걸린 시간은 stage 이름(list / post / comment_page …)으로 metrics 에도 기록
+• asyncio 쪽(discover.py)도 acquire_async / request_async 로 같은 버킷을 쓴다
+"""
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+from . import metrics
+
+# ── 사이트 → 호스트 ──────────────────────────────────────────
+SITE_HOSTS: Dict[str, str] = {
+    "ilbe"   : "www.ilbe.com",
+    "dc"     : "gall.dcinside.com",
+    "fmkorea": "www.fmkorea.com",
+}
+
+_HOST_SITES = {host: site for site, host in SITE_HOSTS.items()}
+
+# ── 호스트별 설정: 시작/최소/최대 속도(요청/초), 버스트, 목표 지연(초) ─────────
+HOST_LIMITS: Dict[str, Dict[str, float]] = {
+    "www.ilbe.com"     : {"rate": 1.0, "min_rate": 0.2, "max_rate": 4.0, "burst": 2, "target": 2.0},
+    "gall.dcinside.com": {"rate": 2.0, "min_rate": 0.3, "max_rate": 8.0, "burst": 4, "target": 1.0},
+    "www.fmkorea.com"  : {"rate": 0.5, "min_rate": 0.1, "max_rate": 2.0, "burst": 1, "target": 2.0},
+}
+DEFAULT_LIMIT = {"rate": 1.0, "min_rate": 0.2, "max_rate": 4.0, "burst": 2, "target": 2.0}
+
+ADD_STEP     = 0.05   # 빠른 응답 1회당 늘리는 속도 (요청/초)
+SLOW_FACTOR  = 0.8    # 목표 지연의 2배를 넘으면 곱하는 값
+ERROR_FACTOR = 0.5    # 타임아웃/에러면 곱하는 값
+
+ERROR_STATUS = {403, 429, 500, 502, 503, 504}
+
+# 브라우저로 연 문서의 HTTP 상태 (Navigation Timing 의 responseStatus, Chrome 109+). 못 읽으면 0
+_STATUS_JS = "var n = performance.getEntriesByType('navigation')[0]; return (n && n.responseStatus) || 0;"
+# 상태를 못 읽을 때만: 제목 "전체"가 이 중 하나면 에러 페이지 (부분 일치는 "503번 버스" 같은 글 제목에 걸림)
+ERROR_TITLES = {
+    "403 forbidden", "429 too many requests", "500 internal server error", "502 bad gateway",
+    "503 service unavailable", "504 gateway time-out", "504 gateway timeout",
+    "access denied", "just a moment...", "attention required! | cloudflare",
+}
+
+
+class HostLimiter:
+    """토큰 버킷 + AIMD 속도 조절 + 카운터."""
+
+    def __init__(self, host: str, rate: float, min_rate: float, max_rate: float,
+                 burst: float, target: float):
+        self.host = host
+        self.rate, self.min_rate, self.max_rate = rate, min_rate, max_rate
+        self.burst, self.target = burst, target
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self.lock = threading.Lock()
+        self.counters = {"requests": 0, "ok": 0, "errors": 0, "timeouts": 0,
+                         "speedups": 0, "slowdowns": 0, "waited_s": 0.0, "latency_s": 0.0}
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def try_acquire(self, waited: float = 0.0) -> float:
+        """토큰이 있으면 1개 쓰고 0, 없으면 다음 토큰까지 남은 초. waited 는 지금까지 기다린 시간 (카운터용)."""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.counters["requests"] += 1
+                self.counters["waited_s"] += waited
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> float:
+        """토큰 1개를 얻을 때까지 대기. 기다린 시간을 돌려준다."""
+        waited = 0.0
+        while True:
+            need = self.try_acquire(waited)
+            if need <= 0:
+                return waited
+            time.sleep(need)
+            waited += need
+
+    async def acquire_async(self) -> float:
+        """acquire() 의 asyncio 판: 토큰을 기다리는 동안 이벤트 루프를 막지 않는다."""
+        waited = 0.0
+        while True:
+            need = self.try_acquire(waited)
+            if need <= 0:
+                return waited
+            await asyncio.sleep(need)
+            waited += need
+
+    def report(self, latency: float, ok: bool = True, timeout: bool = False) -> None:
+        """요청 결과를 반영해 속도 조절 (AIMD)."""
+        with self.lock:
+            self.counters["latency_s"] += latency
+            if timeout or not ok:
+                self.counters["timeouts" if timeout else "errors"] += 1
+                self.rate = max(self.min_rate, self.rate * ERROR_FACTOR)
+                self.counters["slowdowns"] += 1
+            elif latency > self.target * 2:
+                self.counters["ok"] += 1
+                self.rate = max(self.min_rate, self.rate * SLOW_FACTOR)
+                self.counters["slowdowns"] += 1
+            else:
+                self.counters["ok"] += 1
+                if latency < self.target and self.rate < self.max_rate:
+                    self.rate = min(self.max_rate, self.rate + ADD_STEP)
+                    self.counters["speedups"] += 1
+
+    def snapshot(self) -> Dict:
+        with self.lock:
+            n = max(1, self.counters["ok"] + self.counters["errors"] + self.counters["timeouts"])
+            return {**self.counters, "rate": round(self.rate, 3),
+                    "avg_latency_s": round(self.counters["latency_s"] / n, 3)}
+
+
+_registry: Dict[str, HostLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def for_host(host: str) -> HostLimiter:
+    with _registry_lock:
+        lim = _registry.get(host)
+        if lim is None:
+            lim = _registry[host] = HostLimiter(host, **HOST_LIMITS.get(host, DEFAULT_LIMIT))
+        return lim
+
+
+def use_host(site: str, host: str, limit: Optional[Dict[str, float]] = None) -> None:
+    """
+    site 의 요청을 다른 호스트로 보낼 때 (bench 의 로컬 픽스처 서버). 단계별 시간은 그대로 site 이름으로 기록되고,
+    limit 이 없으면 원래 호스트의 속도 설정을 그대로 쓴다.
+    """
+    limit = limit or HOST_LIMITS.get(SITE_HOSTS.get(site, site), DEFAULT_LIMIT)
+    with _registry_lock:
+        SITE_HOSTS[site] = host
+        _HOST_SITES[host] = site
+        HOST_LIMITS[host] = dict(limit)
+        _registry.pop(host, None)
+
+
+def for_site(site: str) -> HostLimiter:
+    return for_host(SITE_HOSTS.get(site, site))
+
+
+def for_url(url: str) -> HostLimiter:
+    return for_host(urlsplit(url).netloc)
+
+
+def _is_timeout(e: BaseException) -> bool:
+    # requests.Timeout / selenium TimeoutException 둘 다 이름으로 구분 (여기서 selenium 을 import 하지 않음)
+    return any("Timeout" in cls.__name__ for cls in type(e).__mro__)
+
+
+class Tracked:
+    """track() 이 넘겨주는 요청 1건. discard() 하면 결과를 속도 조절에 반영하지 않는다."""
+
+    def __init__(self):
+        self.counted = True
+
+    def discard(self) -> None:
+        self.counted = False
+
+
+@contextmanager
+def track(lim: HostLimiter, stage: str = "fetch"):
+    """
+    with 블록 = 요청 1건. 들어갈 때 토큰을 얻고, 나올 때 지연/예외로 속도를 조절.
+    블록 안에서 discard() 한 요청(마지막 댓글 페이지에서 DOM 대기가 끝까지 간 경우 등)은 반영하지 않는다.
+    """
+    lim.acquire()
+    req = Tracked()
+    t0 = time.monotonic()
+    try:
+        yield req
+    except BaseException as e:
+        if req.counted:
+            _report(lim, stage, time.monotonic() - t0, ok=False, timeout=_is_timeout(e))
+        raise
+    else:
+        if req.counted:
+            _report(lim, stage, time.monotonic() - t0)
+
+
+def _report(lim: HostLimiter, stage: str, latency: float, ok: bool = True, timeout: bool = False) -> None:
+    lim.report(latency, ok=ok, timeout=timeout)
+    metrics.observe(_HOST_SITES.get(lim.host, lim.host), stage, latency)
+
+
+def request(sess, method: str, url: str, stage: str = "fetch", **kwargs):
+    """sess.request 를 속도 제한 아래에서 실행. 403/429/5xx 는 에러로 보고 속도를 줄인다."""
+    lim = for_url(url)
+    lim.acquire()
+    t0 = time.monotonic()
+    try:
+        res = sess.request(method, url, **kwargs)
+    except Exception as e:
+        _report(lim, stage, time.monotonic() - t0, ok=False, timeout=_is_timeout(e))
+        raise
+    _report(lim, stage, time.monotonic() - t0, ok=res.status_code not in ERROR_STATUS)
+    return res
+
+
+async def request_async(send: Callable[[], Awaitable], url: str, stage: str = "fetch"):
+    """request() 의 asyncio 판: send() 코루틴(응답에 status_code 가 있는 요청 1건)을 같은 버킷 아래에서."""
+    lim = for_url(url)
+    await lim.acquire_async()
+    t0 = time.monotonic()
+    try:
+        res = await send()
+    except Exception as e:
+        _report(lim, stage, time.monotonic() - t0, ok=False, timeout=_is_timeout(e))
+        raise
+    _report(lim, stage, time.monotonic() - t0, ok=res.status_code not in ERROR_STATUS)
+    return res
+
+
+def get(sess, url: str, **kwargs):
+    return request(sess, "GET", url, **kwargs)
+
+
+def post(sess, url: str, **kwargs):
+    return request(sess, "POST", url, **kwargs)
+
+
+def is_error_page(drv) -> bool:
+    """지금 열린 문서가 403/429/5xx 에러 페이지인지. HTTP 상태를 먼저 보고, 못 읽으면 제목 전체로."""
+    try:
+        status = int(drv.execute_script(_STATUS_JS) or 0)
+    except Exception:
+        status = 0
+    if status:
+        return status in ERROR_STATUS
+    try:
+        title = (drv.title or "").strip().lower()
+    except Exception:
+        return False
+    return title in ERROR_TITLES
+
+
+def navigate(drv, url: str, stage: str = "fetch") -> None:
+    """driver.get 을 속도 제한 아래에서 실행. 에러 페이지면 속도만 줄이고 진행."""
+    lim = for_url(url)
+    lim.acquire()
+    t0 = time.monotonic()
+    try:
+        drv.get(url)
+    except Exception as e:
+        _report(lim, stage, time.monotonic() - t0, ok=False, timeout=_is_timeout(e))
+        raise
+    _report(lim, stage, time.monotonic() - t0, ok=not is_error_page(drv))
+
+
+def stats() -> Dict[str, Dict]:
+    with _registry_lock:
+        lims = list(_registry.values())
+    return {lim.host: lim.snapshot() for lim in lims}
+
+
+def write_stats(path: str = "ratelimit_stats.json") -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(stats(), f, ensure_ascii=False, indent=2)
+
+
+def summary(site: Optional[str] = None) -> str:
+    rows = stats()
+    if site is not None:
+        host = SITE_HOSTS.get(site, site)
+        rows = {h: v for h, v in rows.items() if h == host}
+    if not rows:
+        return "[ratelimit] 기록 없음"
+    return "\n".join(
+        f"[ratelimit] {h}: 요청 {v['requests']} (에러 {v['errors']}, 타임아웃 {v['timeouts']}), "
+        f"현재 {v['rate']}/s, 평균 지연 {v['avg_latency_s']}s, 대기 {v['waited_s']:.1f}s"
+        for h, v in rows.items()
+    )
@@ -0,0 +1,254 @@
+"""
+shards.py
+────────────────────────────────────────────────────────────
+글마다 파일을 하나씩 만드는 대신, 한 줄짜리 레코드를 샤드 파일에 이어 붙이는 저장 방식.
+(dc_archive.txt 규모 — dcbest 33만 글 + 일베 몇 년치 — 에서 파일 생성/메타데이터 비용을 없애기 위함)
+• <out_dir>/part-00000.jsonl (또는 .jsonl.zst) 에 {"id": 글번호, ...저장 dict} 한 줄씩 추가만 함
+• 샤드가 MAX_SHARD_BYTES 를 넘으면 다음 번호로 넘어감
+• <out_dir>/shards.idx : "글번호 \t 샤드 \t 위치 \t 길이" 한 줄씩 → 글 하나를 바로 읽을 수 있음
+  같은 글을 다시 저장하면(증분 갱신) 새 줄이 뒤에 붙고 인덱스는 마지막 것을 가리킴
+• 쓰기마다 OS 로 넘기고(flush), fsync 는 FSYNC_EVERY 건 / FSYNC_SECS 초마다 몰아서
+  put(on_sync=…) 의 콜백은 그 레코드가 fsync 된 뒤에 불림 → 체크포인트는 그때 done
+• 비정상 종료 뒤 다시 열면 인덱스에 없는 꼬리 레코드를 읽어 인덱스를 채우고, 반쯤 쓰인 줄은 잘라냄
+• .zst 는 레코드마다 zstd 프레임 하나 (zstandard 필요). 파일 전체가 그대로 zstd -d 로 풀리는 JSONL
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import zstandard
+except ImportError:   # 압축 샤드를 쓸 때만 필요
+    zstandard = None
+
+INDEX_FILE = "shards.idx"
+MAX_SHARD_BYTES = 256 * 2**20
+FSYNC_EVERY = 200
+FSYNC_SECS = 5.0
+ZSTD_LEVEL = 6
+
+Entry = Tuple[int, int, int]   # (샤드 번호, 위치, 길이)
+
+
+def _shard_name(no: int, compress: bool) -> str:
+    return f"part-{no:05d}.jsonl" + (".zst" if compress else "")
+
+
+def has_shards(out_dir: str) -> bool:
+    return os.path.exists(os.path.join(out_dir, INDEX_FILE))
+
+
+class ShardStore:
+    def __init__(self, out_dir: str, compress: bool = False):
+        if compress and zstandard is None:
+            raise RuntimeError("압축 샤드(jsonl.zst)에는 zstandard 가 필요합니다: pip install zstandard")
+        self.dir = Path(out_dir)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.compress = compress
+        self.lock = threading.Lock()
+        self.index: Dict[str, Entry] = {}
+        self.unsynced = 0
+        self.on_sync: List[Callable[[], None]] = []
+        self.last_sync = time.monotonic()
+        self._cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL) if compress else None
+        self._load_index()
+        self.shard = max((e[0] for e in self.index.values()), default=0)
+        self._recover_tail()
+        self._open_shard()
+
+    # ── 인덱스 ─────────────────────────────────────
+    def _load_index(self) -> None:
+        path = self.dir / INDEX_FILE
+        if not path.exists():
+            return
+        sizes: Dict[int, int] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) != 4:
+                    continue   # 끊긴 마지막 줄
+                pid, no, off, length = parts[0], int(parts[1]), int(parts[2]), int(parts[3])
+                if no not in sizes:
+                    shard = self.dir / _shard_name(no, self.compress)
+                    sizes[no] = shard.stat().st_size if shard.exists() else 0
+                if off + length <= sizes[no]:   # fsync 전에 꺼져 데이터가 없는 항목은 버림
+                    self.index[pid] = (no, off, length)
+
+    def _recover_tail(self) -> None:
+        """마지막 샤드에서 인덱스가 가리키는 끝 뒤에 남은 레코드를 인덱스에 넣고, 반쯤 쓰인 꼬리는 잘라냄."""
+        path = self.dir / _shard_name(self.shard, self.compress)
+        if not path.exists():
+            return
+        end = max((off + n for no, off, n in self.index.values() if no == self.shard), default=0)
+        size = path.stat().st_size
+        if size <= end:
+            return
+        with open(path, "rb") as f:
+            f.seek(end)
+            tail = f.read()
+        recovered = []
+        pos = 0
+        while pos < len(tail):
+            blob = self._next_blob(tail, pos)
+            if blob is None:
+                break
+            try:
+                pid = str(json.loads(self._decode(blob))["id"])
+            except (ValueError, KeyError):
+                break
+            recovered.append((pid, (self.shard, end + pos, len(blob))))
+            pos += len(blob)
+        if end + pos < size:
+            with open(path, "r+b") as f:
+                f.truncate(end + pos)
+        with open(self.dir / INDEX_FILE, "a", encoding="utf-8") as idx:
+            for pid, entry in recovered:
+                self.index[pid] = entry
+                idx.write(f"{pid}\t{entry[0]}\t{entry[1]}\t{entry[2]}\n")
+        if recovered:
+            print(f"[shards] {self.dir}: 인덱스에 없던 레코드 {len(recovered)}개 복구")
+
+    def _next_blob(self, data: bytes, pos: int) -> Optional[bytes]:
+        """data[pos:] 의 첫 레코드 바이트 (줄 하나 / zstd 프레임 하나). 완전하지 않으면 None."""
+        if not self.compress:
+            nl = data.find(b"\n", pos)
+            return data[pos:nl + 1] if nl >= 0 else None
+        dobj = zstandard.ZstdDecompressor().decompressobj()
+        try:
+            dobj.decompress(data[pos:])
+        except zstandard.ZstdError:
+            return None
+        if not dobj.eof:
+            return None
+        return data[pos:len(data) - len(dobj.unused_data)]
+
+    # ── 인코딩 ─────────────────────────────────────
+    def _encode(self, post_id: str, record: Dict) -> bytes:
+        line = json.dumps({"id": post_id, **record}, ensure_ascii=False, separators=(",", ":")) + "\n"
+        data = line.encode("utf-8")
+        return self._cctx.compress(data) if self.compress else data
+
+    def _decode(self, blob: bytes) -> str:
+        if self.compress:
+            blob = zstandard.ZstdDecompressor().decompress(blob)
+        return blob.decode("utf-8")
+
+    # ── 쓰기 ───────────────────────────────────────
+    def _open_shard(self) -> None:
+        self.path = self.dir / _shard_name(self.shard, self.compress)
+        self.fh = open(self.path, "ab")
+        self.pos = self.fh.tell()
+        self.idx = open(self.dir / INDEX_FILE, "a", encoding="utf-8")
+
+    def put(self, post_id: Any, record: Dict, on_sync: Optional[Callable[[], None]] = None) -> Path:
+        """레코드 한 줄 추가. on_sync 는 이 레코드가 fsync 된 뒤에 불린다 (바로일 수도, 다음 _sync 일 수도)."""
+        pid = str(post_id)
+        blob = self._encode(pid, record)
+        with self.lock:
+            if on_sync is not None:
+                self.on_sync.append(on_sync)
+            self.fh.write(blob)
+            self.fh.flush()
+            self.idx.write(f"{pid}\t{self.shard}\t{self.pos}\t{len(blob)}\n")
+            self.idx.flush()
+            self.index[pid] = (self.shard, self.pos, len(blob))
+            self.pos += len(blob)
+            self.unsynced += 1
+            path = self.path
+            if self.unsynced >= FSYNC_EVERY or time.monotonic() - self.last_sync >= FSYNC_SECS:
+                self._sync()
+            if self.pos >= MAX_SHARD_BYTES:
+                self._rotate()
+        return path
+
+    def sync(self) -> None:
+        with self.lock:
+            if not self.fh.closed:
+                self._sync()
+
+    def _sync(self) -> None:
+        os.fsync(self.fh.fileno())
+        os.fsync(self.idx.fileno())
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        done, self.on_sync = self.on_sync, []
+        for fn in done:
+            fn()
+
+    def _rotate(self) -> None:
+        self._sync()
+        self.fh.close()
+        self.idx.close()
+        self.shard += 1
+        self._open_shard()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.fh.closed:
+                return
+            self._sync()
+            self.fh.close()
+            self.idx.close()
+
+    # ── 읽기 ───────────────────────────────────────
+    def ids(self) -> Set[str]:
+        return set(self.index)
+
+    def __contains__(self, post_id: Any) -> bool:
+        return str(post_id) in self.index
+
+    def get(self, post_id: Any) -> Optional[Dict]:
+        entry = self.index.get(str(post_id))
+        if entry is None:
+            return None
+        no, off, length = entry
+        with open(self.dir / _shard_name(no, self.compress), "rb") as f:
+            f.seek(off)
+            record = json.loads(self._decode(f.read(length)))
+        record.pop("id", None)
+        return record
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """(글 번호, 최신 레코드). 샤드 순서대로 읽어서 디스크를 앞에서부터 훑는다."""
+        for pid, _ in sorted(self.index.items(), key=lambda kv: kv[1]):
+            yield pid, self.get(pid)
+
+
+# ── 폴더별 저장소 (프로세스 안에서 하나씩) ────────────────────
+_STORES: Dict[str, ShardStore] = {}
+_LOCK = threading.Lock()
+
+
+def _format_on_disk(out_dir: str) -> Optional[bool]:
+    """이미 있는 샤드가 압축이면 True, 비압축이면 False, 샤드가 없으면 None."""
+    names = [p.name for p in Path(out_dir).glob("part-*")]
+    return any(n.endswith(".jsonl.zst") for n in names) if names else None
+
+
+def open_store(out_dir: str, compress: Optional[bool] = None) -> ShardStore:
+    """
+    out_dir 의 샤드 저장소. compress 가 None 이면 이미 있는 샤드 형식을 따른다 (없으면 비압축).
+    한 폴더의 인덱스는 한 형식만 가리키므로, 이미 있는 형식과 다른 compress 를 주면 RuntimeError.
+    """
+    key = os.path.abspath(out_dir)
+    with _LOCK:
+        store = _STORES.get(key)
+        existing = store.compress if store is not None else _format_on_disk(out_dir)
+        if compress is not None and existing is not None and compress != existing:
+            have, want = ("jsonl.zst", "jsonl") if existing else ("jsonl", "jsonl.zst")
+            raise RuntimeError(f"{out_dir} 에는 이미 {have} 샤드가 있음 (요청: {want}) — "
+                               f"CRAWL_OUTPUT 을 맞추거나 다른 폴더를 쓰세요")
+        if store is None:
+            store = _STORES[key] = ShardStore(out_dir, bool(existing) if compress is None else compress)
+        return store
+
+
+@atexit.register
+def close_all() -> None:
+    with _LOCK:
+        for store in _STORES.values():
+            store.close()
@@ -0,0 +1,5 @@
+"""
+crawl_core.sites
+────────────────────────────────────────────────────────────
+engine.SiteAdapter 구현 — 사이트별 셀렉터, 목록 파서, 댓글 페이저, 증분 갱신.
+"""
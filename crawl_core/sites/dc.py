@@ -0,0 +1,288 @@
+"""
+DC 실베(dcbest) 어댑터 — 목록 없이 글 번호 범위를 그대로 돈다.
+글 문서를 한 번만 받아 메타 / 댓글 수 / 본문을 모두 파싱하고 (ASYNC_DISCOVER 면 discover 로 여러 글을 동시에 미리 받아 거름),
+HTTP 경로(http_fast_path)면 댓글도 AJAX(board/comment/)로 받는다. 실패할 때만 Selenium 으로 한 번 더 연다.
+미리 받은 글은 문서(HTML) 대신 파싱한 값(메타 / 본문 필드 / 댓글 AJAX 폼)만 작업 dict 에 실어 보낸다
+→ 대기 중인 글의 메모리는 (discover.BACKLOG + 풀 큐 길이) × 글 본문 크기.
+"""
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import bs4
+from selenium.webdriver.common.by import By
+
+from .. import checkpoint, events, metrics, ratelimit, snapshot
+from ..engine import Engine, SiteAdapter, Skip, labels, page_end
+
+BASE = "https://gall.dcinside.com"
+VIEW_PATH = "/board/view/"
+COMMENT_PATH = "/board/comment/"   # 댓글 AJAX (POST)
+MAX_COMMENT_PAGES = 200
+NAV_RECENT = 1024   # save_note 용으로 글별 로드 횟수를 기억해 두는 최근 글 수 (그 밖은 합계만)
+NAV_SAMPLE = 20     # 요약에 번호를 보여 줄 "2회 이상 로드된 글" 수
+
+to_comment = snapshot.dc_comment_row   # AJAX row → 댓글 dict (댓글돌이/삭제/빈 댓글은 None)
+
+
+def _hidden(soup: bs4.BeautifulSoup, name: str, default: str = "") -> str:
+    tag = soup.select_one(f"input#{name}, input[name='{name}']")
+    return tag.get("value", default) if tag else default
+
+
+def comment_form(no: int, soup: bs4.BeautifulSoup) -> Dict:
+    gall_id = _hidden(soup, "gallery_id", "dcbest") or "dcbest"
+    return {
+        "id"        : gall_id,
+        "no"        : no,
+        "cmt_id"    : gall_id,
+        "cmt_no"    : no,
+        "e_s_n_o"   : _hidden(soup, "e_s_n_o"),
+        "sort"      : "",
+        "_GALLTYPE_": _hidden(soup, "_GALLTYPE_", "G") or "G",
+    }
+
+
+class DcAdapter(SiteAdapter):
+    site = "dc"
+    base = BASE
+    out_dir = "result"
+    meta_key = "dcbest_meta"
+    id_key = "no"
+    id_type = int
+    wait_timeout = 10
+    headers = {
+        "User-Agent": "Mozilla/5.0 Chrome/124 Safari/537.36",
+        "Referer"   : "https://gall.dcinside.com/",
+    }
+    has_list = False
+    can_refresh = True
+    refresh_browser = False   # 증분 갱신은 댓글 AJAX 만 씀
+    start_prompt = "시작 글 번호≫ "
+
+    post_ready = "div.gallview_head"
+    parse_post = staticmethod(snapshot.parse_dc_post)
+    parse_comments = staticmethod(snapshot.parse_dc_comments)
+
+    comments_ready = "div.clear.cmt_txtbox p.usertxt, div.comment_dccon"
+    comment_item = "li.ub-content, li.ub-w"
+    comment_fields = {
+        "text" : "div.clear.cmt_txtbox p.usertxt",
+        "dccon": "div.comment_dccon",
+        "nick" : "div.cmt_nickbox span.nickname, span.nickname",
+        "date" : "span.date_time, span.gall_date, span.ut",
+    }
+
+    def __init__(self, out_dir: Optional[str] = None, http_fast_path: bool = True,
+                 min_comments: Optional[int] = 300, base: Optional[str] = None):
+        """
+        http_fast_path: 댓글/본문을 requests 로 바로 받기 (False 면 항상 Selenium, 워커마다 브라우저)
+        min_comments: 댓글이 이 수 이하인 글은 저장하지 않음 (None 이면 거르지 않음)
+        """
+        super().__init__(out_dir, base)
+        self.http_fast_path = http_fast_path
+        self.needs_browser = not http_fast_path
+        self.min_comments = min_comments
+        # 글별 문서 로드(네비게이션) 횟수. 정상이라면 글 1개 = 1회.
+        # 글별 값은 최근 NAV_RECENT 개만, 요약은 누적 합계 → 며칠을 돌려도 크기 일정
+        self._navs: "OrderedDict[int, int]" = OrderedDict()
+        self.nav_total = 0
+        self.nav_posts = 0
+        self.nav_extra = 0
+        self.nav_extra_ids: List[int] = []
+        self._nav_lock = threading.Lock()
+
+    def count_nav(self, no: int) -> None:
+        with self._nav_lock:
+            n = self._navs.pop(no, 0) + 1
+            self._navs[no] = n
+            if len(self._navs) > NAV_RECENT:
+                self._navs.popitem(last=False)
+            self.nav_total += 1
+            if n == 1:
+                self.nav_posts += 1
+            elif n == 2:
+                self.nav_extra += 1
+                if len(self.nav_extra_ids) < NAV_SAMPLE:
+                    self.nav_extra_ids.append(no)
+
+    def navs(self, no: int) -> int:
+        with self._nav_lock:
+            return self._navs.get(no, 0)
+
+    # ── 글 문서 1회 로드 ────────────────────────────────────
+    def fetch_post_doc(self, eng: Engine, no: int) -> Optional[Tuple[str, bs4.BeautifulSoup]]:
+        """글 페이지를 한 번만 받아 (최종 URL, soup). 메타/댓글 수/본문 파싱이 모두 이걸 재사용."""
+        self.count_nav(no)
+        res = eng.get(self.base + VIEW_PATH, params={"id": "dcbest", "no": no, "_dcbest": 6}, stage="post")
+        if res.status_code != 200:
+            return None
+        return res.url, bs4.BeautifulSoup(res.text, "lxml")
+
+    def check_doc(self, no: int, doc: Optional[Tuple[str, bs4.BeautifulSoup]]) -> Dict:
+        """글 문서 → 메타. 삭제됐거나 댓글 수가 min_comments 이하면 Skip."""
+        meta = snapshot.parse_dc_meta(no, *doc) if doc else {}
+        if not meta:
+            raise Skip("삭제/블라인드")
+        if self.min_comments is not None:
+            try:
+                n = snapshot.dc_comment_count(doc[1])
+            except Exception:
+                logging.exception(f"[{no}] 댓글 수 확인 실패", extra=events.ctx(no, "meta"))
+                raise Skip("댓글 수 파싱 실패", checkpoint.FAILED)
+            if n <= self.min_comments:
+                raise Skip(f"댓글 {n}개")
+        return meta
+
+    def post_job(self, no: int, doc: Optional[Tuple[str, bs4.BeautifulSoup]]) -> Dict:
+        """
+        글 문서 → 작업 {no, url, meta, fields, form}. 저장할 글이 아니면 Skip.
+        문서는 여기서 버린다 — HTTP 경로에 필요한 본문 필드와 댓글 AJAX 폼만 파싱해 둔다.
+        """
+        meta = self.check_doc(no, doc)
+        url, soup = doc
+        job = {"no": no, "url": url, "meta": meta, "fields": None, "form": None}
+        if self.http_fast_path:
+            with metrics.stage(self.site, "extract"):
+                job["fields"] = snapshot.parse_dc_post(soup, url)
+            job["form"] = comment_form(no, soup)
+        return job
+
+    # ── 글 머리 미리 받기 (engine.ASYNC_DISCOVER) ────────────
+    def head_request(self, no: int) -> Tuple[str, Dict]:
+        return self.base + VIEW_PATH, {"id": "dcbest", "no": no, "_dcbest": 6}
+
+    def parse_head(self, no: int, html: str, url: str) -> Dict:
+        """미리 받은 글 문서로 거르기. 통과한 글은 post_job 으로 — fetch() 가 문서를 다시 받지 않는다."""
+        self.count_nav(no)
+        return self.post_job(no, (url, bs4.BeautifulSoup(html, "lxml")))
+
+    def fetch(self, eng: Engine, job, drv=None, wt=None) -> Tuple[Dict, Dict]:
+        """메타 → 댓글 수 필터 → 본문/댓글 (HTTP 경로, 실패하면 Selenium). job 은 글 번호 또는 parse_head 의 작업."""
+        if not isinstance(job, dict):   # 미리 받지 못한 글 → 여기서 받는다
+            job = self.post_job(job, self.fetch_post_doc(eng, job))
+        no, url = job["no"], job["url"]
+
+        post = None
+        if self.http_fast_path:
+            try:
+                post = self.http_scrape_post(eng, job)
+            except Exception:
+                logging.exception(f"[{no}] HTTP 경로 실패 → Selenium 으로 재시도", extra=events.ctx(no, "http"))
+        if post is None:
+            self.count_nav(no)
+            post = eng.borrow(lambda d, w: eng.scrape_post(url, d, w), drv, wt)
+        return job["meta"], post
+
+    def save_note(self, no: int, meta: Dict) -> str:
+        return f", 로드 {self.navs(no)}회"
+
+    # ── HTTP 경로 (브라우저 없이) ────────────────────────────
+    def fetch_comment_page(self, eng: Engine, form: Dict, url: str, page: int) -> Tuple[List[Dict], int]:
+        """댓글 AJAX 한 페이지 → (원본 row 목록, total_cnt)."""
+        res = ratelimit.post(eng.sess, self.base + COMMENT_PATH, data={**form, "comment_page": page},
+                             headers={"X-Requested-With": "XMLHttpRequest", "Referer": url}, timeout=10,
+                             stage="comment_page")
+        res.raise_for_status()
+        data = res.json()
+        return data.get("comments") or [], int(data.get("total_cnt") or 0)
+
+    def http_fetch_comments(self, eng: Engine, url: str, form: Dict) -> List[Dict]:
+        """comment_page=1,2,… 로 전부 수집. memo 는 HTML 조각이라 lxml 로 텍스트만 뽑는다."""
+        comments: List[Dict] = []
+        seen = set()
+        for page in range(1, MAX_COMMENT_PAGES + 1):
+            rows, total = self.fetch_comment_page(eng, form, url, page)
+            fresh = [c for c in rows if c.get("no") not in seen]
+            if not fresh:
+                break
+            for c in fresh:
+                seen.add(c.get("no"))
+                item = to_comment(c)
+                if item:
+                    comments.append(item)
+            if len(seen) >= total:
+                break
+        return comments
+
+    def http_scrape_post(self, eng: Engine, job: Dict) -> Dict:
+        """eng.scrape_post() 와 같은 구조의 dict 를 post_job 이 파싱해 둔 본문 필드 + 댓글 AJAX 로 만든다 (글 재요청 없음)."""
+        return eng.finish_post(job["fields"], self.http_fetch_comments(eng, job["url"], job["form"]))
+
+    def newest_comment_pages(self, eng: Engine, no: int, record: Dict, drv=None, wt=None) -> Iterator[List[Dict]]:
+        """
+        1페이지로 전체 댓글 수/페이지 크기를 알아낸 뒤 마지막(최신) 페이지 → 1페이지 순.
+        incremental.collect_new 가 아는 댓글을 만나면 generator 를 더 돌리지 않으므로 그 뒤 요청은 안 나간다.
+        """
+        doc = self.fetch_post_doc(eng, no)
+        if not doc:
+            return
+        url, soup = doc
+        form = comment_form(no, soup)
+        first, total = self.fetch_comment_page(eng, form, url, 1)
+        if not first:
+            return
+        last = min(MAX_COMMENT_PAGES, -(-total // len(first)))
+        for page in range(last, 1, -1):
+            rows, _ = self.fetch_comment_page(eng, form, url, page)
+            yield [c for c in map(to_comment, rows) if c]
+        yield [c for c in map(to_comment, first) if c]
+
+    # ── Selenium 경로 ───────────────────────────────────────
+    def read_post_fields(self, drv, url: str) -> Dict:
+        head = drv.find_element(By.CSS_SELECTOR, "div.gallview_head")
+        nick = head.find_element(By.CSS_SELECTOR, ".nickname").text
+        ip_m = re.search(r"\((.*?)\)", nick)
+
+        def cnt(sel: str) -> int:
+            els = drv.find_elements(By.CSS_SELECTOR, sel)
+            return int(els[0].text.replace(",", "")) if els else 0
+
+        return {
+            "title"     : head.find_element(By.CSS_SELECTOR, ".title_subject").text.strip(),
+            "url"       : url,
+            "writer"    : nick.split("(")[0].strip(),
+            "writer_ip" : ip_m.group(1) if ip_m else "—",
+            "date"      : head.find_element(By.CSS_SELECTOR, ".gall_date").text.strip(),
+            "content"   : drv.find_element(By.CSS_SELECTOR, "div.write_div").text.strip(),
+            "likes"     : cnt("span.upcnt, #recommend_point, span.gall_recommend"),
+            "dislikes"  : cnt("span.downcnt, #non_recommend_point, span.gall_non_recommend"),
+        }
+
+    def comment_row(self, r: Dict[str, Optional[str]]) -> Optional[Dict]:
+        text = r["text"] if r["text"] is not None else r["dccon"]
+        if not text or r["nick"] is None or r["date"] is None:
+            return None
+        ip_m = re.search(r"\((.*?)\)", r["nick"])
+        return {
+            "author"   : r["nick"].split("(")[0].strip(),
+            "author_ip": ip_m.group(1) if ip_m else "—",
+            "date"     : r["date"],
+            "content"  : text,
+            **labels(),
+        }
+
+    def comment_pages(self, eng: Engine, drv, wt, html: Optional[str]) -> Iterator:
+        yield eng.extract(drv, wt)
+        while True:
+            try:
+                cur = drv.find_element(By.CSS_SELECTOR, "div.cmt_paging em")
+                nxt = cur.find_element(By.XPATH, "following-sibling::a[1]")
+                # 현재 페이지 표시가 바뀌고 이전 댓글 DOM 이 교체될 때까지만 대기
+                eng.turn_page(drv, "div.cmt_paging em", nxt.text.strip(), "arguments[0].click();", nxt)
+                fut = eng.extract(drv, wt)
+            except Exception as e:
+                if not page_end(e):
+                    raise
+                break
+            yield fut
+
+    def report(self) -> None:
+        """글당 문서 로드 횟수 요약. 1회를 넘긴 글은 Selenium 대체 경로를 탄 글이다."""
+        if not self.nav_posts:
+            return
+        print(f"로드 {self.nav_total}회 / 글 {self.nav_posts}개 (평균 {self.nav_total / self.nav_posts:.2f}회)")
+        if self.nav_extra:
+            print(f"  · 2회 이상 로드된 글 {self.nav_extra}개: {sorted(self.nav_extra_ids)}")
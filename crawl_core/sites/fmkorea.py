@@ -0,0 +1,129 @@
+"""
+FM Korea 베스트 어댑터 — 목록(li.li_best2_pop0: HTTP 로 받아 파싱, 안 되면 브라우저 또는 requests) / 글(div.rd_hd) /
+댓글 페이지는 div.bd_pg 의 다음 번호 링크를 눌러 넘긴다.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from .. import snapshot
+from ..engine import Engine, SiteAdapter, labels, page_end
+
+BASE = "https://www.fmkorea.com"
+
+
+class FmKoreaAdapter(SiteAdapter):
+    site = "fmkorea"
+    base = BASE
+    out_dir = "fm_korea_result"
+    meta_key = "meta"
+    id_key = "no"
+    count_key = "comment_count"
+    id_type = int
+    wait_timeout = 20
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        "Referer": "https://www.fmkorea.com/",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive"
+    }
+    start_prompt = "시작 베스트 페이지 번호≫ "
+    end_prompt = "끝 베스트 페이지 번호≫  "
+
+    post_ready = "div.rd_hd"
+    parse_post = staticmethod(snapshot.parse_fmkorea_post)
+    parse_comments = staticmethod(snapshot.parse_fmkorea_comments)
+
+    comments_ready = "ul.fdb_lst_ul li.fdb_itm"
+    comment_item = "ul.fdb_lst_ul li.fdb_itm"
+    comment_fields = {
+        "author": "div.meta a.member_plate",
+        "date": "div.meta span.date",
+        "content": "div.comment-content .xe_content",
+    }
+
+    def __init__(self, out_dir: Optional[str] = None, selenium_list: bool = True, base: Optional[str] = None):
+        """selenium_list: 비동기 목록(engine.ASYNC_DISCOVER)이 못 읽은 페이지를 브라우저로 열지 (False 면 requests)."""
+        super().__init__(out_dir, base)
+        self.selenium_list = selenium_list
+
+    def list_posts(self, eng: Engine, page: int) -> List[Dict]:
+        if self.selenium_list:
+            html = eng.open_list(f"{self.base}/index.php?mid=best&page={page}", "li.li_best2_pop0")
+        else:
+            url, params = self.list_request(page)
+            res = eng.get(url, params=params, stage="list")
+            res.raise_for_status()
+            html = res.text
+        return snapshot.parse_fmkorea_list(html, self.base)
+
+    def list_request(self, page: int) -> Tuple[str, Dict]:
+        return f"{self.base}/index.php", {"mid": "best", "page": page}
+
+    def parse_list(self, page: int, html: str, url: str) -> List[Dict]:
+        return snapshot.parse_fmkorea_list(html, self.base)
+
+    def read_post_fields(self, drv, url: str) -> Dict:
+        head = drv.find_element(By.CSS_SELECTOR, "div.rd_hd")
+        title = head.find_element(By.CSS_SELECTOR, "h1.np_18px span").text.strip()
+        author_plate = head.find_element(By.CSS_SELECTOR, "a.member_plate").text.strip()
+        ip_m = re.search(r"\((.*?)\)", author_plate)
+        writer = author_plate.split("(")[0].strip()
+        date = head.find_element(By.CSS_SELECTOR, "span.date").text.strip()
+
+        def cnt(sel: str) -> int:
+            els = drv.find_elements(By.CSS_SELECTOR, sel)
+            if not els:
+                return 0
+            text = els[0].text.replace(",", "").strip()
+            try:
+                return int(text)
+            except ValueError:
+                return 0
+
+        content = drv.find_element(By.CSS_SELECTOR, "article .xe_content").text.strip()
+
+        return {
+            "title": title,
+            "url": url,
+            "writer": writer,
+            "writer_ip": ip_m.group(1) if ip_m else "—",
+            "date": date,
+            "content": content,
+            "likes": cnt("span.btn_img.new_voted_count"),
+            "dislikes": cnt("a.vote3"),
+        }
+
+    def comment_row(self, r: Dict[str, Optional[str]]) -> Optional[Dict]:
+        if None in (r["author"], r["date"], r["content"]):
+            return None
+        return {
+            "author": r["author"],
+            "author_ip": "—",
+            "date": r["date"],
+            "content": r["content"],
+            **labels(),
+        }
+
+    def comment_pages(self, eng: Engine, drv, wt, html: Optional[str]) -> Iterator:
+        yield eng.extract(drv, wt)
+        current_page = 1
+        while True:
+            try:
+                next_page = str(current_page + 1)
+                pg = drv.find_element(By.CSS_SELECTOR, "div.bd_pg")
+                target = next((a for a in pg.find_elements(By.CSS_SELECTOR, "a") if a.text.strip() == next_page), None)
+                if target is None:
+                    break
+                # 고정 sleep 대신: 현재 페이지 표시가 바뀌고 댓글 목록이 교체될 때까지
+                eng.turn_page(drv, "div.bd_pg strong.this", next_page, "arguments[0].click();", target, timeout=20)
+                fut = eng.extract(drv, wt)
+            except Exception as e:
+                if not page_end(e):
+                    raise
+                break
+            current_page += 1
+            yield fut
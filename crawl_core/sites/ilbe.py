@@ -0,0 +1,133 @@
+"""
+ILBE 어댑터 — 목록(ul.board-body: HTTP 로 받아 파싱, 안 되면 브라우저로 열어 스냅샷) / 글(div.post-content) /
+댓글 페이지는 사이트 함수 loadComment(n) 을 1 → 마지막 순으로 호출.
+"""
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import certifi
+from selenium.webdriver.common.by import By
+
+from .. import snapshot
+from ..engine import Engine, SiteAdapter, labels, page_end
+
+BASE = "https://www.ilbe.com"
+LIST_PATH = "/list/ilbe"
+
+
+class IlbeAdapter(SiteAdapter):
+    site = "ilbe"
+    base = BASE
+    out_dir = "ilbe_result"
+    meta_key = "ilbe_meta"
+    id_key = "id"
+    count_key = "comments"
+    wait_timeout = 15
+    headers = {
+        "User-Agent": "Mozilla/5.0 Chrome/124 Safari/537.36",
+        "Referer": "https://www.ilbe.com/",
+    }
+    verify = certifi.where()
+    can_refresh = True
+    start_prompt = "시작 리스트 페이지≫ "
+
+    post_ready = "div.post-content"
+    parse_post = staticmethod(snapshot.parse_ilbe_post)
+    parse_comments = staticmethod(snapshot.parse_ilbe_comments)
+
+    comments_ready = "div.comment-item-box"
+    comment_item = "div.comment-item"
+    comment_fields = {
+        "author": "span.global-nick.nick a",
+        "date": "span.date-line",
+        "text": "span.cmt",
+        "good": "em[id^='cnt_good_']",
+        "bad": "em[id^='cnt_bad_']",
+    }
+
+    def list_posts(self, eng: Engine, page: int) -> List[Dict]:
+        url = f"{self.base}{LIST_PATH}?page={page}&listStyle=list"
+        return snapshot.parse_ilbe_list(eng.open_list(url, "ul.board-body > li"), self.base)
+
+    def list_request(self, page: int) -> Tuple[str, Dict]:
+        return self.base + LIST_PATH, {"page": page, "listStyle": "list"}
+
+    def parse_list(self, page: int, html: str, url: str) -> List[Dict]:
+        return snapshot.parse_ilbe_list(html, self.base)
+
+    def read_post_fields(self, drv, url: str) -> Dict:
+        try:
+            title = drv.find_element(By.CSS_SELECTOR, "meta[property='og:title']").get_attribute("content")
+        except Exception:
+            title = drv.title
+
+        nick_raw = drv.find_element(By.CSS_SELECTOR, "span.nick").text.strip()
+        ip_m = re.search(r"\((.*?)\)", nick_raw)
+        date = drv.find_element(By.CSS_SELECTOR, "span.date").text.strip()
+
+        content_div = drv.find_element(By.CSS_SELECTOR, "div.post-content")
+        text_parts = [
+            p.text.strip()
+            for p in content_div.find_elements(By.CSS_SELECTOR, "p")
+            if p.text.strip()
+        ]
+        img_tags = content_div.find_elements(By.CSS_SELECTOR, "img")
+        images = [img.get_attribute("src") for img in img_tags if img.get_attribute("src")]
+
+        def cnt(sel: str) -> int:
+            els = drv.find_elements(By.CSS_SELECTOR, sel)
+            if not els:
+                return 0
+            txt = els[0].text.replace(",", "").strip()
+            try:
+                return int(txt)
+            except ValueError:
+                return 0
+
+        return {
+            "title": title,
+            "url": url,
+            "writer": nick_raw.split("(")[0].strip(),
+            "writer_ip": ip_m.group(1) if ip_m else "—",
+            "date": date,
+            "content_text": "\n".join(text_parts),
+            "content_images": images,
+            "likes": cnt("span.recomm-vote > em, span.recomm"),
+            "dislikes": cnt("span.recomm-vote.bad > em, span.non-recomm"),
+        }
+
+    def comment_row(self, r: Dict[str, Optional[str]]) -> Optional[Dict]:
+        if r["author"] is None or r["date"] is None or r["text"] is None:
+            return None
+        return {
+            "author": r["author"],
+            "date": r["date"],
+            "content": r["text"],
+            "likes": r["good"] if r["good"] is not None else "0",
+            "dislikes": r["bad"] if r["bad"] is not None else "0",
+            **labels(),
+        }
+
+    def load_comments(self, eng: Engine, drv, p: int) -> None:
+        # 고정 sleep 대신: 이전 댓글 DOM 이 교체되고 페이지 표시가 p 가 될 때까지
+        eng.turn_page(drv, "div.paginate a.page-on", str(p), f"loadComment({p});", required=False)
+
+    def comment_pages(self, eng: Engine, drv, wt, html: Optional[str]) -> Iterator:
+        max_page = snapshot.ilbe_comment_max_page(html if html is not None else drv.page_source)
+        for p in range(1, max_page + 1):
+            try:
+                self.load_comments(eng, drv, p)
+                fut = eng.extract(drv, wt)
+            except Exception as e:
+                if not page_end(e):
+                    raise
+                break
+            yield fut
+
+    def newest_comment_pages(self, eng: Engine, art_id, record: Dict, drv=None, wt=None) -> Iterator[List[Dict]]:
+        """댓글 마지막(최신) 페이지 → 1페이지 순으로 loadComment(n)."""
+        url = record.get(self.meta_key, {}).get("url") or f"{self.base}/view/{art_id}"
+        drv, wt = eng.open_post(url, drv, wt)
+        for p in range(snapshot.ilbe_comment_max_page(drv.page_source), 0, -1):
+            self.load_comments(eng, drv, p)
+            yield snapshot.parse_ilbe_comments(drv.page_source)
@@ -0,0 +1,409 @@
+"""
+snapshot.py
+────────────────────────────────────────────────────────────
+브라우저 밖에서 HTML 스냅샷(driver.page_source / requests 응답 / 저장된 .html)을 파싱하는 모듈.
+• 셀렉터는 import 시 한 번만 컴파일 (soupsieve)
+• scrape_post() 의 본문 필드, extract() 의 댓글 필드와 같은 구조의 dict 를 돌려줌
+• 목록 페이지(parse_*_list)와 DC 댓글 AJAX row 도 여기서 → 크롤러와 bench.py 가 같은 코드를 씀
+• selenium 을 import 하지 않으므로 프로세스 풀에서 돌려도 브라우저가 뜨지 않음
+"""
+import re
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+import bs4
+import soupsieve as sv
+
+Doc = Union[str, bs4.BeautifulSoup]
+
+_IP_RE = re.compile(r"\((.*?)\)")
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def _soup(doc: Doc) -> bs4.BeautifulSoup:
+    """문자열이면 lxml 로 파싱. <br> 은 줄바꿈으로 바꿔 WebElement.text 와 비슷한 텍스트를 만든다."""
+    soup = doc if isinstance(doc, bs4.BeautifulSoup) else bs4.BeautifulSoup(doc, "lxml")
+    for br in soup.find_all("br"):
+        br.replace_with("\n")
+    return soup
+
+
+def _text(tag: Optional[bs4.Tag]) -> Optional[str]:
+    return tag.get_text().strip() if tag is not None else None
+
+
+def _count(root: bs4.Tag, sel: sv.SoupSieve) -> int:
+    tag = sel.select_one(root)
+    if tag is None:
+        return 0
+    try:
+        return int(tag.get_text().replace(",", "").strip())
+    except ValueError:
+        return 0
+
+
+# 글/댓글 dict 끝에 붙는 라벨 필드. engine.labels 가 이것 — engine 은 selenium 을 import 하므로 여기 둔다
+LABELS = ("llm_hate_speech", "llm_misogyny", "Keyword", "keyword_content")
+
+
+def labels() -> Dict:
+    """빈 라벨 필드 (LLM 분류 · 키워드 태깅이 나중에 채움)."""
+    return dict.fromkeys(LABELS)
+
+
+# ── ILBE ────────────────────────────────────────────────────
+ILBE = {
+    "og_title"    : sv.compile("meta[property='og:title']"),
+    "title"       : sv.compile("title"),
+    "nick"        : sv.compile("span.nick"),
+    "date"        : sv.compile("span.date"),
+    "content"     : sv.compile("div.post-content"),
+    "p"           : sv.compile("p"),
+    "img"         : sv.compile("img"),
+    "likes"       : sv.compile("span.recomm-vote > em, span.recomm"),
+    "dislikes"    : sv.compile("span.recomm-vote.bad > em, span.non-recomm"),
+    "cmt_item"    : sv.compile("div.comment-item"),
+    "cmt_author"  : sv.compile("span.global-nick.nick a"),
+    "cmt_date"    : sv.compile("span.date-line"),
+    "cmt_text"    : sv.compile("span.cmt"),
+    "cmt_good"    : sv.compile("em[id^='cnt_good_']"),
+    "cmt_bad"     : sv.compile("em[id^='cnt_bad_']"),
+    "cmt_pages"   : sv.compile("div.paginate a"),
+    "list_item"   : sv.compile("ul.board-body > li"),
+    "list_cmt"    : sv.compile("span.comment a"),
+    "list_title"  : sv.compile("span.title a.subject"),
+}
+_ILBE_VIEW_RE = re.compile(r"/view/(\d+)")
+
+
+def parse_ilbe_list(doc: Doc, base: str = "https://www.ilbe.com") -> List[Dict]:
+    """ILBE 목록 페이지 → [{id, url, comments}]. 공지/광고 줄과 댓글 수가 없는 줄은 건너뜀."""
+    soup = _soup(doc)
+    posts: List[Dict] = []
+    for li in ILBE["list_item"].select(soup):
+        classes = li.get("class", [])
+        if "notice-line" in classes or "ad-line" in classes:
+            continue
+        c_tag = ILBE["list_cmt"].select_one(li)
+        t_tag = ILBE["list_title"].select_one(li)
+        if not (c_tag and t_tag):
+            continue
+        try:
+            comment_cnt = int(c_tag.get_text().strip())
+        except ValueError:
+            continue
+        m = _ILBE_VIEW_RE.search(t_tag.get("href", ""))
+        if not m:
+            continue
+        art_id = int(m.group(1))
+        posts.append({"id": art_id, "url": f"{base}/view/{art_id}", "comments": comment_cnt})
+    return posts
+
+
+def parse_ilbe_post(doc: Doc, url: str) -> Dict:
+    """ILBE 글 본문 필드 (comments 제외)."""
+    soup = _soup(doc)
+    og = ILBE["og_title"].select_one(soup)
+    title = og.get("content") if og is not None else (_text(ILBE["title"].select_one(soup)) or "")
+    nick_raw = _text(ILBE["nick"].select_one(soup)) or ""
+    ip_m = _IP_RE.search(nick_raw)
+    content_div = ILBE["content"].select_one(soup)
+    if content_div is None:
+        raise ValueError("div.post-content 없음")
+    text_parts = [t for t in (_text(p) for p in ILBE["p"].select(content_div)) if t]
+    images = [img.get("src") for img in ILBE["img"].select(content_div) if img.get("src")]
+
+    return {
+        "title": title,
+        "url": url,
+        "writer": nick_raw.split("(")[0].strip(),
+        "writer_ip": ip_m.group(1) if ip_m else "—",
+        "date": _text(ILBE["date"].select_one(soup)) or "",
+        "content_text": "\n".join(text_parts),
+        "content_images": images,
+        "likes": _count(soup, ILBE["likes"]),
+        "dislikes": _count(soup, ILBE["dislikes"]),
+    }
+
+
+def parse_ilbe_comments(doc: Doc) -> List[Dict]:
+    soup = _soup(doc)
+    out: List[Dict] = []
+    for itm in ILBE["cmt_item"].select(soup):
+        author = _text(ILBE["cmt_author"].select_one(itm))
+        date_c = _text(ILBE["cmt_date"].select_one(itm))
+        text_c = _text(ILBE["cmt_text"].select_one(itm))
+        if None in (author, date_c, text_c):
+            continue
+        good = _text(ILBE["cmt_good"].select_one(itm))
+        bad = _text(ILBE["cmt_bad"].select_one(itm))
+        out.append({
+            "author": author,
+            "date": date_c,
+            "content": text_c,
+            "likes": good if good is not None else "0",
+            "dislikes": bad if bad is not None else "0",
+            **labels(),
+        })
+    return out
+
+
+def ilbe_comment_max_page(doc: Doc) -> int:
+    soup = _soup(doc)
+    nums = [int(t) for t in (_text(a) for a in ILBE["cmt_pages"].select(soup)) if t and t.isdigit()]
+    return max(nums) if nums else 1
+
+
+# ── DC Inside ───────────────────────────────────────────────
+DC = {
+    "head"        : sv.compile("div.gallview_head"),
+    "nick"        : sv.compile(".nickname"),
+    "ip"          : sv.compile("span.ip"),
+    "title"       : sv.compile(".title_subject"),
+    "date"        : sv.compile(".gall_date"),
+    "body"        : sv.compile("div.write_div"),
+    "likes"       : sv.compile("span.upcnt, #recommend_point, span.gall_recommend"),
+    "dislikes"    : sv.compile("span.downcnt, #non_recommend_point, span.gall_non_recommend"),
+    "cmt_item"    : sv.compile("li.ub-content, li.ub-w"),
+    "cmt_text"    : sv.compile("div.clear.cmt_txtbox p.usertxt"),
+    "cmt_dccon"   : sv.compile("div.comment_dccon"),
+    "cmt_nick"    : sv.compile("div.cmt_nickbox span.nickname, span.nickname"),
+    "cmt_date"    : sv.compile("span.date_time, span.gall_date, span.ut"),
+    "meta_nick"   : sv.compile("span.nickname"),
+    "cmt_count"   : sv.compile("span.gall_comment a"),
+}
+
+
+def parse_dc_meta(no: int, url: str, doc: Doc) -> Dict:
+    """실베 글 머리의 메타 (dcbest_meta). 글이 없으면 {} (삭제/블라인드)."""
+    head = DC["head"].select_one(_soup(doc))
+    if head is None:
+        return {}
+    nick = DC["meta_nick"].select_one(head).get_text(strip=True)
+    ip_m = _IP_RE.search(nick)
+    return {
+        "no"       : no,
+        "url"      : url,
+        "title"    : DC["title"].select_one(head).get_text(strip=True),
+        "author"   : nick.split("(")[0].strip(),
+        "author_ip": ip_m.group(1) if ip_m else "—",
+        "date"     : DC["date"].select_one(head).get_text(strip=True),
+    }
+
+
+def dc_comment_count(doc: Doc) -> int:
+    tag = DC["cmt_count"].select_one(_soup(doc))
+    match = _DIGITS_RE.search(tag.get_text()) if tag else None
+    if not match:
+        raise ValueError("댓글 수 추출 실패")
+    return int(match.group())
+
+
+def dc_comment_row(c: Dict) -> Optional[Dict]:
+    """댓글 AJAX row 1개 → 댓글 dict. 댓글돌이/삭제/빈 댓글(디시콘만 있는 것 등)은 Selenium 경로처럼 None."""
+    if c.get("nicktype") == "COMMENT_BOY" or c.get("del_yn") == "Y":
+        return None   # 댓글돌이(광고 안내) / 삭제된 댓글
+    text = bs4.BeautifulSoup(c.get("memo") or "", "lxml").get_text(" ", strip=True)
+    if not text:
+        return None
+    return {
+        "author"   : (c.get("name") or "").strip(),
+        "author_ip": c.get("ip") or "—",
+        "date"     : (c.get("reg_date") or "").strip(),
+        "content"  : text,
+        **labels(),
+    }
+
+
+def parse_dc_post(doc: Doc, url: str) -> Dict:
+    """DC 글 본문 필드 (comments 제외)."""
+    soup = _soup(doc)
+    head = DC["head"].select_one(soup)
+    if head is None:
+        raise ValueError("div.gallview_head 없음")
+    nick = _text(DC["nick"].select_one(head)) or ""
+    ip_m = _IP_RE.search(nick)
+    ip_t = _text(DC["ip"].select_one(head))
+
+    return {
+        "title"     : _text(DC["title"].select_one(head)) or "",
+        "url"       : url,
+        "writer"    : nick.split("(")[0].strip(),
+        "writer_ip" : ip_m.group(1) if ip_m else (ip_t.strip("()") if ip_t else "—"),
+        "date"      : _text(DC["date"].select_one(head)) or "",
+        "content"   : _text(DC["body"].select_one(soup)) or "",
+        "likes"     : _count(soup, DC["likes"]),
+        "dislikes"  : _count(soup, DC["dislikes"]),
+    }
+
+
+def parse_dc_comments(doc: Doc) -> List[Dict]:
+    soup = _soup(doc)
+    items: List[Dict] = []
+    for li in DC["cmt_item"].select(soup):
+        text = _text(DC["cmt_text"].select_one(li))
+        if text is None:
+            text = _text(DC["cmt_dccon"].select_one(li))
+        raw = _text(DC["cmt_nick"].select_one(li))
+        date = _text(DC["cmt_date"].select_one(li))
+        if not text or raw is None or date is None:
+            continue
+        ip_m = _IP_RE.search(raw)
+        items.append({
+            "author"   : raw.split("(")[0].strip(),
+            "author_ip": ip_m.group(1) if ip_m else "—",
+            "date"     : date,
+            "content"  : text,
+            **labels(),
+        })
+    return items
+
+
+# ── FM Korea ────────────────────────────────────────────────
+FMKOREA = {
+    "head"        : sv.compile("div.rd_hd"),
+    "title"       : sv.compile("h1.np_18px span"),
+    "author"      : sv.compile("a.member_plate"),
+    "date"        : sv.compile("span.date"),
+    "content"     : sv.compile("article .xe_content"),
+    "likes"       : sv.compile("span.btn_img.new_voted_count"),
+    "dislikes"    : sv.compile("a.vote3"),
+    "cmt_item"    : sv.compile("ul.fdb_lst_ul li.fdb_itm"),
+    "cmt_author"  : sv.compile("div.meta a.member_plate"),
+    "cmt_date"    : sv.compile("div.meta span.date"),
+    "cmt_content" : sv.compile("div.comment-content .xe_content"),
+    "cmt_pages"   : sv.compile("div.bd_pg a, div.bd_pg strong"),
+    "list_item"   : sv.compile("li.li_best2_pop0"),
+    "list_link"   : sv.compile("a.pc_voted_count"),
+    "list_cmt"    : sv.compile("span.comment_count"),
+}
+
+
+def parse_fmkorea_list(doc: Doc, base: str = "https://www.fmkorea.com") -> List[Dict]:
+    """FM Korea 베스트 목록 → [{no, comment_count, url}]. 모양이 다른 줄은 건너뜀."""
+    posts: List[Dict] = []
+    for li in FMKOREA["list_item"].select(_soup(doc)):
+        link = FMKOREA["list_link"].select_one(li)
+        cnt = FMKOREA["list_cmt"].select_one(li)
+        digits = "".join(_DIGITS_RE.findall(cnt.get_text())) if cnt is not None else ""
+        if link is None or not link.get("href") or not digits:
+            continue
+        try:
+            no = int(link["href"].rsplit("/", 1)[-1])
+        except ValueError:
+            continue
+        posts.append({"no": no, "comment_count": int(digits), "url": urljoin(base, f"/best/{no}")})
+    return posts
+
+
+def fmkorea_comment_max_page(doc: Doc) -> int:
+    nums = [int(t) for t in (_text(a) for a in FMKOREA["cmt_pages"].select(_soup(doc))) if t and t.isdigit()]
+    return max(nums) if nums else 1
+
+
+def parse_fmkorea_post(doc: Doc, url: str) -> Dict:
+    """FM Korea 글 본문 필드 (comments 제외)."""
+    soup = _soup(doc)
+    head = FMKOREA["head"].select_one(soup)
+    if head is None:
+        raise ValueError("div.rd_hd 없음")
+    plate = _text(FMKOREA["author"].select_one(head)) or ""
+    ip_m = _IP_RE.search(plate)
+
+    return {
+        "title": _text(FMKOREA["title"].select_one(head)) or "",
+        "url": url,
+        "writer": plate.split("(")[0].strip(),
+        "writer_ip": ip_m.group(1) if ip_m else "—",
+        "date": _text(FMKOREA["date"].select_one(head)) or "",
+        "content": _text(FMKOREA["content"].select_one(soup)) or "",
+        "likes": _count(soup, FMKOREA["likes"]),
+        "dislikes": _count(soup, FMKOREA["dislikes"]),
+    }
+
+
+def parse_fmkorea_comments(doc: Doc) -> List[Dict]:
+    soup = _soup(doc)
+    items: List[Dict] = []
+    for li in FMKOREA["cmt_item"].select(soup):
+        author = _text(FMKOREA["cmt_author"].select_one(li))
+        date = _text(FMKOREA["cmt_date"].select_one(li))
+        content = _text(FMKOREA["cmt_content"].select_one(li))
+        if None in (author, date, content):
+            continue
+        items.append({
+            "author": author,
+            "author_ip": "—",
+            "date": date,
+            "content": content,
+            **labels(),
+        })
+    return items
+
+
+# ── 저장된 HTML 파싱 ─────────────────────────────────────────
+PARSERS: Dict[str, Dict[str, Callable]] = {
+    "ilbe"   : {"post": parse_ilbe_post, "comments": parse_ilbe_comments},
+    "dc"     : {"post": parse_dc_post, "comments": parse_dc_comments},
+    "fmkorea": {"post": parse_fmkorea_post, "comments": parse_fmkorea_comments},
+}
+
+
+def parse_saved(path: Union[str, Path], site: str, url: str = "") -> Dict:
+    """저장해 둔 글 HTML 한 장에서 본문 + (그 페이지에 보이는) 댓글을 파싱."""
+    html = Path(path).read_text(encoding="utf-8", errors="replace")
+    soup = _soup(html)
+    post = PARSERS[site]["post"](soup, url or Path(path).stem)
+    post["comments"] = PARSERS[site]["comments"](soup)
+    return post
+
+
+# ── 파싱 실행기 (같은 스레드 또는 프로세스 풀) ───────────────────
+def done(value) -> Future:
+    """이미 계산된 값을 Future 로 감싼다 (snapshot 이 아닌 추출 모드와 모양을 맞출 때)."""
+    fut: Future = Future()
+    fut.set_result(value)
+    return fut
+
+
+class SnapshotParser:
+    """
+    workers=0 이면 호출한 스레드에서 바로 파싱하고, 1 이상이면 별도 프로세스 풀에 넘긴다.
+    브라우저 스레드는 page_source 만 떠서 submit 하고 다음 페이지로 넘어갈 수 있다.
+    """
+
+    def __init__(self, workers: int = 0):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()   # 여러 워커 스레드가 submit / shutdown — 풀을 하나만 만들고 닫힌 풀에 넣지 않게
+
+    def submit(self, fn: Callable, *args) -> Future:
+        if self.workers <= 0:
+            try:
+                return done(fn(*args))
+            except Exception as e:
+                fut: Future = Future()
+                fut.set_exception(e)
+                return fut
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool.submit(fn, *args)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+# ── 저장된 HTML 을 바로 확인: python -m crawl_core.snapshot <site> <file.html> ──
+if __name__ == "__main__":
+    import json
+    import sys
+
+    site_, path_ = sys.argv[1], sys.argv[2]
+    print(json.dumps(parse_saved(path_, site_), ensure_ascii=False, indent=2))
@@ -0,0 +1,190 @@
+"""
+spam.py
+────────────────────────────────────────────────────────────
+URL/문구만 조금씩 바꾼 광고 도배 댓글을 MinHash + LSH 로 묶는 근사 중복 탐지 (세 크롤러 공통).
+dedup.py 의 body_id 는 글자 하나만 달라도 다른 값이라 "송파 가라오케 …" / "일산 가라오케 …" 같은 변형을 못 잡는다.
+• 정규화한 내용의 글자 SHINGLE-gram 으로 NUM_PERM 개짜리 MinHash 서명
+• 서명을 BANDS 개 구간으로 나눠 버킷에 넣고, 같은 버킷에 걸린 군집 대표와만 비교 (댓글 수가 늘어도 비교 횟수는 거의 일정)
+• 추정 Jaccard 가 THRESHOLD 이상이면 그 군집에 합류, 아니면 새 군집의 대표가 됨
+• 군집 크기는 서로 다른 댓글(dedup.comment_id) 수 — 같은 댓글을 다시 크롤링 / 갱신 / 재태깅해도 늘지 않음
+• spam=True 는 군집 크기가 MIN_CLUSTER 이상이고 그 댓글에 광고 신호(AD_RE: URL·도메인·전화번호·메신저 ID)가 있을 때만.
+  같은 혐오 문구를 여러 명이 복사한 것은 광고가 아니다. keywords.tag_comment 는 spam / spam_cluster 를 라벨 옆에 남길 뿐
+  키워드 라벨은 그대로 둔다
+• 메모리: 본 댓글마다 comment_id → 군집 번호 한 줄 + 군집마다 대표 서명. 어디에도 안 걸린 댓글도 제 군집의 대표가 되므로
+  사실상 (MIN_CHARS 이상인) 고유 댓글 수에 비례
+• 색인은 INDEX_PATH 에 저장해 두고 다음 실행에서 이어서 씀 (메인 프로세스가 끝날 때).
+  keyword_search.py 는 서명만 워커에서 계산하고 색인은 메인 프로세스 하나가 파일 순서대로 채운다
+"""
+import atexit
+import multiprocessing
+import os
+import pickle
+import random
+import re
+import threading
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from .dedup import comment_id, normalize_body
+
+NUM_PERM = 64
+BANDS = 16               # 16 구간 × 4 행 → Jaccard 0.5 근처부터 후보로 잡힘
+ROWS = NUM_PERM // BANDS
+SHINGLE = 4              # 글자 n-gram
+THRESHOLD = 0.6          # 대표와의 추정 Jaccard 가 이 이상이면 같은 군집
+MIN_CHARS = 20           # 이보다 짧은 댓글은 건너뜀 ("." 같은 건 dedup 의 정확 일치로 충분)
+MIN_CLUSTER = 3          # 서로 다른 댓글이 이만큼 모인 군집부터 스팸 후보
+INDEX_PATH = "spam_index.pkl"
+RULES = 2                # 판정 규칙 판 — 바꾸면 keywords.SIGNATURE 가 달라져 keyword_search 가 전부 다시 판정
+
+# 광고 신호: URL / 도메인 / 전화번호 / 메신저 연락처
+AD_RE = re.compile(
+    r"https?://|www\.|[a-z0-9-]+\.(?:com|net|org|kr|co|me|io|xyz|site|shop|top|info|biz)\b"
+    r"|0\d{1,2}[-. ]?\d{3,4}[-. ]?\d{4}"
+    r"|카톡|카카오톡|텔레그램|텔레|오픈채팅|오픈톡|라인\s*아이디|kakao|telegram",
+    re.IGNORECASE)
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+_rng = random.Random(20240601)   # 실행마다 같은 순열이어야 저장한 색인을 다시 쓸 수 있음
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+Signature = Tuple[int, ...]
+
+
+def signature(text: str) -> Optional[Signature]:
+    """MinHash 서명. 정규화 후 MIN_CHARS 보다 짧으면 None."""
+    norm = normalize_body(text)
+    if len(norm) < MIN_CHARS:
+        return None
+    shingles = {zlib.crc32(norm[i:i + SHINGLE].encode("utf-8")) & _MASK
+                for i in range(len(norm) - SHINGLE + 1)}
+    return tuple(min((a * x + b) % _PRIME for x in shingles) for a, b in _PERMS)
+
+
+def has_ad(text: str) -> bool:
+    return bool(AD_RE.search(normalize_body(text)))
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+def _bands(sig: Signature) -> List[Tuple[int, Tuple[int, ...]]]:
+    return [(i, sig[i * ROWS:(i + 1) * ROWS]) for i in range(BANDS)]
+
+
+class NearDupIndex:
+    """LSH 버킷 → 군집 번호. 군집마다 대표 서명과 크기(서로 다른 댓글 수), 댓글마다 속한 군집."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], str] = {}
+        self.reps: Dict[str, Signature] = {}
+        self.sizes: Counter = Counter()
+        self.samples: Dict[str, str] = {}
+        self.members: Dict[str, str] = {}   # comment_id → 군집 번호 (다시 본 댓글은 크기에 안 더함)
+        self.flagged: Set[str] = set()      # 이번 실행에서 스팸으로 표시한 댓글
+        self.checked = 0
+
+    def add(self, text: str, key: str) -> Tuple[Optional[str], bool]:
+        """(군집 번호 — 짧으면 None, 스팸 여부). key 는 댓글 하나를 가리키는 값 (dedup.comment_id)."""
+        with self.lock:
+            cid = self.members.get(key)
+        if cid is None:
+            sig = signature(text)
+            if sig is None:
+                return None, False
+            cid = self.add_signature(sig, key, text)
+        spam = self.is_spam(cid, has_ad(text), key)
+        return cid, spam
+
+    def add_signature(self, sig: Signature, key: str, sample: str = "") -> str:
+        """
+        서명을 미리 계산해 둔 댓글 넣기 (keyword_search 의 워커가 계산). 군집 번호를 돌려준다.
+        새 군집이면 이 댓글의 key 가 군집 번호, sample 은 summary 에 보일 내용.
+        """
+        bands = _bands(sig)
+        with self.lock:
+            if key in self.members:
+                return self.members[key]
+            self.checked += 1
+            best, best_sim = None, THRESHOLD
+            for cid in {self.buckets[b] for b in bands if b in self.buckets}:
+                sim = similarity(sig, self.reps[cid])
+                if sim >= best_sim:
+                    best, best_sim = cid, sim
+            if best is None:
+                best = key
+                self.reps[best] = sig
+                self.samples[best] = (sample or "")[:30].replace("\n", " ")
+                for b in bands:
+                    self.buckets.setdefault(b, best)
+            self.members[key] = best
+            self.sizes[best] += 1
+            return best
+
+    def is_spam(self, cid: Optional[str], ad: bool, key: str) -> bool:
+        """군집이 MIN_CLUSTER 개 이상의 서로 다른 댓글이고, 이 댓글(key)에 광고 신호가 있으면."""
+        with self.lock:
+            spam = bool(ad and cid is not None and self.sizes[cid] >= MIN_CLUSTER)
+            if spam:
+                self.flagged.add(key)
+            return spam
+
+    def summary(self, top: int = 5) -> str:
+        with self.lock:
+            clusters = [(cid, n) for cid, n in self.sizes.most_common(top) if n >= MIN_CLUSTER]
+            lines = [f"[spam] 근사 중복 — 검사 {self.checked}개 (댓글 {len(self.members)}개 기억), "
+                     f"군집 {len(self.reps)}개, 스팸 표시 {len(self.flagged)}개"]
+            lines += [f"  {n}회: {self.samples.get(cid, cid)!r}" for cid, n in clusters]
+        return "\n".join(lines)
+
+
+# ── 프로세스 안에서 색인 하나 ─────────────────────────────────
+_INDEX: Optional[NearDupIndex] = None
+_LOCK = threading.Lock()
+
+
+def index() -> NearDupIndex:
+    """처음 부를 때 INDEX_PATH 가 있으면 읽어서 이어 쓴다."""
+    global _INDEX
+    with _LOCK:
+        if _INDEX is None:
+            _INDEX = NearDupIndex()
+            if INDEX_PATH and os.path.exists(INDEX_PATH):
+                with open(INDEX_PATH, "rb") as f:
+                    state = pickle.load(f)
+                if len(state) == 5:
+                    _INDEX.buckets, _INDEX.reps, _INDEX.sizes, _INDEX.samples, _INDEX.members = state
+                else:   # 예전 색인은 다시 본 댓글까지 센 크기라 버리고 새로
+                    print(f"[spam] {INDEX_PATH}: 예전 형식 색인 → 새로 만듦")
+        return _INDEX
+
+
+def comment_key(comment: Dict) -> str:
+    return comment.get("comment_id") or comment_id(comment)
+
+
+def mark(comment: Dict) -> bool:
+    """댓글에 spam_cluster / spam 을 채우고 스팸 여부를 돌려준다. 이미 판정된 댓글은 다시 보지 않는다."""
+    if "spam_cluster" not in comment:
+        comment["spam_cluster"], comment["spam"] = index().add(comment.get("content", ""), comment_key(comment))
+    return bool(comment.get("spam"))
+
+
+def summary() -> str:
+    return index().summary()
+
+
+@atexit.register
+def save() -> None:
+    """메인 프로세스에서만 저장 (워커 프로세스는 색인을 만들지 않는다)."""
+    if _INDEX is None or not INDEX_PATH or multiprocessing.current_process().name != "MainProcess":
+        return
+    with _INDEX.lock:
+        state = (_INDEX.buckets, _INDEX.reps, _INDEX.sizes, _INDEX.samples, _INDEX.members)
+        with open(INDEX_PATH + ".tmp", "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(INDEX_PATH + ".tmp", INDEX_PATH)
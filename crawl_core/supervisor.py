@@ -0,0 +1,220 @@
+"""
+supervisor.py
+────────────────────────────────────────────────────────────
+WebDriver 하나를 맡아 오래 돌려도 메모리가 불어나거나 조용히 멈추지 않게 관리하는 감독자.
+• 처음 쓸 때 띄움 (import 만으로 Chrome 을 띄우지 않음)
+• MAX_PAGES 페이지마다, 또는 chromedriver+Chrome RSS 합이 MAX_RSS_MB 를 넘으면 새로 띄움 (psutil 있을 때만)
+• 감시 스레드: 작업 중인데 HANG_TIMEOUT 초 동안 WebDriver 명령이 하나도 안 끝나면 chromedriver 를 죽임
+• 세션이 죽었거나 멈춘 작업은 새 브라우저로 RETRIES 번까지 다시 처리 (처리 중이던 글을 다시 큐에 넣는 것과 같음)
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Optional
+
+from . import bulk_dom, events
+
+try:
+    import psutil
+except ImportError:   # 없으면 RSS 기준 교체만 건너뜀
+    psutil = None
+
+MAX_PAGES = 300           # 이만큼 처리하면 새 브라우저
+MAX_RSS_MB = 2000         # chromedriver + Chrome 프로세스 RSS 합 상한
+RSS_CHECK_EVERY = 10      # RSS 는 이 페이지 수마다 확인
+HANG_TIMEOUT = 120        # 초. WebDriver 명령이 이만큼 진행이 없으면 멈춘 것으로 판단
+PAGE_LOAD_TIMEOUT = 60    # driver.get 한 번의 상한
+RETRIES = 2               # 브라우저 문제로 실패한 작업을 다시 처리하는 횟수
+
+# 이 문구가 들어간 예외는 브라우저/세션 자체의 문제 → 새로 띄우고 다시 처리
+LOST_MARKERS = (
+    "invalid session id", "no such window", "chrome not reachable", "session deleted",
+    "disconnected", "target window already closed", "connection refused",
+    "max retries exceeded", "connection aborted", "remote end closed",
+)
+
+
+class DriverLost(Exception):
+    """브라우저가 죽었거나 멈춰서 버렸음. 처리 중이던 작업은 새 브라우저로 다시."""
+
+
+def is_driver_error(e: BaseException) -> bool:
+    if isinstance(e, DriverLost):
+        return True
+    msg = str(e).lower()
+    return any(m in msg for m in LOST_MARKERS)
+
+
+class DriverSupervisor:
+    def __init__(self, make_driver: Callable[[], Any], site: str, wait_timeout: int = 10,
+                 max_pages: int = MAX_PAGES, max_rss_mb: float = MAX_RSS_MB,
+                 hang_timeout: float = HANG_TIMEOUT):
+        self.make_driver = make_driver
+        self.site = site
+        self.wait_timeout = wait_timeout
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.hang_timeout = hang_timeout
+        self.lock = threading.RLock()
+        self.events: Counter = Counter()    # created / recycle:<이유> / hang
+        self._drv = None
+        self._wait = None
+        self._pages = 0
+        self._busy = False
+        self._hung = False
+        self._closed = False
+        self._watcher: Optional[threading.Thread] = None
+
+    # ── 브라우저 ─────────────────────────────────────
+    @property
+    def driver(self):
+        with self.lock:
+            if self._drv is None:
+                self._start()
+            return self._drv
+
+    @property
+    def wait(self):
+        with self.lock:
+            if self._drv is None:
+                self._start()
+            return self._wait
+
+    def _start(self) -> None:
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        drv = bulk_dom.instrument(self.make_driver())
+        try:
+            drv.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        except Exception:
+            pass
+        self._drv, self._wait = drv, WebDriverWait(drv, self.wait_timeout)
+        self._pages = 0
+        self._hung = False
+        self.events["created"] += 1
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name=f"{self.site}-watchdog", daemon=True)
+            self._watcher.start()
+
+    def recycle(self, reason: str) -> None:
+        """지금 브라우저를 닫는다. 다음에 driver 를 쓸 때 새로 뜬다."""
+        with self.lock:
+            drv, self._drv, self._wait = self._drv, None, None
+        if drv is None:
+            return
+        self.events[f"recycle:{reason}"] += 1
+        print(f"[{self.site}] 브라우저 교체 ({reason})")
+        try:
+            drv.quit()
+        except Exception:
+            _kill(drv)
+
+    def quit(self) -> None:
+        self._closed = True
+        with self.lock:
+            drv, self._drv, self._wait = self._drv, None, None
+        if drv is not None:
+            try:
+                drv.quit()
+            except Exception:
+                _kill(drv)
+
+    # ── 상태 확인 ─────────────────────────────────────
+    def rss_mb(self) -> Optional[float]:
+        """chromedriver 와 그 자식(Chrome) 프로세스 RSS 합 (MB). psutil 이 없거나 알 수 없으면 None."""
+        drv = self._drv
+        proc = getattr(getattr(drv, "service", None), "process", None)
+        if psutil is None or proc is None:
+            return None
+        try:
+            root = psutil.Process(proc.pid)
+            return sum(p.memory_info().rss for p in [root, *root.children(recursive=True)]) / 2**20
+        except psutil.Error:
+            return None
+
+    def tick(self, pages: int = 1) -> None:
+        """페이지를 처리할 때마다 호출. 상한을 넘으면 교체."""
+        with self.lock:
+            if self._drv is None:
+                return
+            self._pages += pages
+            n = self._pages
+        if n >= self.max_pages:
+            self.recycle(f"{n}페이지")
+        elif n % RSS_CHECK_EVERY == 0:
+            rss = self.rss_mb()
+            if rss is not None and rss > self.max_rss_mb:
+                self.recycle(f"RSS {rss:.0f}MB")
+
+    def _watch(self) -> None:
+        last_rt, last_change = None, time.monotonic()
+        while not self._closed:
+            time.sleep(max(1.0, self.hang_timeout / 4))
+            with self.lock:
+                drv, busy = self._drv, self._busy
+            now = time.monotonic()
+            if drv is None or not busy:
+                last_rt, last_change = None, now
+                continue
+            rt = bulk_dom.mark(drv)
+            if rt != last_rt:
+                last_rt, last_change = rt, now
+            elif now - last_change > self.hang_timeout:
+                logging.error(f"[{self.site}] WebDriver {self.hang_timeout}s 동안 응답 없음 → 강제 종료",
+                              extra=events.ctx(stage="watchdog"))
+                self._hung = True
+                self.events["hang"] += 1
+                _kill(drv)
+                last_rt, last_change = None, now
+
+    # ── 작업 실행 ─────────────────────────────────────
+    def run(self, handle: Callable[[Any, Any, Any], None], job: Any,
+            browser: bool = True, retries: int = RETRIES) -> bool:
+        """
+        handle(job, driver, wait) 실행. browser=False 면 (job, None, None) 으로 부르고
+        handle 이 필요할 때만 이 감독자의 driver 를 쓰게 둔다 (HTTP 우선 경로).
+        브라우저 문제(세션 끊김/멈춤)면 새로 띄워 retries 번까지 다시 처리. 성공 여부를 돌려준다.
+        """
+        for attempt in range(retries + 1):
+            with self.lock:
+                self._busy, self._hung = browser, False   # HTTP 경로는 명령이 없으니 멈춤 감시 안 함
+            try:
+                if browser:
+                    handle(job, self.driver, self.wait)
+                else:
+                    handle(job, None, None)
+                if self._hung:
+                    raise DriverLost("응답 없음")
+                self.tick()
+                return True
+            except Exception as e:
+                if not (self._hung or is_driver_error(e)):
+                    raise
+                self.recycle("hang" if self._hung else "lost")
+                if attempt < retries:
+                    print(f"[{self.site}] {job} 브라우저 문제({(str(e).splitlines() or [''])[0][:80]}) "
+                          f"→ 새 브라우저로 다시 ({attempt + 1}/{retries})")
+            finally:
+                with self.lock:
+                    self._busy = False
+        logging.error(f"[{self.site}] {job} 브라우저 문제로 {retries}번 재시도 후 포기", extra=events.ctx(job, "driver"))
+        return False
+
+    def summary(self) -> str:
+        ev = ", ".join(f"{k} {v}" for k, v in sorted(self.events.items())) or "없음"
+        return f"[{self.site}] 브라우저 관리: {ev}"
+
+
+def _kill(drv) -> None:
+    """chromedriver 와 자식 Chrome 을 강제로 종료 (quit 이 안 먹을 때)."""
+    proc = getattr(getattr(drv, "service", None), "process", None)
+    if proc is None:
+        return
+    try:
+        if psutil is not None:
+            for child in psutil.Process(proc.pid).children(recursive=True):
+                child.kill()
+        proc.kill()
+    except Exception:
+        pass
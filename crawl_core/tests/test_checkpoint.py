@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from crawl_core import checkpoint, pool, shards
+
+
+def metas(*ids):
+    return [{"id": i, "comments": 10 * i} for i in ids]
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)   # corpus.sqlite3 가 없는 곳에서 (result_ids 가 corpus 를 읽지 않게)
+    monkeypatch.setattr(shards, "_STORES", {})
+    yield str(tmp_path / "state.sqlite3")
+    shards.close_all()
+
+
+def test_add_posts_keeps_done_and_skipped(db):
+    cp = checkpoint.Checkpoint("cp_site", path=db)
+    cp.add_posts(1, metas(1, 2, 3, 4), "id")
+    cp.mark_post(1, checkpoint.DONE)
+    cp.mark_post(2, checkpoint.SKIPPED, "삭제됨")
+    cp.mark_post(3, checkpoint.FAILED, "타임아웃")
+
+    cp.add_posts(1, metas(1, 2, 3, 4), "id")   # 같은 목록을 다시 읽어도
+    assert cp.counts()["posts"] == {"done": 1, "skipped": 1, "pending": 2}
+    assert cp.is_finished(1) and cp.is_finished("2") and not cp.is_finished(3)
+    cp.close()
+
+
+def test_unfinished_posts_in_list_order(db):
+    cp = checkpoint.Checkpoint("cp_site", path=db)
+    cp.add_posts(1, metas(30, 10, 20, 40), "id")
+    cp.mark_post(10, checkpoint.FAILED)      # 상태가 섞여도 목록 순서 그대로
+    cp.mark_post(40, checkpoint.DONE)
+    cp.add_posts(2, metas(50), "id")
+    assert [m["id"] for m in cp.unfinished_posts(1)] == [30, 10, 20]
+    assert cp.unfinished_posts(2) == metas(50)
+    cp.close()
+
+
+def test_resume_after_partial_run(db):
+    cp = checkpoint.Checkpoint("cp_site", path=db)
+    cp.add_posts(3, metas(7), "id", checkpoint.SKIPPED, "평균 미만")
+    cp.add_posts(3, metas(5, 6, 8), "id")
+    cp.mark_page(3, checkpoint.DONE)
+    cp.mark_page(2, checkpoint.FAILED)
+    cp.mark_post(5, checkpoint.DONE)
+    cp.close()                               # 여기서 끊김
+
+    again = checkpoint.Checkpoint("cp_site", path=db)
+    assert again.page_status(3) == checkpoint.DONE and again.page_status(2) == checkpoint.FAILED
+    assert again.page_status(1) is None
+    assert again.finished_ids == {"5", "7"}
+    assert [m["id"] for m in again.unfinished_posts(3)] == [6, 8]
+    assert checkpoint.Checkpoint("other_site", path=db).unfinished_posts(3) == []
+    again.close()
+
+
+def test_sync_results_registers_saved_posts(db, tmp_path):
+    out = tmp_path / "cp_result"
+    out.mkdir()
+    for i in (1, 2):
+        (out / f"{i}.json").write_text(json.dumps({"meta": {"id": i}}), encoding="utf-8")
+    shards.open_store(str(out)).put(9, {"meta": {"id": 9}})
+
+    cp = checkpoint.Checkpoint("cp_site", path=db)
+    cp.add_posts(1, metas(1, 3), "id")
+    assert cp.sync_results(str(out)) == 3
+    assert cp.finished_ids == pool.result_ids(str(out)) == {"1", "2", "9"}
+    assert [m["id"] for m in cp.unfinished_posts(1)] == [3]
+    assert cp.sync_results(str(out)) == 0     # 두 번째는 새로 등록할 것이 없음
+    cp.close()
+
+    assert checkpoint.Checkpoint("cp_site", str(out), path=db).is_finished(9)
@@ -0,0 +1,90 @@
+import pytest
+
+from crawl_core import corpus, pool, shards
+
+
+@pytest.fixture
+def db(tmp_path):
+    c = corpus.Corpus(str(tmp_path / "corpus.sqlite3"))
+    yield c
+    c.close()
+
+
+def record(no, comments):
+    return {"meta": {"no": no}, "post": {"title": f"글 {no}", "content": "본문", "comments": comments}}
+
+
+def test_on_commit_waits_for_batch(db, monkeypatch):
+    monkeypatch.setattr(corpus, "BATCH_POSTS", 3)
+    monkeypatch.setattr(corpus, "BATCH_SECS", 3600)
+    done = []
+    for no in (1, 2):
+        db.put("dc", no, record(no, []), on_commit=lambda no=no: done.append(no))
+    assert done == []                       # 아직 배치에만 있음 → 체크포인트 done 아님
+    db.put("dc", 3, record(3, []), on_commit=lambda: done.append(3))
+    assert sorted(done) == [1, 2, 3]
+
+
+def test_save_result_marks_after_every_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(pool, "OUTPUT", "jsonl,sqlite")
+    monkeypatch.setattr(pool, "DEDUP", False)
+    monkeypatch.setattr(shards, "_STORES", {})
+    monkeypatch.setattr(shards, "FSYNC_EVERY", 1000)
+    monkeypatch.setattr(shards, "FSYNC_SECS", 3600)
+    monkeypatch.setattr(corpus, "BATCH_POSTS", 1000)
+    monkeypatch.setattr(corpus, "BATCH_SECS", 3600)
+    monkeypatch.setattr(corpus, "CORPUS_DB", str(tmp_path / "c.sqlite3"))
+    monkeypatch.setattr(corpus, "_CORPUS", corpus.Corpus(str(tmp_path / "c.sqlite3")))
+    out = str(tmp_path / "result")
+    done = []
+    pool.save_result(out, 7, record(7, []), on_saved=lambda: done.append(7))
+    assert done == []
+    corpus.open_corpus().flush()
+    assert done == []                       # 샤드는 아직 fsync 전
+    pool.flush_outputs(out)
+    assert done == [7]
+    corpus.close_corpus()
+    shards.close_all()
+
+
+def comment(content, author="ㅇㅇ", **extra):
+    return {"author": author, "author_ip": "1.2", "date": "2024.05.01 12:00:00", "content": content,
+            "likes": 1, "dislikes": 0, "llm_hate_speech": None, "llm_misogyny": None,
+            "Keyword": False, "keyword_content": [], **extra}
+
+
+def test_readback_keeps_exact_text_of_normalized_duplicates(db):
+    variants = ["Hello  World", "hello world", "ＨＥＬＬＯ world ", "hello world"]
+    rec = record(1, [comment(t, author=str(i)) for i, t in enumerate(variants)])
+    for c in rec["post"]["comments"]:
+        c["body_id"] = corpus.dedup.body_id(c["content"])
+        c["comment_id"] = corpus.dedup.comment_id(c)
+    db.put("dc", 1, rec)
+    back = db.get("dc", 1)
+    assert [c["content"] for c in back["post"]["comments"]] == variants
+    assert back["post"]["comments"] == rec["post"]["comments"]
+    # 저장은 원문별로 한 번, 묶음(body_id)은 정규화 기준 하나
+    rows = db.db.execute("SELECT COUNT(*), COUNT(DISTINCT body_id), SUM(n_refs) FROM bodies").fetchone()
+    assert tuple(rows) == (3, 1, 4)
+    assert db.stats()["dc"]["unique_bodies"] == 1
+
+
+def test_readback_across_posts_and_resave(db):
+    db.put("dc", 1, record(1, [comment("같은 댓글"), comment("같은  댓글")]))
+    db.put("ilbe", 9, record(9, [comment("같은 댓글", keyword_spans=[], spam=False)]))
+    db.put("dc", 1, record(1, [comment("바뀐 댓글")]))   # 다시 저장하면 마지막 것만
+    assert [c["content"] for c in db.get("dc", 1)["post"]["comments"]] == ["바뀐 댓글"]
+    ilbe = db.get("ilbe", 9)["post"]["comments"][0]
+    assert ilbe["content"] == "같은 댓글" and ilbe["keyword_spans"] == [] and ilbe["spam"] is False
+    assert [r["post_id"] for r in db.search("같은 댓글")] == ["9"]
+
+
+def test_old_schema_is_rejected(tmp_path):
+    import sqlite3
+    path = str(tmp_path / "old.sqlite3")
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE bodies (id INTEGER PRIMARY KEY, body_id TEXT UNIQUE, content TEXT)")
+    con.commit()
+    con.close()
+    with pytest.raises(RuntimeError):
+        corpus.Corpus(path)
@@ -0,0 +1,78 @@
+import json
+import logging
+import os
+
+import pytest
+
+from crawl_core import events
+
+
+@pytest.fixture
+def log(tmp_path):
+    def make(**kw):
+        handler = events.EventHandler("ev_site", str(tmp_path / "ev_events.jsonl"), **kw)
+        logger = logging.getLogger(f"test_events.{tmp_path.name}")
+        logger.propagate = False
+        logger.addHandler(handler)
+        made.append((logger, handler))
+        return logger, handler
+
+    made = []
+    yield make
+    for logger, handler in made:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+def lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def fail(logger, post_id):
+    try:
+        int(f"x{post_id}")
+    except ValueError:
+        logger.exception(f"글 {post_id} 파싱 실패", extra=events.ctx(post_id, "parse"))
+
+
+def test_repeats_collapse_into_summary_lines(log, monkeypatch):
+    monkeypatch.setattr(events, "REPEAT_EVERY", 3)
+    logger, handler = log()
+    for pid in range(1, 9):
+        fail(logger, pid)
+    logger.warning("목록 페이지 3 비어 있음", extra=events.ctx(stage="list"))
+    handler.close()
+
+    out = lines(handler.baseFilename)
+    assert [e.get("event") for e in out] == [None, "repeat", "repeat", None, "repeat"]
+    first, *_ = out
+    assert first["post_id"] == 1 and first["error"] == "ValueError" and "Traceback" in first["traceback"]
+    assert [(e["count"], e["total"], e["post_ids"]) for e in out if e.get("event")] == [
+        (3, 4, [2, 3, 4]), (3, 7, [5, 6, 7]), (1, 8, [8])]   # 마지막 1건은 close 때
+    assert all("traceback" not in e for e in out[1:])
+    assert len({e["fingerprint"] for e in out[:3]}) == 1 and out[3]["stage"] == "list"
+
+
+def test_messages_differing_only_in_numbers_share_fingerprint(log, monkeypatch):
+    monkeypatch.setattr(events, "SAMPLE_IDS", 2)
+    logger, handler = log()
+    for pid in (10, 11, 12, 13):
+        logger.warning(f"글 {pid} 댓글 수 {pid * 3} 미달", extra=events.ctx({"no": pid}, "check"))
+    assert list(handler.counts().values()) == [4]
+    handler.flush_repeats()
+    repeat = lines(handler.baseFilename)[-1]
+    assert repeat["count"] == 3 and repeat["post_ids"] == [12, 13]   # 최근 SAMPLE_IDS 개만
+
+
+def test_file_rotates_within_backups(log):
+    logger, handler = log(max_bytes=2000, backups=2)
+    for i in range(200):
+        logger.warning(f"사건 {chr(0xAC00 + i)}", extra=events.ctx(i, "rotate"))   # 모두 다른 fingerprint
+    handler.flush()
+    base = handler.baseFilename
+    assert os.path.exists(base + ".1") and os.path.exists(base + ".2") and not os.path.exists(base + ".3")
+    for path in (base, base + ".1", base + ".2"):
+        assert os.path.getsize(path) <= 2000
+        assert all(e["stage"] == "rotate" for e in lines(path))
+    assert lines(base)[-1]["msg"] == f"사건 {chr(0xAC00 + 199)}"
@@ -0,0 +1,70 @@
+import pytest
+
+from crawl_core import dedup, incremental, pool
+
+
+def comment(content, date="2024.05.01 12:00:00", author="ㅇㅇ"):
+    return {"author": author, "author_ip": "1.2", "date": date, "content": content}
+
+
+def numbered(*ns):
+    return [comment(f"댓글 {n}", date=f"2024.05.01 12:{n:02d}:00") for n in ns]
+
+
+def pages_of(*pages, pulled=None):
+    """최신 페이지부터 내놓는 generator. pulled 에 몇 페이지를 꺼내 갔는지 기록."""
+    for page in pages:
+        if pulled is not None:
+            pulled.append(len(pulled) + 1)
+        yield page
+
+
+@pytest.fixture
+def out(tmp_path, monkeypatch):
+    monkeypatch.setattr(pool, "OUTPUT", "json")
+    monkeypatch.setattr(pool, "DEDUP", True)
+    return str(tmp_path)   # 폴더 이름 = 사이트 이름이 테스트마다 달라 dedup 통계가 섞이지 않음
+
+
+def test_refresh_counts_only_new_comments_in_dedup_stats(out):
+    site = pool.site_of(out)
+    pool.save_result(out, 1, {"meta": {"id": 1}, "post": {"comments": [comment("."), comment("ㅋㅋ")]}})
+    assert dedup.stats(site)["comments"] == 2
+
+    for n in range(3):
+        pages = [[comment(".", date=f"2024.05.02 0{n}:00:00")]]
+        assert incremental.refresh(out, 1, lambda record, pages=pages: iter(pages)) == (1, 1)
+    s = dedup.stats(site)
+    assert s["comments"] == 5                          # 2 + 새 댓글 3 (예전 댓글을 다시 세지 않음)
+    assert dict((t, n) for t, n in s["top"])["."] == 4
+    saved = pool.load_result(out, 1)["post"]["comments"]
+    assert len(saved) == 5 and all(c["comment_id"] for c in saved)
+
+
+def test_collect_new_stops_at_first_known_page():
+    known = {incremental.comment_key(c) for c in numbered(1, 2, 3)}
+    pulled = []
+    # 새 댓글 4~7 이 두 페이지를 채우고, 세 번째 페이지에 예전 댓글 3 이 걸침 → 네 번째 페이지는 요청하지 않음
+    new, n = incremental.collect_new(
+        pages_of(numbered(6, 7), numbered(4, 5), numbered(3), numbered(1, 2), pulled=pulled), known)
+    assert [c["content"] for c in new] == [f"댓글 {i}" for i in (4, 5, 6, 7)]
+    assert n == 3 and pulled == [1, 2, 3]
+
+
+def test_collect_new_nothing_new_reads_one_page():
+    known = {incremental.comment_key(c) for c in numbered(1, 2)}
+    assert incremental.collect_new(pages_of(numbered(1, 2)), known) == ([], 1)
+    assert incremental.collect_new(pages_of(), known) == ([], 0)
+
+
+def test_refresh_twice_adds_no_duplicates(out):
+    pool.save_result(out, 7, {"meta": {"id": 7}, "post": {"comments": numbered(1, 2, 3)}})
+    seen = []
+    latest = lambda record: pages_of(numbered(4, 5), numbered(2, 3), numbered(1))
+
+    assert incremental.refresh(out, 7, latest, on_new=seen.append) == (2, 2)
+    assert incremental.refresh(out, 7, latest, on_new=seen.append) == (0, 1)
+    saved = pool.load_result(out, 7)["post"]["comments"]
+    assert [c["content"] for c in saved] == [f"댓글 {i}" for i in range(1, 6)]
+    assert [c["content"] for c in seen] == ["댓글 4", "댓글 5"]
+    assert incremental.refresh(out, 8, latest) is None   # 저장된 글이 없으면
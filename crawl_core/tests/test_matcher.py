@@ -0,0 +1,35 @@
+from crawl_core import keywords
+from crawl_core.matcher import KeywordMatcher
+
+
+def test_overlapping_and_nested_matches():
+    m = KeywordMatcher(["he", "she", "his", "hers"])
+    spans = sorted((s, e, m.keywords[i]) for s, e, i in m.spans("ushers"))
+    assert spans == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_suffix_keyword_found_via_fail_link():
+    m = KeywordMatcher(["김치녀", "치녀"])
+    found, spans = m.find("김치녀들")
+    assert found == ["김치녀", "치녀"]
+    assert {(s["keyword"], s["start"], s["end"]) for s in spans} == {("김치녀", 0, 3), ("치녀", 1, 3)}
+
+
+def test_repeated_hits_and_keyword_order():
+    m = KeywordMatcher(["맘충", "한녀", "맘충"])
+    found, spans = m.find("한녀 맘충 한녀")
+    assert found == ["맘충", "한녀"]   # 키워드 목록 순서, 중복 없음
+    assert [s["start"] for s in spans if s["keyword"] == "한녀"] == [0, 6]
+
+
+def test_no_match_and_empty():
+    m = KeywordMatcher(["갈보"])
+    assert m.find("") == ([], [])
+    assert m.find("아무 말") == ([], [])
+
+
+def test_tag_post_marks_body_and_comments(monkeypatch):
+    monkeypatch.setattr(keywords, "SPAM_FILTER", False)
+    post = {"content": "맘충 얘기", "comments": [{"content": "그냥 댓글"}, {"content": "캐런 등장"}]}
+    assert keywords.tag_post(post) == [(0, ["맘충"]), (2, ["캐런"])]
+    assert post["Keyword"] is True and post["comments"][0]["Keyword"] is False
@@ -0,0 +1,53 @@
+import pytest
+
+from crawl_core import keywords
+from crawl_core.normalize import NormalizedMatcher, normalize, normalize_text
+
+MATCHER = NormalizedMatcher(keywords.KEYWORDS)
+
+
+@pytest.mark.parametrize("text", [
+    "한 녀석이 왔다",      # 공백을 넘어 한녀
+    "갈 보러 가자",        # 갈보
+    "노괴물",              # 노괴 + 다른 음절
+    "사랑한 녀석",         # 앞 낱말의 끝 음절
+    "은혜지요",            # 혜지
+    "주말에 갈 보트",
+])
+def test_no_match_across_word_boundaries(text):
+    assert MATCHER.find(text) == ([], [])
+
+
+@pytest.mark.parametrize("text, keyword", [
+    ("한녀", "한녀"),
+    ("한 녀", "한녀"),
+    ("한.녀", "한녀"),
+    ("한*녀들이", "한녀"),
+    ("ㅎㅏㄴㄴㅕ", "한녀"),
+    ("하ㄴ녀", "한녀"),
+    ("한녀녀녀 ㅋㅋ", "한녀"),
+    ("ㅋㅋ한녀ㅋㅋ", "한녀"),
+    ("김치녀가 또", "김치녀"),
+    ("노괴들", "노괴"),
+    ("ＢＩＴＣＨhh", "bitch"),
+    ("아이낳는기계", "아이 낳는 기계"),
+    ("보력 지원", "보력지원"),
+    ("여자와 북어는 삼일에 한번씩 패야 맛이좋아진다", "여자와 북어는 삼일에 한 번씩 패야 맛이 좋아진다"),
+])
+def test_spacing_symbol_jamo_variants_match(text, keyword):
+    found, spans = MATCHER.find(text)
+    assert found == [keyword]
+    assert all(0 <= s["start"] < s["end"] <= len(text) for s in spans)
+
+
+def test_spans_point_at_original_text():
+    text = "진짜 한 . 녀 들"
+    (span,) = MATCHER.find(text)[1]
+    assert text[span["start"]:span["end"]] == "한 . 녀"
+
+
+def test_normalize_keeps_final_consonant_before_repeat():
+    assert normalize_text("ㅎㅏㄴㄴㅕ") == "한녀"
+    assert normalize_text("녀ㅋㅋㅋ") == "녀ㅋ"
+    norm, starts, ends = normalize("a  b")
+    assert norm == "ab" and (starts, ends) == ([0, 3], [1, 4])
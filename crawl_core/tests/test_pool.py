@@ -0,0 +1,28 @@
+import threading
+import time
+
+from crawl_core import pool
+
+
+def test_run_pool_producer_waits_for_workers(monkeypatch):
+    monkeypatch.setattr(pool, "QUEUE_PER_WORKER", 2)
+    lock = threading.Lock()
+    count = {"made": 0, "handled": 0, "ahead": 0}
+
+    def jobs():
+        for i in range(40):
+            with lock:
+                count["made"] += 1
+                count["ahead"] = max(count["ahead"], count["made"] - count["handled"])
+            yield i
+
+    def handle(job, drv, wt):
+        time.sleep(0.005)
+        with lock:
+            count["handled"] += 1
+
+    stats = pool.run_pool("dc", jobs(), handle, None, workers=2)
+    n = stats["workers"]
+    assert stats["done"] == 40 and count["handled"] == 40
+    # 큐(n × 2) + 워커가 들고 있는 작업(n) + producer 가 put 에서 기다리는 작업(1) 을 넘지 않음
+    assert count["ahead"] <= n * 2 + n + 1
@@ -0,0 +1,61 @@
+import pytest
+
+from crawl_core import ratelimit
+
+
+def limiter(rate=2.0, min_rate=0.3, max_rate=2.08, burst=1, target=1.0):
+    return ratelimit.HostLimiter("ratelimit.test", rate, min_rate, max_rate, burst, target)
+
+
+def test_aimd_backs_off_and_recovers():
+    lim = limiter()
+    lim.report(0.1)
+    lim.report(0.1)
+    lim.report(0.1)                          # 빠른 응답: ADD_STEP 씩 올리다가 max_rate 에서 멈춤
+    assert lim.rate == pytest.approx(2.08)
+    assert lim.counters["speedups"] == 2
+
+    lim.report(5.0, timeout=True)            # 타임아웃 / 에러: 절반으로
+    assert lim.rate == pytest.approx(1.04)
+    lim.report(0.1, ok=False)
+    assert lim.rate == pytest.approx(0.52)
+    lim.report(0.1, ok=False)                # min_rate 아래로는 안 내려감
+    assert lim.rate == pytest.approx(0.3)
+    lim.report(2.5)                          # 목표 지연의 2배 초과: SLOW_FACTOR (역시 min_rate 까지만)
+    assert lim.rate == pytest.approx(0.3)
+    lim.report(1.5)                          # 목표와 2배 사이: 그대로
+    assert lim.rate == pytest.approx(0.3)
+
+    for _ in range(40):
+        lim.report(0.1)
+    assert lim.rate == pytest.approx(2.08)    # 빠른 응답이 이어지면 다시 max_rate 까지
+    c = lim.counters
+    assert (c["ok"], c["errors"], c["timeouts"], c["slowdowns"]) == (45, 2, 1, 4)
+
+
+def test_bucket_waits_after_burst():
+    lim = limiter(rate=4.0, burst=1)
+    assert lim.try_acquire() == 0.0
+    assert lim.try_acquire() == pytest.approx(0.25, abs=0.05)   # 다음 토큰까지 1 / rate 초
+    assert lim.counters["requests"] == 1
+
+
+def test_track_reports_timeout():
+    lim = limiter()
+    with pytest.raises(TimeoutError):
+        with ratelimit.track(lim, "comment_page"):
+            raise TimeoutError("마지막 페이지")
+    assert lim.counters["timeouts"] == 1 and lim.rate == pytest.approx(1.0)
+
+
+def test_track_discard_skips_rate_adjustment():
+    lim = limiter()
+    with pytest.raises(TimeoutError):
+        with ratelimit.track(lim, "comment_page") as req:
+            req.discard()                    # DOM 대기 타임아웃은 서버 탓이 아님
+            raise TimeoutError("마지막 페이지")
+    with ratelimit.track(lim, "comment_page") as req:
+        req.discard()
+    c = lim.counters
+    assert lim.rate == 2.0 and c["timeouts"] == c["ok"] == c["slowdowns"] == c["speedups"] == 0
+    assert c["requests"] == 2                # 토큰은 썼다
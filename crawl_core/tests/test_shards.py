@@ -0,0 +1,60 @@
+import pytest
+
+from crawl_core import shards
+
+RECORD = {"meta": {"no": 1}, "post": {"title": "제목", "comments": [{"content": "댓글 ㅋㅋ"}]}}
+
+
+@pytest.fixture(autouse=True)
+def fresh_stores(monkeypatch):
+    monkeypatch.setattr(shards, "_STORES", {})
+    yield
+    shards.close_all()
+
+
+def round_trip(tmp_path, compress):
+    store = shards.open_store(str(tmp_path), compress=compress)
+    store.put(1, RECORD)
+    store.put(2, {**RECORD, "meta": {"no": 2}})
+    store.put(1, {**RECORD, "post": {**RECORD["post"], "title": "다시"}})   # 증분 갱신: 마지막 것
+    store.close()
+
+    reopened = shards.ShardStore(str(tmp_path), compress)
+    assert reopened.ids() == {"1", "2"}
+    assert reopened.get(1)["post"]["title"] == "다시"
+    assert reopened.get(2) == {**RECORD, "meta": {"no": 2}}
+    assert [pid for pid, _ in reopened.items()] == ["2", "1"]
+    reopened.close()
+
+
+def test_round_trip_plain(tmp_path):
+    round_trip(tmp_path, False)
+
+
+def test_round_trip_zstd(tmp_path):
+    pytest.importorskip("zstandard")
+    round_trip(tmp_path, True)
+    assert list(tmp_path.glob("part-*.jsonl.zst"))
+
+
+def test_tail_recovered_when_index_lost(tmp_path):
+    store = shards.open_store(str(tmp_path), compress=False)
+    store.put("a", RECORD)
+    store.close()
+    (tmp_path / shards.INDEX_FILE).write_text("", encoding="utf-8")
+    with open(tmp_path / "part-00000.jsonl", "ab") as f:
+        f.write(b'{"id":"b","post":')   # 반쯤 쓰인 꼬리
+    recovered = shards.ShardStore(str(tmp_path))
+    assert recovered.ids() == {"a"} and recovered.get("a") == RECORD
+    recovered.close()
+
+
+def test_compression_mismatch_raises(tmp_path):
+    shards.open_store(str(tmp_path), compress=False).put(1, RECORD)
+    assert shards.open_store(str(tmp_path)).compress is False
+    with pytest.raises(RuntimeError):
+        shards.open_store(str(tmp_path), compress=True)
+    shards.close_all()
+    shards._STORES.clear()
+    with pytest.raises(RuntimeError):   # 캐시가 없어도 폴더의 샤드 형식으로 판단
+        shards.open_store(str(tmp_path), compress=True)
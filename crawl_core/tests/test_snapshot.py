@@ -0,0 +1,38 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from crawl_core import snapshot
+
+
+class SlowPool:
+    made = 0
+
+    def __init__(self, max_workers):
+        time.sleep(0.01)   # 생성이 느리면 잠금 없이는 여러 스레드가 각자 풀을 만든다
+        SlowPool.made += 1
+        self.closed = False
+
+    def submit(self, fn, *args):
+        assert not self.closed
+        return snapshot.done(fn(*args))
+
+    def shutdown(self):
+        self.closed = True
+
+
+def test_submit_makes_one_pool_across_threads(monkeypatch):
+    monkeypatch.setattr(snapshot, "ProcessPoolExecutor", SlowPool)
+    SlowPool.made = 0
+    parser = snapshot.SnapshotParser(2)
+    futs = []
+    threads = [threading.Thread(target=lambda i=i: futs.append(parser.submit(abs, -i))) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert SlowPool.made == 1
+    assert sorted(f.result() for f in futs) == list(range(8))
+    parser.shutdown()
+    assert parser.submit(abs, -1).result() == 1 and SlowPool.made == 2   # 닫은 뒤에는 새 풀
+    parser.shutdown()
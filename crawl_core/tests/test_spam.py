@@ -0,0 +1,98 @@
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from crawl_core import keywords, spam
+
+AD = "강남 셔츠룸 오늘도 최고의 서비스 https://gangnam{}.clickn.co.kr 예약 문의 주세요"
+COPYPASTA = "여자와 북어는 삼일에 한 번씩 패야 맛이 좋아진다 라는 말 {}"
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(spam, "INDEX_PATH", None)
+    monkeypatch.setattr(spam, "_INDEX", None)
+
+
+def comment(content, author):
+    return {"author": author, "author_ip": "1.2", "date": "2024.05.01", "content": content}
+
+
+def test_resighting_same_comment_does_not_grow_cluster():
+    idx = spam.NearDupIndex()
+    c = comment(AD.format(1), "광고봇")
+    for _ in range(5):   # 다시 크롤링 / 갱신 / 재태깅
+        cid, is_spam = idx.add(c["content"], spam.comment_key(c))
+    assert idx.sizes[cid] == 1 and not is_spam
+
+
+def test_distinct_ad_comments_become_spam():
+    idx = spam.NearDupIndex()
+    verdicts = [idx.add(AD.format(i), spam.comment_key(comment(AD.format(i), f"봇{i}")))
+                for i in range(spam.MIN_CLUSTER)]
+    assert len({cid for cid, _ in verdicts}) == 1
+    assert [s for _, s in verdicts] == [False] * (spam.MIN_CLUSTER - 1) + [True]
+
+
+def test_copypasta_without_ad_signal_keeps_keyword_labels(monkeypatch):
+    monkeypatch.setattr(keywords, "SPAM_FILTER", True)
+    tagged = []
+    for i in range(5):
+        c = comment(COPYPASTA.format("ㅋ" * i), f"유저{i}")
+        keywords.tag_comment(c)
+        tagged.append(c)
+    assert len({c["spam_cluster"] for c in tagged}) == 1
+    assert not any(c["spam"] for c in tagged)
+    assert all(c["keyword_content"] == ["여자와 북어는 삼일에 한 번씩 패야 맛이 좋아진다"] for c in tagged)
+
+
+def test_spam_comment_still_tagged(monkeypatch):
+    monkeypatch.setattr(keywords, "SPAM_FILTER", True)
+    tagged = [comment(AD.format(i) + " 한녀 환영", f"봇{i}") for i in range(4)]
+    for c in tagged:
+        keywords.tag_comment(c)
+    assert tagged[-1]["spam"] is True
+    assert tagged[-1]["Keyword"] is True and tagged[-1]["keyword_content"] == ["한녀"]
+
+
+# ── keyword_search: 워커 수와 관계없이 같은 판정 ───────────────
+def load_keyword_search(monkeypatch):
+    """crawling/ 은 패키지가 아니라서 경로로 읽는다 (워커가 함수를 찾을 수 있게 sys.modules 에 등록)."""
+    path = Path(__file__).resolve().parents[2] / "crawling" / "keyword_search.py"
+    spec = importlib.util.spec_from_file_location("keyword_search", path)
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "keyword_search", module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_posts(folder: Path):
+    folder.mkdir()
+    for no in range(12):
+        comments = [comment(AD.format(no), f"봇{no}"), comment(COPYPASTA.format(no % 3), f"유저{no}"),
+                    comment(f"그냥 평범한 댓글 번호 {no} 입니다 반갑습니다", f"사람{no}")]
+        (folder / f"{no}.json").write_text(
+            json.dumps({"meta": {"no": no}, "post": {"content": "본문", "comments": comments}}, ensure_ascii=False),
+            encoding="utf-8-sig")
+
+
+def run(tmp_path, monkeypatch, name, workers):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(spam, "_INDEX", None)
+    folder = tmp_path / name
+    write_posts(folder)
+    load_keyword_search(monkeypatch).main(str(folder), workers=workers)
+    return {p.name: json.loads(p.read_text("utf-8-sig")) for p in sorted(folder.glob("*.json"))}
+
+
+def test_keyword_search_spam_is_independent_of_workers(tmp_path, monkeypatch):
+    one = run(tmp_path, monkeypatch, "one", 1)
+    many = run(tmp_path, monkeypatch, "many", 3)
+    assert one == many
+    comments = [c for data in one.values() for c in data["post"]["comments"]]
+    assert [c["spam"] for c in comments[0::3]] == [True] * 12          # 광고: 파일 순서와 무관하게 전부
+    assert not any(c["spam"] for c in comments[1::3])                   # 복붙 혐오 문구는 스팸 아님
+    assert all(c["Keyword"] for c in comments[1::3])
@@ -0,0 +1,118 @@
+"""
+waits.py
+────────────────────────────────────────────────────────────
+고정 time.sleep() 대신 DOM 조건으로 기다리는 대기 계층.
+• until(): WebDriverWait.until 을 감싸 실제로 기다린 시간을 사이트/종류별로 기록
+• comments_swapped(): 댓글 목록이 새 DOM 으로 바뀌고 현재 페이지 표시가 target 이 될 때까지
+• pace(): 사이트별 최소 간격(MIN_INTERVAL)만큼만 쉬기 — 이미 그만큼 지났으면 바로 진행
+  (워커 1개 기준 하한. 여러 워커를 합친 호스트 전체 속도는 ratelimit 이 조절)
+"""
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from . import metrics
+
+# ── 사이트별 최소 간격(초): 서버 예의상 지키는 하한 ──────────────
+MIN_INTERVAL: Dict[str, Dict[str, float]] = {
+    "ilbe"   : {"list": 1.0, "post": 1.0, "comment_page": 0.3},
+    "dc"     : {"list": 0.5, "post": 1.0, "comment_page": 0.3},
+    "fmkorea": {"list": 1.0, "post": 1.0, "comment_page": 0.5},
+}
+
+_lock = threading.Lock()
+_waited: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])   # "site/kind" → [횟수, 합, 최대] (며칠을 돌려도 크기 일정)
+_idle: Dict[str, float] = defaultdict(float)           # "site/kind" → pace() 로 쉰 시간 합
+_timeouts: Dict[str, int] = defaultdict(int)
+_last = threading.local()                               # 스레드(=워커)별 마지막 동작 시각
+
+
+def until(site: str, kind: str, drv, cond: Callable[[Any], Any],
+          timeout: float = 10, required: bool = True):
+    """
+    조건이 참이 될 때까지 대기하고 걸린 시간을 기록.
+    required=False 면 타임아웃이어도 예외 없이 None 을 돌려준다 (예전 sleep 처럼 그냥 진행).
+    """
+    key = f"{site}/{kind}"
+    t0 = time.monotonic()
+    try:
+        return WebDriverWait(drv, timeout).until(cond)
+    except TimeoutException:
+        with _lock:
+            _timeouts[key] += 1
+        if required:
+            raise
+        return None
+    finally:
+        spent = time.monotonic() - t0
+        with _lock:
+            w = _waited[key]
+            w[0] += 1
+            w[1] += spent
+            w[2] = max(w[2], spent)
+
+
+def is_stale(el) -> bool:
+    if el is None:
+        return True
+    try:
+        el.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+
+def first(drv, css: str):
+    """css 에 걸리는 첫 요소 (없으면 None). 페이지 전환 전에 잡아 두고 is_stale 로 교체 여부 확인."""
+    els = drv.find_elements(By.CSS_SELECTOR, css)
+    return els[0] if els else None
+
+
+def comments_swapped(old_item, marker_css: str, target: str) -> Callable[[Any], bool]:
+    """이전 댓글 요소가 DOM 에서 떨어져 나가고, 현재 페이지 표시(marker_css)가 target 일 때 참."""
+    def cond(drv) -> bool:
+        if not is_stale(old_item):
+            return False
+        markers = drv.find_elements(By.CSS_SELECTOR, marker_css)
+        return not markers or markers[0].text.strip() == target
+    return cond
+
+
+def pace(site: str, kind: str, interval: Optional[float] = None) -> float:
+    """
+    같은 스레드에서 직전 (site, kind) 동작 이후 최소 간격이 안 지났으면 남은 만큼만 쉰다.
+    실제로 쉰 시간을 돌려주고 기록한다.
+    """
+    gap = MIN_INTERVAL.get(site, {}).get(kind, 0.0) if interval is None else interval
+    stamps = getattr(_last, "stamps", None)
+    if stamps is None:
+        stamps = _last.stamps = {}
+    key = f"{site}/{kind}"
+    now = time.monotonic()
+    idle = max(0.0, stamps.get(key, 0.0) + gap - now)
+    if idle:
+        time.sleep(idle)
+    stamps[key] = time.monotonic()
+    with _lock:
+        _idle[key] += idle
+    if idle > 0:
+        metrics.observe(site, "sleep", idle)
+    return idle
+
+
+def summary(site: str) -> str:
+    """조건 대기 평균/최대, 타임아웃 수, pace 로 쉰 총 시간."""
+    lines = []
+    with _lock:
+        keys = sorted({k for k in list(_waited) + list(_idle) if k.startswith(f"{site}/")})
+        for key in keys:
+            n, total, longest = _waited.get(key, (0, 0.0, 0.0))
+            avg = total / n if n else 0.0
+            lines.append(f"  {key}: 대기 {n}회 평균 {avg:.2f}s 최대 {longest:.2f}s, "
+                         f"타임아웃 {_timeouts.get(key, 0)}회, 간격 유지 {_idle.get(key, 0.0):.1f}s")
+    return f"[{site}] 대기 통계\n" + ("\n".join(lines) if lines else "  기록 없음")
@@ -1,19 +1,19 @@
 import os
+import sys
 import json
+import time
+import hashlib
 import logging
-from typing import List, Dict
-
-# 1) 키워드 리스트 정의 (총 32개)
-KEYWORDS: List[str] = [
-    "bitch", "갈보", "계집신조", "김치녀", "남미새", "노괴", "된장녀",
-    "맘충", "보력지원", "보룡인", "보르노", "보르시", "보슬아치", "보전깨",
-    "상폐녀", "스탑러커", "아이 낳는 기계", "암퇘지", "양공주", "여왕벌",
-    "여자와 북어는 삼일에 한 번씩 패야 맛이 좋아진다", "옐로우 캡", "오또케",
-    "일베녀", "주식 갤러리", "캐런", "피싸개", "피타보라스의 정리",
-    "한녀", "혜지", "화냥년", "흉자"
-]
-
-# 2) 로깅 설정
+import multiprocessing
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 루트의 crawl_core 사용
+from crawl_core import keywords, spam
+from crawl_core.keywords import KEYWORDS, SIGNATURE, tag_post   # 크롤러의 인라인 태깅과 같은 목록/매처
+
+# 로깅 설정
 logging.basicConfig(
     filename="crawl_keywords.log",
     level=logging.INFO,
@@ -21,49 +21,173 @@ logging.basicConfig(
     encoding="utf-8"
 )
 
+CACHE_FILE = ".keyword_cache"   # 파일별 마지막 태깅 결과 해시 (+ 키워드 목록 지문). .json 이 아니라 결과 목록에 안 섞임
+KEYWORDS_SIG = SIGNATURE
+PROGRESS_EVERY = 500
+
+Verdicts = Dict[int, Tuple[Optional[str], bool]]   # 댓글 번호 → (spam_cluster, spam)
+
+def tag_record(data: Dict, fname: str = "", verdicts: Optional[Verdicts] = None) -> None:
+    """
+    키워드 태깅. verdicts 가 있으면 (메인 프로세스가 정한) 스팸 판정을 그대로 적고,
+    없으면 이 프로세스에서 spam.mark() 로 판정한다 (update_file 처럼 파일 하나만 볼 때).
+    """
+    post = data.get("post", {})
+    for idx, found in tag_post(post, mark_spam=verdicts is None):
+        if idx == 0:
+            logging.info(f"{fname} ▶ 본문에서 발견: {found}")
+        else:
+            logging.info(f"{fname} ▶ 댓글 #{idx} 에서 발견: {found}")
+    if verdicts is not None and keywords.SPAM_FILTER:
+        for idx, c in enumerate(post.get("comments", []), start=1):
+            c["spam_cluster"], c["spam"] = verdicts.get(idx, (None, False))
+
+def scan_file(job: Tuple[str, str]) -> Tuple[str, str, str, List[Tuple]]:
+    """
+    워커 프로세스용 1단계. (경로, 지난번 해시) → (파일명, 상태, 해시, 스팸 행)
+    스팸 행은 MinHash 서명을 계산한 댓글마다 (댓글 번호, comment_id, 서명, 광고 신호, 내용 앞부분)
+    — 색인에 넣는 건 메인 프로세스.
+    상태: "skip"(지난번 태깅 뒤로 안 바뀜) / "scan" / "err"
+    """
+    path, known = job
+    fname = os.path.basename(path)
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if digest == known:
+            return fname, "skip", digest, []
+        rows = []
+        if keywords.SPAM_FILTER:
+            comments = json.loads(raw.decode("utf-8-sig")).get("post", {}).get("comments", [])
+            for idx, c in enumerate(comments, start=1):
+                text = c.get("content") or ""
+                sig = spam.signature(text)
+                if sig is not None:
+                    rows.append((idx, spam.comment_key(c), sig, spam.has_ad(text), text[:30]))
+        return fname, "scan", digest, rows
+    except Exception as e:
+        logging.exception(f"{fname} 읽기 실패: {e}")
+        return fname, "err", "", []
+
 def update_file(filepath: str) -> None:
     fname = os.path.basename(filepath)
     with open(filepath, "r", encoding="utf-8-sig") as f:
         data = json.load(f)
 
-    post = data.get("post", {})
-    # 본문 검사
-    content = post.get("content", "")
-    found_in_post = [kw for kw in KEYWORDS if kw in content]
-    post["Keyword"] = bool(found_in_post)
-    post["keyword_content"] = found_in_post
-    if found_in_post:
-        logging.info(f"{fname} ▶ 본문에서 발견: {found_in_post}")
-
-    # 댓글 검사
-    for idx, comment in enumerate(post.get("comments", []), start=1):
-        ctext = comment.get("content", "")
-        found_in_comment = [kw for kw in KEYWORDS if kw in ctext]
-        comment["Keyword"] = bool(found_in_comment)
-        comment["keyword_content"] = found_in_comment
-        if found_in_comment:
-            logging.info(f"{fname} ▶ 댓글 #{idx} 에서 발견: {found_in_comment}")
+    tag_record(data, fname)
 
     # 파일 덮어쓰기
     with open(filepath, "w", encoding="utf-8-sig") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
-def main():
-    result_dir = "result"
+def tag_file(job: Tuple[str, Verdicts]) -> Tuple[str, str, str]:
+    """
+    워커 프로세스용 2단계. (경로, 스팸 판정) → (파일명, 상태, 새 해시)
+    상태: "same"(태그 결과가 그대로라 다시 쓰지 않음) / "ok" / "err"
+    """
+    path, verdicts = job
+    fname = os.path.basename(path)
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        data = json.loads(raw.decode("utf-8-sig"))
+        tag_record(data, fname, verdicts)
+        out = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8-sig")
+        if out == raw:
+            return fname, "same", digest
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(out)
+        os.replace(tmp, path)
+        return fname, "ok", hashlib.sha1(out).hexdigest()
+    except Exception as e:
+        logging.exception(f"{fname} 처리 실패: {e}")
+        return fname, "err", ""
+
+def load_cache(result_dir: str) -> Dict[str, str]:
+    """{파일명: 해시}. 키워드 목록/매칭 방식이 바뀌었으면 비어 있는 것으로 본다 (전부 다시 태깅)."""
+    path = os.path.join(result_dir, CACHE_FILE)
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("keywords") == KEYWORDS_SIG else {}
+
+def save_cache(result_dir: str, files: Dict[str, str]) -> None:
+    path = os.path.join(result_dir, CACHE_FILE)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump({"keywords": KEYWORDS_SIG, "files": files}, f)
+    os.replace(path + ".tmp", path)
+
+def main(result_dir: str = "result", workers: int = None, force: bool = False):
+    """
+    result_dir 의 JSON 을 워커 프로세스 여러 개로 나눠 태깅. 진행 상황은 두 단계 모두 PROGRESS_EVERY 개마다 출력.
+    지난번 태깅 뒤로 내용이 안 바뀐 파일은 읽기만 하고 건너뛴다 (force=True 면 전부 다시).
+    1단계: 워커가 파일마다 댓글 서명을 계산 → 메인 프로세스가 파일 이름 순서대로 스팸 색인 하나에 넣음
+           (워커 수 / 나뉜 방식과 관계없이 같은 결과. 색인은 spam.INDEX_PATH 에 저장돼 다음 실행으로 이어짐)
+    2단계: 바뀐 파일만 워커가 키워드 태깅 + 1단계 판정을 적어 다시 씀.
+    이미 태깅된(건너뛴) 파일의 스팸 판정은 그 뒤 군집이 커져도 다시 보지 않는다 (--force 면 전부).
+    """
     if not os.path.isdir(result_dir):
         print(f"폴더 없음: {result_dir}")
         return
 
-    for fn in sorted(os.listdir(result_dir)):
-        if not fn.lower().endswith(".json"):
-            continue
-        path = os.path.join(result_dir, fn)
-        try:
-            update_file(path)
-            print(f"[OK] {fn}")
-        except Exception as e:
-            logging.exception(f"{fn} 처리 실패: {e}")
-            print(f"[ERR] {fn}: {e}")
+    cache = {} if force else load_cache(result_dir)
+    names = sorted(e.name for e in os.scandir(result_dir)
+                   if e.is_file() and e.name.lower().endswith(".json"))
+    jobs = [(os.path.join(result_dir, fn), cache.get(fn, "")) for fn in names]
+    workers = max(1, workers or os.cpu_count() or 1)
+    print(f"파일 {len(jobs)}개, 워커 {workers}개 (키워드 {len(KEYWORDS)}개)")
+
+    counts = Counter()
+    t0 = time.monotonic()
+    with multiprocessing.Pool(workers) as mp_pool:
+        # 1단계: imap 은 jobs 순서대로 돌려주므로 색인에 넣는 순서가 항상 같다
+        index = spam.index()
+        found: Dict[str, List[Tuple[int, str, str, bool]]] = {}   # 파일 → [(댓글 번호, key, 군집, 광고)]
+        for i, (fn, status, digest, rows) in enumerate(
+                mp_pool.imap(scan_file, jobs, chunksize=16), start=1):
+            if status == "skip":
+                counts["skip"] += 1
+            elif status == "err":
+                counts["err"] += 1
+                print(f"[ERR] {fn}")
+            else:
+                found[fn] = [(idx, key, index.add_signature(sig, key, sample), ad)
+                             for idx, key, sig, ad, sample in rows]
+            if i % PROGRESS_EVERY == 0 or i == len(jobs):
+                rate = i / max(time.monotonic() - t0, 1e-9)
+                print(f"[1단계] {i}/{len(jobs)} — 다시 볼 파일 {len(found)}, "
+                      f"건너뜀 {counts['skip']}, 실패 {counts['err']} ({rate:.0f}개/초)")
+        print(f"[스팸] 서명 {sum(map(len, found.values()))}개 → 색인 "
+              f"({time.monotonic() - t0:.0f}초, 다시 볼 파일 {len(found)}개)")
+
+        # 2단계: 색인이 다 찬 뒤의 군집 크기로 판정 → 태깅과 함께 기록
+        t1 = time.monotonic()
+        tag_jobs = [(os.path.join(result_dir, fn),
+                     {idx: (cid, index.is_spam(cid, ad, key)) for idx, key, cid, ad in rows})
+                    for fn, rows in found.items()]
+        for i, (fn, status, digest) in enumerate(
+                mp_pool.imap_unordered(tag_file, tag_jobs, chunksize=16), start=1):
+            counts[status] += 1
+            if digest:
+                cache[fn] = digest
+            if status == "err":
+                print(f"[ERR] {fn}")
+            if i % PROGRESS_EVERY == 0 or i == len(tag_jobs):
+                rate = i / max(time.monotonic() - t1, 1e-9)
+                print(f"[진행] {i}/{len(tag_jobs)} — 태깅 {counts['ok']}, 변화 없음 {counts['same']}, "
+                      f"건너뜀 {counts['skip']}, 실패 {counts['err']} ({rate:.0f}개/초)")
+                save_cache(result_dir, cache)
+    save_cache(result_dir, cache)
+    print(spam.summary())
 
 if __name__ == "__main__":
-    main()
+    # python keyword_search.py [폴더=result] [워커 수] [--force]
+    args = [a for a in sys.argv[1:] if a != "--force"]
+    main(args[0] if args else "result",
+         int(args[1]) if len(args) > 1 else None,
+         force="--force" in sys.argv)